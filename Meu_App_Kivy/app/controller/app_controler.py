@@ -13,13 +13,54 @@ Funções principais:
 - Interagir com a camada de mensagens para gerar feedback apropriado.
 - Devolver os resultados à View para exibição ao usuário.
 
-Este controller exemplifica um fluxo de tratamento de nome, formatando-o,
-executando uma lógica associada e retornando mensagens personalizadas.
+A análise roda fora da thread da interface: os pedidos vão para um pool de
+threads e os resultados voltam, em lotes, por uma fila que a View esvazia
+periodicamente (``drenar``), sempre dentro de um orçamento de tempo por quadro.
+Cada pedido recebe uma geração; um pedido novo torna os anteriores obsoletos,
+que param no próximo lote e têm seus resultados descartados. Pedir de novo o
+caminho que já está em análise não refaz o trabalho.
+
+Além dos lotes, cada pedido acumula seus resultados num LoteResultados
+(colunar, poucos bytes por entrada), lido pela tela de resultados.
+
+O caminho do pedido atual fica sob observação (Oxumare) até o próximo pedido
+ou ``cancelar``: quando ele muda no disco, ``ao_mudar(caminho, resultado)`` é
+chamado na thread do observador. O resultado novo é gravado no cache
+compartilhado dos CaminhoSOModel, então a Model também passa a vê-lo.
+
+Este módulo não importa o Kivy: pode ser usado e testado sem interface.
 """
 
-from app.models.app_models import AppModel
-from app.utils.app_tools import formatar_nome
-from app.mensagens.app_mensageiro import Exu
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Mapping, NamedTuple, Optional
+
+from app.utils.app_compacto import LoteResultados, ResultadoCompacto
+from app.utils.app_varredura import Oxossi
+
+if TYPE_CHECKING:
+    from app.utils.app_observador import Oxumare
+
+
+class Atualizacao(NamedTuple):
+    """
+    Lote de resultados entregue à View.
+
+    Atributos:
+        geracao (int): Pedido ao qual o lote pertence
+        caminho (str): Caminho analisado no pedido
+        registros (tuple): EntradaVarredura lidas desde o lote anterior
+        concluida (bool): Se é o último lote do pedido
+        erro (BaseException | None): Falha que interrompeu a análise, se houver
+    """
+    geracao: int
+    caminho: str
+    registros: tuple[Mapping, ...]
+    concluida: bool = False
+    erro: Optional[BaseException] = None
 
 
 class AppController:
@@ -28,15 +69,217 @@ class AppController:
 
     Executa os fluxos principais do sistema a partir das entradas da View,
     coordenando interações com Modelos, Utilitários e Mensagens.
+
+    Args:
+        workers: Threads do pool de análise
+        tamanho_lote: Registros por lote enviado à View
+        intervalo_lote: Segundos máximos que um lote incompleto espera
+        profundidade_maxima: Profundidade da varredura de diretórios (None não limita)
+        capacidade_fila: Lotes aguardando a View antes de o worker esperar
+        limite_resultados: Entradas guardadas em ``resultados`` por pedido;
+            as excedentes são apenas contadas em ``descartados``
+        observar: Mantém o caminho do pedido atual sob observação
+
+    Atributos:
+        ao_mudar: Chamado com (caminho, resultado) quando o caminho observado
+            muda no disco, na thread do observador (a View deve repassar o
+            trabalho para a sua thread)
     """
 
-    def processar_nome(self, nome: str) -> dict:
-        nome_formatado = formatar_nome(nome)
-        mensagem = AppModel().executar_logica(nome_formatado)
-        mensagem_sucesso = Exu.mensagem_sucesso(nome_formatado)
+    def __init__(
+        self,
+        workers: int = 2,
+        tamanho_lote: int = 256,
+        intervalo_lote: float = 0.05,
+        profundidade_maxima: Optional[int] = None,
+        capacidade_fila: int = 64,
+        limite_resultados: int = 1_000_000,
+        observar: bool = True,
+    ) -> None:
+        self._workers = workers
+        self._tamanho_lote = tamanho_lote
+        self._intervalo_lote = intervalo_lote
+        self._profundidade_maxima = profundidade_maxima
+        self._fila: "queue.Queue[Atualizacao]" = queue.Queue(maxsize=capacidade_fila)
+        self._trava = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._geracao = 0
+        self._caminho: Optional[str] = None
+        self._futuro: Optional[Future] = None
+        self._limite_resultados = limite_resultados
+        self._resultados = LoteResultados()
+        self._publicados = 0
+        self.descartados = 0
+        self._observar = observar
+        self._observador: Optional["Oxumare"] = None
+        self._observado: Optional[str] = None
+        self.ao_mudar: Optional[Callable[[str, ResultadoCompacto], None]] = None
+
+    @property
+    def geracao(self) -> int:
+        """Geração do pedido atual."""
+        return self._geracao
+
+    @property
+    def ocioso(self) -> bool:
+        """True quando o pedido atual terminou e a fila foi esvaziada."""
+        with self._trava:
+            futuro = self._futuro
+        return (futuro is None or futuro.done()) and self._fila.empty()
+
+    @property
+    def observado(self) -> Optional[str]:
+        """Caminho sob observação (o do pedido atual), se houver."""
+        return self._observado
+
+    def resultados(self) -> tuple[LoteResultados, int]:
+        """
+        Resultados acumulados do pedido atual e quantos já podem ser lidos.
+
+        O worker continua acrescentando entradas enquanto a análise roda; só
+        os primeiros ``n`` resultados devolvidos estão completos.
+        """
+        with self._trava:
+            return self._resultados, self._publicados
+
+    def analisar(self, caminho: str) -> int:
+        """
+        Agenda a análise de ``caminho`` e devolve a geração do pedido.
+
+        Se o mesmo caminho já estiver em análise, o pedido é agrupado ao atual;
+        caso contrário, o trabalho anterior é cancelado.
+        """
+        caminho = os.path.abspath(os.path.expanduser(caminho))
+        with self._trava:
+            if caminho == self._caminho and self._futuro is not None and not self._futuro.done():
+                return self._geracao
+            self._cancelar()
+            self._geracao += 1
+            self._caminho = caminho
+            self._resultados = LoteResultados()
+            self._publicados = 0
+            self.descartados = 0
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self._workers, thread_name_prefix="analise")
+            self._futuro = self._executor.submit(
+                self._trabalhar, caminho, self._geracao, self._resultados
+            )
+            self._vigiar(caminho)
+            return self._geracao
+
+    def cancelar(self) -> None:
+        """Torna obsoleto o pedido atual; seus resultados deixam de ser entregues."""
+        with self._trava:
+            self._cancelar()
+            self._geracao += 1
+            self._caminho = None
+            self._vigiar(None)
+
+    def drenar(self, orcamento: float = 0.004, maximo: int = 64) -> list[Atualizacao]:
+        """
+        Retira da fila os lotes do pedido atual, sem bloquear.
+
+        Args:
+            orcamento: Segundos máximos gastos nesta chamada
+            maximo: Número máximo de lotes retirados
+
+        Returns:
+            Lotes da geração atual, na ordem em que foram produzidos.
+        """
+        limite = time.perf_counter() + orcamento
+        lotes: list[Atualizacao] = []
+        while len(lotes) < maximo and time.perf_counter() < limite:
+            try:
+                lote = self._fila.get_nowait()
+            except queue.Empty:
+                break
+            if lote.geracao == self._geracao:
+                lotes.append(lote)
+        return lotes
+
+    def encerrar(self) -> None:
+        """Cancela o pedido atual e libera as threads."""
+        self.cancelar()
+        with self._trava:
+            executor, self._executor = self._executor, None
+            observador, self._observador = self._observador, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        if observador is not None:
+            observador.parar()
+
+    def _cancelar(self) -> None:
+        """Cancela o futuro ainda não iniciado. Deve ser chamado com a trava adquirida."""
+        if self._futuro is not None:
+            self._futuro.cancel()
+            self._futuro = None
+
+    def _vigiar(self, caminho: Optional[str]) -> None:
+        """Observa ``caminho`` no lugar do anterior. Deve ser chamado com a trava adquirida."""
+        if not self._observar or caminho == self._observado:
+            return
+        if self._observado is not None and self._observador is not None:
+            self._observador.deixar(self._observado)
+        self._observado = caminho
+        if caminho is None:
+            return
+        if self._observador is None:
+            # O observador (ctypes, inotify) só é carregado quando há o que observar
+            from app.models.app_models import CaminhoSOModel  # pylint: disable=C0415
+            from app.utils.app_observador import Oxumare  # pylint: disable=C0415
+
+            # Grava no cache da Model, para que ela nunca sirva um resultado antigo
+            self._observador = Oxumare(CaminhoSOModel._cache, ao_mudar=self._notificar)
+            self._observador.iniciar()
+        self._observador.observar(caminho)
+
+    def _notificar(self, caminho: str, resultado: ResultadoCompacto) -> None:
+        """Repassa ao ``ao_mudar`` atual a alteração vista pelo observador."""
+        ao_mudar = self.ao_mudar
+        if ao_mudar is not None:
+            ao_mudar(caminho, resultado)
+
+    def _trabalhar(self, caminho: str, geracao: int, resultados: LoteResultados) -> None:
+        """Varre ``caminho`` publicando lotes até terminar ou ficar obsoleto."""
+        registros = Oxossi.varrer(caminho, profundidade_maxima=self._profundidade_maxima)
+        lote: list[Mapping] = []
+        prazo = time.monotonic() + self._intervalo_lote
+        try:
+            for registro in registros:
+                lote.append(registro)
+                if len(lote) >= self._tamanho_lote or time.monotonic() >= prazo:
+                    self._guardar(resultados, lote, geracao)
+                    if not self._publicar(Atualizacao(geracao, caminho, tuple(lote))):
+                        return
+                    lote = []
+                    prazo = time.monotonic() + self._intervalo_lote
+            self._guardar(resultados, lote, geracao)
+            self._publicar(Atualizacao(geracao, caminho, tuple(lote), concluida=True))
+        except Exception as erro:  # pylint: disable=broad-exception-caught
+            self._publicar(Atualizacao(geracao, caminho, tuple(lote), True, erro))
+        finally:
+            registros.close()
+
+    def _guardar(self, resultados: LoteResultados, lote: list[Mapping], geracao: int) -> None:
+        """Acrescenta o lote aos resultados do pedido, respeitando o limite."""
+        espaco = max(0, self._limite_resultados - len(resultados))
+        resultados.estender(lote[:espaco])
+        with self._trava:
+            if geracao == self._geracao:
+                self._publicados = len(resultados)
+                self.descartados += len(lote) - min(espaco, len(lote))
+
+    def _publicar(self, atualizacao: Atualizacao) -> bool:
+        """
+        Põe o lote na fila, esperando espaço enquanto o pedido for o atual.
 
-        return {
-            "nome_formatado": nome_formatado,
-            "mensagem_sucesso": mensagem_sucesso,
-            "mensagem_execucao": mensagem
-        }
+        Returns:
+            False se o pedido ficou obsoleto (o worker deve parar).
+        """
+        while atualizacao.geracao == self._geracao:
+            try:
+                self._fila.put(atualizacao, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
@@ -12,8 +12,53 @@ Sucessos (ex: CAMINHO_VALIDO, PASTA_ANALISADA)
 Avisos ou logs informativos
 
 A Controller solicita a mensagem correta conforme o código ou status retornado pela Model.
+
+Mensagens podem ser adiadas: ``Exu.adiar(codigo, caminho)`` devolve uma
+``Mensagem`` leve (código + argumentos) que só vira texto quando a View a
+exibe com ``str()``. O código é o nome do método do Exu que gera o texto.
 """
 
+from typing import Any
+
+
+class Mensagem:
+    """
+    Mensagem adiada do Exu: guarda o código e os argumentos, não o texto.
+
+    Barata de criar, comparar e serializar; o texto é produzido apenas em
+    ``str(mensagem)``, chamando o método do Exu de mesmo nome do código.
+
+    Atributos:
+        codigo (str): Nome do método do Exu (ex.: 'caminho_valido')
+        caminho (str): Caminho ao qual a mensagem se refere
+        dados (tuple): Argumentos adicionais (ex.: o tipo em 'tipo_identificado')
+    """
+
+    __slots__ = ("codigo", "caminho", "dados")
+
+    def __init__(self, codigo: str, caminho: str, *dados: Any) -> None:
+        self.codigo = codigo
+        self.caminho = caminho
+        self.dados = dados
+
+    def __str__(self) -> str:
+        return getattr(Exu, self.codigo)(self.caminho, *self.dados)
+
+    def __repr__(self) -> str:
+        return f"Mensagem({', '.join(repr(item) for item in self.para_tupla())})"
+
+    def __eq__(self, outra: object) -> bool:
+        if not isinstance(outra, Mensagem):
+            return NotImplemented
+        return self.para_tupla() == outra.para_tupla()
+
+    def __hash__(self) -> int:
+        return hash(self.para_tupla())
+
+    def para_tupla(self) -> tuple:
+        """Forma serializável da mensagem: (codigo, caminho, *dados)."""
+        return (self.codigo, self.caminho, *self.dados)
+
 
 class Exu:
     """
@@ -28,6 +73,13 @@ class Exu:
         - Caminho sempre entre aspas simples
     """
 
+    CODIGOS = frozenset({
+        'caminho_invalido', 'caminho_nao_encontrado', 'caminho_encontrado',
+        'caminho_nao_permitido', 'caminho_nao_legivel', 'caminho_legivel',
+        'tipo_identificado', 'tipo_nao_suportado', 'arquivo_vazio',
+        'diretorio_vazio', 'caminho_valido', 'tempo_esgotado', 'caminho_alterado',
+    })
+
     __EMOJI_MAP = {
         'invalido': '❌',
         'nao_encontrado': '📁',
@@ -37,9 +89,31 @@ class Exu:
         'tipo': '📦',
         'arquivo_vazio': '🗒️',
         'diretorio_vazio': '📂',
-        'valido': '🎯'
+        'valido': '🎯',
+        'tempo_esgotado': '⏳',
+        'alterado': '🔄'
     }
 
+    @staticmethod
+    def adiar(codigo: str, caminho: str, *dados: Any) -> Mensagem:
+        """
+        Retorna a mensagem ``codigo`` sem formatá-la.
+
+        Args:
+            codigo: Nome de um dos métodos de mensagem do Exu.
+            caminho: Caminho ao qual a mensagem se refere.
+            dados: Argumentos adicionais exigidos pelo código.
+
+        Returns:
+            Mensagem adiada, convertida em texto apenas com ``str()``.
+
+        Raises:
+            ValueError: Se o código não corresponder a nenhuma mensagem.
+        """
+        if codigo not in Exu.CODIGOS:
+            raise ValueError(f"Código de mensagem desconhecido: {codigo!r}")
+        return Mensagem(codigo, caminho, *dados)
+
     @staticmethod
     def caminho_invalido(caminho: str) -> str:
         """
@@ -190,6 +264,35 @@ class Exu:
         """
         return f"{Exu.__EMOJI_MAP['valido']} Caminho válido e utilizável: '{caminho}'."
 
+    @staticmethod
+    def tempo_esgotado(caminho: str) -> str:
+        """
+        Retorna mensagem indicando que a validação excedeu o tempo limite.
+
+        Args:
+            caminho: Caminho analisado.
+
+        Returns:
+            Mensagem formatada de tempo esgotado.
+        """
+        return (
+            f"{Exu.__EMOJI_MAP['tempo_esgotado']} Tempo esgotado ao validar: "
+            f"'{caminho}' não respondeu a tempo."
+        )
+
+    @staticmethod
+    def caminho_alterado(caminho: str) -> str:
+        """
+        Retorna mensagem indicando que o caminho mudou no disco enquanto observado.
+
+        Args:
+            caminho: Caminho observado.
+
+        Returns:
+            Mensagem formatada de alteração detectada.
+        """
+        return f"{Exu.__EMOJI_MAP['alterado']} Alteração detectada em: '{caminho}'."
+
 # from typing import Callable
 # def testar_exu() -> None:
 #     """
@@ -28,14 +28,15 @@ Informações adicionais para exibição
 A Model não conhece a View, nem formata mensagens para o usuário. Apenas analisa e retorna dados brutos ou estruturados.
 """
 
-import os
-import sys
+from functools import cached_property
 from typing import Literal, TypedDict
 
-# Garante que o diretório raiz esteja no sys.path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from utils.app_tools import Ogum  # noqa: E402
-from mensagens.app_mensageiro import Exu  # noqa: E402  # Importa o mensageiro Exu
+from app.utils.app_tools import Ogum
+from app.utils.app_analisador import Ifa
+from app.utils.app_cache import CacheValidacao
+from app.utils.app_compacto import ResultadoCompacto
+from app.utils.app_normalizador import Oxala
+from app.mensagens.app_mensageiro import Exu, Mensagem  # Importa o mensageiro Exu
 
 
 class InfoCaminho(TypedDict):
@@ -46,63 +47,84 @@ class InfoCaminho(TypedDict):
     nome: str
     extensao: str
     diretorio_pai: str
-    mensagem: str
+    mensagem: Mensagem
 
 
 class CaminhoSOModel:
+    """
+    Modelo de um caminho informado pelo usuário.
+
+    Nada é calculado na construção. Os campos puramente textuais (nome,
+    extensão, diretório pai, sistema, caminho normalizado) são derivados da
+    análise da string; os que dependem do disco (valido, mensagem) disparam no máximo uma
+    validação, no primeiro acesso. Tudo fica memorizado até ``atualizar()``.
+    """
+
+    # Ogum e Exu são puramente estáticos; o cache é compartilhado por todos os
+    # modelos para que caminhos repetidos não voltem ao disco.
+    _guia = Ogum
+    _mensageiro = Exu
+    _cache = CacheValidacao(capacidade=4096, nome="modelo")
+
+    # Campos memorizados que dependem do sistema de arquivos
+    _CAMPOS_DISCO = ("_resultado", "valido", "mensagem")
+
     def __init__(self, caminho: str):
         self._caminho_original = caminho
-        self._guia = Ogum()
-        self._mensageiro = Exu()
-        self._resultado = self._guia.validar(caminho)
-        self._sistema = self._identificar_sistema()
+
+    def atualizar(self) -> None:
+        """Descarta o estado do disco memorizado; o próximo acesso valida de novo."""
+        self._cache.invalidar(self._caminho_original)
+        for campo in self._CAMPOS_DISCO:
+            self.__dict__.pop(campo, None)
+
+    @cached_property
+    def _resultado(self) -> ResultadoCompacto:
+        return self._cache.validar(self._caminho_original)
+
+    @cached_property
+    def _metadados(self) -> dict:
+        return self._guia.obter_metadados(self._caminho_original)
 
     def _identificar_sistema(self) -> Literal["windows", "posix", "mac", "desconhecido"]:
-        if ":" in self._caminho_original and "\\" in self._caminho_original:
-            return "windows"
-        elif self._caminho_original.startswith("/"):
-            return "posix"
-        return "desconhecido"
+        return Ifa.identificar_sistema(self._caminho_original)
 
     @property
     def caminho_original(self) -> str:
         return self._caminho_original
 
-    @property
+    @cached_property
     def caminho_normalizado(self) -> str:
-        return self._resultado.get("caminho_normalizado", self._caminho_original)
+        # Puramente sintático (Oxala): segue as regras do sistema do caminho
+        return Oxala.normalizar(self._caminho_original)
 
-    @property
+    @cached_property
     def sistema(self) -> Literal["windows", "posix", "mac", "desconhecido"]:
-        return self._sistema
+        return self._identificar_sistema()
 
-    @property
+    @cached_property
     def valido(self) -> bool:
         return self._resultado.get("valido", False)
 
-    @property
+    @cached_property
     def nome(self) -> str:
         return self._guia.obter_nome_arquivo(self._caminho_original)
 
-    @property
+    @cached_property
     def extensao(self) -> str:
-        return self._guia.obter_metadados(self._caminho_original)["extensao"]
+        return self._metadados["extensao"]
 
-    @property
+    @cached_property
     def diretorio_pai(self) -> str:
-        return 'self._guia.obter_diretorio_pai(self._caminho_original)'
-
-    @property
-    def mensagem(self) -> str:
-        if not self._resultado.get("valido"):
-            return self._mensageiro.caminho_invalido(self._caminho_original)
-        if not self._resultado.get("existe"):
-            return self._mensageiro.caminho_nao_encontrado(self._caminho_original)
-        if self._resultado.get("permissao_negada"):
-            return self._mensageiro.caminho_nao_permitido(self._caminho_original)
-        if not self._resultado.get("legivel"):
-            return self._mensageiro.caminho_nao_legivel(self._caminho_original)
-        return self._mensageiro.caminho_legivel(self._caminho_original)
+        return self._metadados["diretorio_pai"]
+
+    @cached_property
+    def mensagem(self) -> Mensagem:
+        # Mensagem adiada do Ogum: o texto só é montado quando a View chamar str()
+        mensagem = self._resultado.get("mensagem")
+        if mensagem is None:
+            return self._mensageiro.adiar("caminho_invalido", self._caminho_original)
+        return mensagem
 
     def to_dict(self) -> InfoCaminho:
         return {
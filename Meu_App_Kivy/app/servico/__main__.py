@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+Executa o serviço local de validação (Xango) em primeiro plano.
+
+Exemplos (a partir de Meu_App_Kivy/):
+    python -m app.servico
+    python -m app.servico --socket /run/user/1000/apontador.sock --ttl 5
+"""
+
+import argparse
+import signal
+import sys
+from typing import Optional
+
+from app.servico.app_protocolo import endereco_padrao
+from app.servico.app_servidor import Xango
+
+
+def _interromper(*_args: object) -> None:
+    raise KeyboardInterrupt
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.servico",
+        description="Serviço de validação de caminhos num socket de domínio Unix.",
+    )
+    parser.add_argument(
+        "--socket", default=endereco_padrao(), help="caminho do socket (padrão: %(default)s)"
+    )
+    parser.add_argument(
+        "--capacidade", type=int, default=65536, help="caminhos mantidos no cache compartilhado"
+    )
+    parser.add_argument(
+        "--ttl", type=float, default=1.0,
+        help="segundos até um resultado ser reconfirmado com um stat (0 desativa o TTL)",
+    )
+    args = parser.parse_args(argv)
+
+    xango = Xango(args.socket, capacidade=args.capacidade, ttl=args.ttl or None)
+    # SIGTERM encerra como Ctrl+C, removendo o arquivo do socket
+    signal.signal(signal.SIGTERM, _interromper)
+    xango.iniciar()
+    print(f"Xango atendendo em {xango.endereco}", file=sys.stderr)
+    try:
+        signal.pause()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        xango.parar()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
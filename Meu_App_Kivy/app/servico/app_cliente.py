@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+"""
+app_cliente.py
+
+Cliente leve do serviço de validação (ver app_servidor).
+
+Iansã, senhora dos ventos, leva os caminhos até o Xangô e traz os veredictos
+de volta. Nada é validado no processo do cliente: os resultados chegam como
+ResultadoCompacto, lidos como um ResultadoValidacao comum.
+
+O serviço roda em outro diretório de trabalho, então os caminhos seguem
+sempre absolutos: os relativos são resolvidos aqui, contra o diretório do
+cliente, e os resultados voltam com o caminho absoluto.
+
+Exemplo::
+
+    with Iansa() as cliente:
+        resultado = cliente.validar("/etc/hosts")
+        resultados = cliente.validar_lote(caminhos)
+"""
+
+import json
+import os
+import socket
+import threading
+from collections import deque
+from typing import Iterable, Optional
+
+from app.servico.app_protocolo import (
+    CONTAGEM,
+    ERRO,
+    ESTATISTICAS,
+    INVALIDAR,
+    LOTE,
+    METADADOS,
+    PING,
+    TAMANHO_LEITURA,
+    VALIDAR,
+    VERSAO,
+    VERSAO_PROTOCOLO,
+    ErroServico,
+    codificar_caminho,
+    codificar_textos,
+    decodificar_resultados,
+    decodificar_textos,
+    endereco_padrao,
+    quadro,
+    separar,
+)
+from app.utils.app_compacto import CODIGOS, ResultadoCompacto
+
+
+class Iansa:
+    """
+    Senhora dos ventos - Conexão com o serviço de validação.
+
+    Segura para uso por várias threads (as chamadas são serializadas); para
+    paralelismo real, use uma conexão por thread.
+
+    Args:
+        endereco: Caminho do socket; None usa o endereço padrão do serviço
+        timeout: Segundos de espera por uma resposta; None espera sempre
+        verificar: Confere, ao conectar, se o serviço fala a mesma versão
+    """
+
+    def __init__(
+        self,
+        endereco: Optional[str] = None,
+        timeout: Optional[float] = None,
+        verificar: bool = True,
+    ) -> None:
+        self._conexao = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._conexao.settimeout(timeout)
+        self._conexao.connect(endereco or endereco_padrao())
+        self._trava = threading.Lock()
+        self._buffer = bytearray()
+        self._prontos: deque[tuple[int, int, bytes]] = deque()
+        self._proximo_id = 0
+        if verificar:
+            versao, codigos = self.ping()
+            if versao != VERSAO_PROTOCOLO or codigos != len(CODIGOS):
+                self.fechar()
+                raise ErroServico(
+                    f"serviço incompatível (protocolo {versao}, {codigos} códigos)"
+                )
+
+    def __enter__(self) -> "Iansa":
+        return self
+
+    def __exit__(self, *_excecao: object) -> None:
+        self.fechar()
+
+    def fechar(self) -> None:
+        """Encerra a conexão."""
+        self._conexao.close()
+
+    def validar(self, caminho: str) -> ResultadoCompacto:
+        """Valida um caminho usando o cache compartilhado do serviço."""
+        caminho = os.path.abspath(caminho)
+        with self._trava:
+            corpo = self._pedir(VALIDAR, codificar_caminho(caminho))
+        return decodificar_resultados([caminho], corpo)[0]
+
+    def validar_lote(
+        self, caminhos: Iterable[str], tamanho_lote: int = 256, janela: int = 8
+    ) -> list[ResultadoCompacto]:
+        """
+        Valida muitos caminhos, na ordem recebida.
+
+        Os caminhos seguem em pedidos LOTE de ``tamanho_lote``; até ``janela``
+        lotes ficam em trânsito antes de a primeira resposta ser lida, então
+        o serviço trabalha enquanto o cliente ainda envia. Todos os lotes são
+        codificados antes do primeiro envio, de modo que um caminho inválido
+        é recusado sem deixar pedidos pela metade na conexão.
+        """
+        lista = [os.path.abspath(caminho) for caminho in caminhos]
+        lotes: list[tuple[list[str], bytes]] = []
+        for inicio in range(0, len(lista), tamanho_lote):
+            fatia = lista[inicio:inicio + tamanho_lote]
+            lotes.append((fatia, self._codificar_lote(fatia)))
+        resultados: list[ResultadoCompacto] = []
+        pendentes: deque[tuple[int, list[str]]] = deque()
+        with self._trava:
+            for lote, corpo in lotes:
+                pendentes.append((self._enviar(LOTE, corpo), lote))
+                if len(pendentes) >= janela:
+                    identificador, enviados = pendentes.popleft()
+                    resultados += decodificar_resultados(enviados, self._receber(identificador))
+            while pendentes:
+                identificador, enviados = pendentes.popleft()
+                resultados += decodificar_resultados(enviados, self._receber(identificador))
+        return resultados
+
+    def metadados(self, caminho: str) -> dict:
+        """Nome, extensão e diretório pai, como ``Ogum.obter_metadados``."""
+        with self._trava:
+            corpo = self._pedir(METADADOS, codificar_caminho(os.path.abspath(caminho)))
+        (nome, extensao, diretorio_pai), _ = decodificar_textos(corpo, 3)
+        return {"nome": nome, "extensao": extensao, "diretorio_pai": diretorio_pai}
+
+    def invalidar(self, caminho: str) -> bool:
+        """Descarta o caminho do cache do serviço. True se havia uma entrada."""
+        with self._trava:
+            return self._pedir(INVALIDAR, codificar_caminho(os.path.abspath(caminho))) == b"\x01"
+
+    def estatisticas(self) -> dict:
+        """Contadores do cache compartilhado (EstatisticasCache)."""
+        with self._trava:
+            return json.loads(self._pedir(ESTATISTICAS))
+
+    def ping(self) -> tuple[int, int]:
+        """Versão do protocolo e quantidade de códigos de mensagem do serviço."""
+        with self._trava:
+            return VERSAO.unpack(self._pedir(PING))
+
+    def _pedir(self, operacao: int, corpo: bytes = b"") -> bytes:
+        """Envia um pedido e espera sua resposta. Deve ser chamado com a trava adquirida."""
+        return self._receber(self._enviar(operacao, corpo))
+
+    @staticmethod
+    def _codificar_lote(caminhos: list[str]) -> bytes:
+        return CONTAGEM.pack(len(caminhos)) + codificar_textos(*caminhos)
+
+    def _enviar(self, operacao: int, corpo: bytes) -> int:
+        dados = quadro(operacao, (self._proximo_id + 1) & 0xFFFFFFFF, corpo)
+        self._proximo_id = (self._proximo_id + 1) & 0xFFFFFFFF
+        try:
+            self._conexao.sendall(dados)
+        except OSError:
+            # Um quadro escrito pela metade dessincroniza o fluxo para sempre
+            self.fechar()
+            raise
+        return self._proximo_id
+
+    def _receber(self, identificador: int) -> bytes:
+        """
+        Lê a resposta do pedido ``identificador``.
+
+        Respostas de pedidos anteriores que ficaram sem leitor (uma chamada
+        interrompida por erro ou timeout com lotes em trânsito) são
+        descartadas até a esperada chegar.
+        """
+        while True:
+            while not self._prontos:
+                dados = self._conexao.recv(TAMANHO_LEITURA)
+                if not dados:
+                    raise ErroServico("conexão encerrada pelo serviço")
+                self._buffer += dados
+                self._prontos.extend(separar(self._buffer))
+            status, recebido, corpo = self._prontos.popleft()
+            if recebido == identificador:
+                break
+            # Ids crescem módulo 2**32: "anterior" é estar até meio ciclo atrás
+            if not 0 < (identificador - recebido) & 0xFFFFFFFF < 1 << 31:
+                raise ErroServico(f"resposta {recebido} fora de ordem (esperava {identificador})")
+        if status == ERRO:
+            raise ErroServico(corpo.decode("utf-8", "replace"))
+        return corpo
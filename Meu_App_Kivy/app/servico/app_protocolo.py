@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""
+app_protocolo.py
+
+Protocolo binário entre o serviço de validação (Xango) e seus clientes (Iansa).
+
+Cada mensagem é um quadro prefixado pelo tamanho::
+
+    pedido:   [tamanho:u32][operacao:u8][id:u32][corpo]
+    resposta: [tamanho:u32][status:u8][id:u32][corpo]
+
+``tamanho`` conta os bytes após ele mesmo; inteiros são big-endian. O ``id``
+é escolhido pelo cliente e devolvido na resposta, o que permite enviar vários
+pedidos antes de ler as respostas (pipelining). Respostas saem na ordem dos
+pedidos de cada conexão.
+
+Corpos por operação (caminhos em ``os.fsencode``):
+
+- VALIDAR: caminho → resultado (3 bytes: flags, tipo, índice do código)
+- LOTE: [n:u32] e n × ([tamanho:u16][caminho]) → n resultados de 3 bytes
+- METADADOS: caminho → nome, extensão e diretório pai, cada um [u16][bytes]
+- INVALIDAR: caminho → 1 byte (1 se havia entrada no cache)
+- ESTATISTICAS: vazio → JSON com os contadores do cache
+- PING: vazio → [versão:u16][quantidade de códigos:u16]
+
+Resultados usam a mesma codificação do ResultadoCompacto; o índice do código
+refere-se a ``app_compacto.CODIGOS``, por isso cliente e serviço precisam da
+mesma versão (conferida com PING). Respostas com status ERRO trazem a
+mensagem em UTF-8.
+"""
+
+import os
+import struct
+import tempfile
+
+from app.utils.app_compacto import ResultadoCompacto
+
+VERSAO_PROTOCOLO = 1
+
+# Operações
+VALIDAR = 1
+LOTE = 2
+METADADOS = 3
+INVALIDAR = 4
+ESTATISTICAS = 5
+PING = 6
+
+# Status das respostas
+OK = 0
+ERRO = 1
+
+CABECALHO = struct.Struct(">IBI")  # tamanho, operação/status, id
+TAMANHO_CABECALHO = CABECALHO.size
+CONTAGEM = struct.Struct(">I")
+TEXTO = struct.Struct(">H")
+RESULTADO = struct.Struct(">BBB")
+VERSAO = struct.Struct(">HH")
+
+# Maior quadro aceito (protege o serviço de tamanhos corrompidos)
+MAXIMO_QUADRO = 64 << 20
+# Maior caminho representável num LOTE ou METADADOS
+MAXIMO_TEXTO = 0xFFFF
+# Bytes lidos do socket por chamada
+TAMANHO_LEITURA = 1 << 16
+
+
+class ErroServico(Exception):
+    """Falha relatada pelo serviço ou violação do protocolo."""
+
+
+def endereco_padrao() -> str:
+    """Socket em ``$XDG_RUNTIME_DIR`` ou, na falta dele, no diretório temporário."""
+    pasta = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    sufixo = f"-{os.getuid()}" if hasattr(os, "getuid") else ""
+    return os.path.join(pasta, f"apontador{sufixo}.sock")
+
+
+def quadro(codigo: int, identificador: int, corpo: bytes = b"") -> bytes:
+    """Monta um quadro completo (pedido ou resposta)."""
+    if len(corpo) + 5 > MAXIMO_QUADRO:
+        raise ErroServico(f"quadro de {len(corpo)} bytes excede o limite")
+    return CABECALHO.pack(len(corpo) + 5, codigo, identificador) + corpo
+
+
+def separar(buffer: bytearray) -> list[tuple[int, int, bytes]]:
+    """
+    Extrai os quadros completos do início de ``buffer``, consumindo-os.
+
+    Bytes de um quadro incompleto permanecem no buffer para a próxima leitura.
+
+    Returns:
+        (operação ou status, id, corpo) de cada quadro completo, em ordem.
+
+    Raises:
+        ErroServico: Se um quadro anunciar um tamanho inválido
+    """
+    quadros: list[tuple[int, int, bytes]] = []
+    inicio = 0
+    while len(buffer) - inicio >= TAMANHO_CABECALHO:
+        tamanho, codigo, identificador = CABECALHO.unpack_from(buffer, inicio)
+        if tamanho < 5 or tamanho > MAXIMO_QUADRO:
+            raise ErroServico(f"tamanho de quadro inválido: {tamanho}")
+        fim = inicio + 4 + tamanho
+        if len(buffer) < fim:
+            break
+        quadros.append((codigo, identificador, bytes(buffer[inicio + TAMANHO_CABECALHO:fim])))
+        inicio = fim
+    del buffer[:inicio]
+    return quadros
+
+
+def codificar_caminho(caminho: str) -> bytes:
+    """Caminho em bytes, preservando nomes que não são UTF-8 válido."""
+    return os.fsencode(caminho)
+
+
+def decodificar_caminho(dados: bytes) -> str:
+    """Inverso de ``codificar_caminho``."""
+    return os.fsdecode(dados)
+
+
+def codificar_textos(*textos: str) -> bytes:
+    """Sequência de textos, cada um prefixado por seu tamanho (u16)."""
+    partes: list[bytes] = []
+    for texto in textos:
+        dados = codificar_caminho(texto)
+        if len(dados) > MAXIMO_TEXTO:
+            raise ErroServico(f"caminho com {len(dados)} bytes excede o limite")
+        partes.append(TEXTO.pack(len(dados)))
+        partes.append(dados)
+    return b"".join(partes)
+
+
+def decodificar_textos(dados: bytes, quantidade: int, inicio: int = 0) -> tuple[list[str], int]:
+    """
+    Lê ``quantidade`` textos prefixados por tamanho a partir de ``inicio``.
+
+    Returns:
+        Tupla (textos, posição após o último texto).
+    """
+    textos: list[str] = []
+    for _ in range(quantidade):
+        (tamanho,) = TEXTO.unpack_from(dados, inicio)
+        inicio += TEXTO.size
+        fim = inicio + tamanho
+        if fim > len(dados):
+            raise ErroServico("texto truncado no quadro")
+        textos.append(decodificar_caminho(dados[inicio:fim]))
+        inicio = fim
+    return textos, inicio
+
+
+def codificar_resultado(resultado: ResultadoCompacto) -> bytes:
+    """Os três bytes (flags, tipo, código) de um ResultadoCompacto."""
+    return RESULTADO.pack(
+        resultado._flags, resultado._tipo, resultado._codigo  # pylint: disable=W0212
+    )
+
+
+def decodificar_resultados(caminhos: list[str], dados: bytes) -> list[ResultadoCompacto]:
+    """Reconstrói os resultados de ``caminhos`` a partir dos bytes da resposta."""
+    if len(dados) != RESULTADO.size * len(caminhos):
+        raise ErroServico("quantidade de resultados diferente da de caminhos")
+    return [
+        ResultadoCompacto(caminho, *valores)
+        for caminho, valores in zip(caminhos, RESULTADO.iter_unpack(dados))
+    ]
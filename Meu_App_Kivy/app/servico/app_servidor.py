@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""
+app_servidor.py
+
+Serviço local de validação, acessado por um socket de domínio Unix.
+
+Xangô, o rei justo, julga os caminhos de todos os clientes com uma única
+memória: os processos que antes embutiam o Ogum (cada um pagando o próprio
+import e mantendo um cache frio) passam a consultar um serviço de longa
+duração que compartilha um CacheValidacao aquecido entre as conexões.
+
+Cada conexão é atendida por uma thread (``ThreadingUnixStreamServer``). Os
+pedidos chegam no protocolo de app_protocolo; todos os quadros completos
+lidos de uma vez são atendidos em sequência e suas respostas voltam numa
+única escrita, então clientes que enviam vários pedidos antes de ler
+(pipelining) ou usam LOTE pagam poucas syscalls por caminho.
+
+Os caminhos precisam chegar absolutos: o serviço não conhece o diretório de
+trabalho de cada cliente, e um caminho relativo seria julgado (e guardado no
+cache compartilhado) como se fosse relativo ao diretório do próprio serviço.
+
+Executado por ``python -m app.servico`` (ver app/servico/__main__.py).
+"""
+
+import errno
+import json
+import os
+import socket
+import socketserver
+import stat
+import threading
+from typing import Optional
+
+from app.servico.app_protocolo import (
+    CONTAGEM,
+    ERRO,
+    ESTATISTICAS,
+    INVALIDAR,
+    LOTE,
+    METADADOS,
+    OK,
+    PING,
+    TAMANHO_LEITURA,
+    VALIDAR,
+    VERSAO,
+    VERSAO_PROTOCOLO,
+    ErroServico,
+    codificar_resultado,
+    codificar_textos,
+    decodificar_caminho,
+    decodificar_textos,
+    endereco_padrao,
+    quadro,
+    separar,
+)
+from app.utils.app_cache import CacheValidacao
+from app.utils.app_compacto import CODIGOS
+from app.utils.app_tools import Ogum
+
+
+def _absoluto(caminho: str) -> str:
+    """Devolve ``caminho`` se for absoluto; recusa os relativos ao cliente."""
+    if not os.path.isabs(caminho):
+        raise ErroServico(f"caminho relativo: {caminho!r} (envie o caminho absoluto)")
+    return caminho
+
+
+class _Conexao(socketserver.BaseRequestHandler):
+    """Atende os pedidos de um cliente até ele desconectar."""
+
+    def handle(self) -> None:
+        xango: Xango = self.server.xango  # type: ignore[attr-defined]
+        conexao: socket.socket = self.request
+        buffer = bytearray()
+        while True:
+            try:
+                dados = conexao.recv(TAMANHO_LEITURA)
+            except OSError:
+                return
+            if not dados:
+                return
+            buffer += dados
+            try:
+                quadros = separar(buffer)
+            except ErroServico:
+                return  # Quadro corrompido: não há como ressincronizar
+            if quadros:
+                respostas = b"".join(
+                    xango.atender(operacao, identificador, corpo)
+                    for operacao, identificador, corpo in quadros
+                )
+                try:
+                    conexao.sendall(respostas)
+                except OSError:
+                    return
+
+
+class _Servidor(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, endereco: str, xango: "Xango") -> None:
+        self.xango = xango
+        super().__init__(endereco, _Conexao)
+
+
+class Xango:
+    """
+    Rei da justiça - Serviço de validação compartilhado por vários processos.
+
+    Args:
+        endereco: Caminho do socket; None usa ``endereco_padrao()``
+        capacidade: Caminhos mantidos no cache compartilhado
+        ttl: Segundos até uma entrada ser reconfirmada com um stat; um serviço
+            de longa duração não deve confiar para sempre no que já viu
+        cache: CacheValidacao a usar no lugar de um novo
+    """
+
+    def __init__(
+        self,
+        endereco: Optional[str] = None,
+        capacidade: int = 65536,
+        ttl: Optional[float] = 1.0,
+        cache: Optional[CacheValidacao] = None,
+    ) -> None:
+        self.endereco = endereco or endereco_padrao()
+        self.cache = cache if cache is not None else CacheValidacao(
+            capacidade=capacidade, ttl=ttl, nome="servico"
+        )
+        self._servidor: Optional[_Servidor] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "Xango":
+        self.iniciar()
+        return self
+
+    def __exit__(self, *_excecao: object) -> None:
+        self.parar()
+
+    def servir(self) -> None:
+        """Atende clientes na thread atual até ``parar`` ser chamado."""
+        self._abrir().serve_forever()
+
+    def iniciar(self) -> None:
+        """Atende clientes numa thread de fundo."""
+        servidor = self._abrir()
+        self._thread = threading.Thread(
+            target=servidor.serve_forever, name="xango", daemon=True
+        )
+        self._thread.start()
+
+    def parar(self) -> None:
+        """Encerra o serviço e remove o arquivo do socket."""
+        servidor, self._servidor = self._servidor, None
+        if servidor is None:
+            return
+        servidor.shutdown()
+        servidor.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        try:
+            os.unlink(self.endereco)
+        except FileNotFoundError:
+            pass
+
+    def atender(self, operacao: int, identificador: int, corpo: bytes) -> bytes:
+        """Executa um pedido e devolve o quadro de resposta (nunca levanta)."""
+        try:
+            return quadro(OK, identificador, self._executar(operacao, corpo))
+        except Exception as erro:  # pylint: disable=broad-exception-caught
+            return quadro(ERRO, identificador, f"{type(erro).__name__}: {erro}".encode())
+
+    def _executar(self, operacao: int, corpo: bytes) -> bytes:
+        """Corpo da resposta de uma operação."""
+        if operacao == VALIDAR:
+            return codificar_resultado(self.cache.validar(_absoluto(decodificar_caminho(corpo))))
+        if operacao == LOTE:
+            (quantidade,) = CONTAGEM.unpack_from(corpo)
+            caminhos, _ = decodificar_textos(corpo, quantidade, CONTAGEM.size)
+            for caminho in caminhos:
+                _absoluto(caminho)
+            validar = self.cache.validar
+            return b"".join(codificar_resultado(validar(caminho)) for caminho in caminhos)
+        if operacao == METADADOS:
+            metadados = Ogum.obter_metadados(_absoluto(decodificar_caminho(corpo)))
+            return codificar_textos(
+                metadados["nome"], metadados["extensao"], metadados["diretorio_pai"]
+            )
+        if operacao == INVALIDAR:
+            caminho = _absoluto(decodificar_caminho(corpo))
+            return b"\x01" if self.cache.invalidar(caminho) else b"\x00"
+        if operacao == ESTATISTICAS:
+            return json.dumps(self.cache.estatisticas).encode()
+        if operacao == PING:
+            return VERSAO.pack(VERSAO_PROTOCOLO, len(CODIGOS))
+        raise ErroServico(f"operação desconhecida: {operacao}")
+
+    def _abrir(self) -> _Servidor:
+        """Cria o socket (removendo um arquivo órfão de execução anterior)."""
+        if self._servidor is not None:
+            raise RuntimeError("serviço já iniciado")
+        self._remover_orfao()
+        self._servidor = _Servidor(self.endereco, self)
+        os.chmod(self.endereco, 0o600)  # Apenas o dono conversa com o serviço
+        return self._servidor
+
+    def _remover_orfao(self) -> None:
+        """Apaga um socket sem serviço ouvindo; recusa se houver um ativo."""
+        try:
+            modo = os.lstat(self.endereco).st_mode
+        except FileNotFoundError:
+            return
+        if not stat.S_ISSOCK(modo):
+            raise FileExistsError(errno.EEXIST, "não é um socket", self.endereco)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sonda:
+            try:
+                sonda.connect(self.endereco)
+            except (ConnectionRefusedError, FileNotFoundError):
+                os.unlink(self.endereco)
+                return
+        raise OSError(errno.EADDRINUSE, "serviço já em execução", self.endereco)
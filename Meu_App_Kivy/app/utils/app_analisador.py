@@ -0,0 +1,331 @@
+# -*- coding: utf-8 -*-
+"""
+app_analisador.py
+
+Análise puramente sintática de caminhos de qualquer sistema operacional.
+
+Ifa, o oráculo, lê a string do caminho - sem nenhum acesso ao disco e sem
+depender do sistema em que o app roda - e devolve sua anatomia: família do
+sistema, forma, drive, raiz, partes, nome, stem e sufixo.
+
+Formas reconhecidas:
+    - POSIX absoluto (``/etc/hosts``) e macOS (``/Users/...``, ``/Volumes/...``)
+    - Windows com drive (``C:\\pasta``), relativo ao drive (``C:pasta``) e
+      relativo à raiz do drive atual (``\\pasta``)
+    - UNC (``\\\\servidor\\share\\...``), caminhos longos (``\\\\?\\C:\\...``,
+      ``\\\\?\\UNC\\servidor\\share``) e dispositivos (``\\\\.\\COM1``)
+    - URLs ``file://`` e caminhos iniciados por ``~``
+    - Relativos, classificados pelo separador usado
+
+O prefixo é reconhecido por uma única regex pré-compilada e os resultados
+ficam num cache LRU, já que os mesmos caminhos costumam se repetir.
+
+Para colunas com milhões de caminhos, ``Ifa.classificar_lote`` aplica as
+mesmas regras e devolve os resultados em colunas compactas (ClassificacaoLote).
+"""
+
+import re
+import sys
+from array import array
+from functools import lru_cache
+from typing import Any, Iterable, Literal, NamedTuple
+from urllib.parse import unquote
+
+Sistema = Literal["windows", "posix", "mac", "desconhecido"]
+Forma = Literal[
+    "absoluto", "relativo", "drive_relativo", "raiz_relativo", "unc", "longo",
+    "dispositivo", "url", "home", "vazio",
+]
+
+# Diretórios de topo que só existem no macOS
+_RAIZES_MAC = frozenset({"Users", "Volumes", "Applications", "Library", "System", "private"})
+
+_PREFIXO = re.compile(
+    r"""
+      (?P<url>file://)
+    | (?P<longo>\\\\\?\\(?:UNC\\[^\\/]+\\[^\\/]+|[A-Za-z]:)?)(?P<longo_raiz>\\)?
+    | (?P<dispositivo>\\\\\.\\[^\\/]+)(?P<dispositivo_raiz>\\)?
+    | (?P<unc>\\\\[^\\/?.][^\\/]*\\[^\\/]+)(?P<unc_raiz>\\)?
+    | (?P<drive>[A-Za-z]:)(?P<drive_raiz>[\\/])?
+    | (?P<home>~[^\\/]*)
+    | (?P<raiz_windows>\\)
+    """,
+    re.VERBOSE,
+)
+_SEPARADORES_WINDOWS = re.compile(r"[\\/]+")
+# Grupos do _PREFIXO que já determinam a forma (o nome do grupo sem "_raiz")
+_FORMA_DO_GRUPO: dict[str, Forma] = {
+    "longo": "longo", "longo_raiz": "longo",
+    "dispositivo": "dispositivo", "dispositivo_raiz": "dispositivo",
+    "unc": "unc", "unc_raiz": "unc",
+}
+
+# Ordem fixa usada para codificar a coluna de sistemas em ClassificacaoLote
+SISTEMAS: tuple[Sistema, ...] = ("desconhecido", "posix", "windows", "mac")
+_CODIGO_SISTEMA: dict[str, int] = {sistema: codigo for codigo, sistema in enumerate(SISTEMAS)}
+
+
+class CaminhoAnalisado(NamedTuple):
+    """
+    Anatomia de um caminho, obtida sem acesso ao disco.
+
+    Atributos:
+        original (str): String analisada
+        sistema (str): 'windows', 'posix', 'mac' ou 'desconhecido'
+        forma (str): Forma sintática (ver docstring do módulo)
+        drive (str): Drive, share UNC ou prefixo de dispositivo ('' se não houver)
+        raiz (str): Separador da raiz ('' em caminhos relativos)
+        partes (tuple): Componentes após drive e raiz, sem vazios nem '.'
+        absoluto (bool): Se o caminho não depende do diretório atual
+        nome (str): Último componente com extensão, como ``PurePath.name``
+        stem (str): Último componente sem extensão, como ``PurePath.stem``
+        sufixo (str): Extensão do último componente, como ``PurePath.suffix``
+    """
+    original: str
+    sistema: Sistema
+    forma: Forma
+    drive: str
+    raiz: str
+    partes: tuple[str, ...]
+    absoluto: bool
+    nome: str
+    stem: str
+    sufixo: str
+
+    @property
+    def separador(self) -> str:
+        return "\\" if self.sistema == "windows" else "/"
+
+    @property
+    def profundidade(self) -> int:
+        """Quantidade de componentes após drive e raiz."""
+        return len(self.partes)
+
+    @property
+    def pai(self) -> str:
+        """Diretório pai reconstruído com o separador do sistema do caminho."""
+        ancora = self.drive + self.raiz
+        if len(self.partes) <= 1:
+            return ancora or "."
+        return ancora + self.separador.join(self.partes[:-1])
+
+
+class ClassificacaoLote:
+    """
+    Classificação sintática de muitos caminhos, organizada em colunas.
+
+    Atributos:
+        sistemas (bytearray): Índice em SISTEMAS de cada caminho
+        extensoes (list): Sufixo de cada caminho (strings internadas)
+        profundidades (array): Quantidade de componentes de cada caminho
+        absolutos (bytearray): 1 se o caminho é absoluto, 0 caso contrário
+    """
+
+    __slots__ = ("sistemas", "extensoes", "profundidades", "absolutos")
+
+    def __init__(self) -> None:
+        self.sistemas = bytearray()
+        self.extensoes: list[str] = []
+        self.profundidades = array("I")
+        self.absolutos = bytearray()
+
+    def __len__(self) -> int:
+        return len(self.sistemas)
+
+    def __getitem__(self, indice: int) -> dict[str, Any]:
+        return {
+            "sistema": SISTEMAS[self.sistemas[indice]],
+            "extensao": self.extensoes[indice],
+            "profundidade": self.profundidades[indice],
+            "absoluto": bool(self.absolutos[indice]),
+        }
+
+    def para_numpy(self) -> dict[str, Any]:
+        """
+        Converte as colunas em arrays NumPy (dependência opcional).
+
+        Raises:
+            ImportError: Se o NumPy não estiver instalado.
+        """
+        try:
+            import numpy  # pylint: disable=C0415
+        except ImportError as erro:
+            raise ImportError("para_numpy requer o pacote opcional 'numpy'") from erro
+        return {
+            "sistema": numpy.array(SISTEMAS, dtype=object)[
+                numpy.frombuffer(bytes(self.sistemas), dtype=numpy.uint8)
+            ],
+            "extensao": numpy.array(self.extensoes, dtype=object),
+            "profundidade": numpy.frombuffer(self.profundidades, dtype=numpy.uint32).copy(),
+            "absoluto": numpy.frombuffer(bytes(self.absolutos), dtype=numpy.bool_).copy(),
+        }
+
+
+class Ifa:
+    """
+    Oráculo dos caminhos - Lê a anatomia de um caminho sem consultar o disco.
+
+    Métodos principais:
+        analisar: Analisa um caminho (com cache LRU)
+        identificar_sistema: Atalho para ``analisar(caminho).sistema``
+        classificar_lote: Classifica uma coluna inteira de caminhos
+    """
+
+    TAMANHO_CACHE = 65536
+
+    @staticmethod
+    @lru_cache(maxsize=TAMANHO_CACHE)
+    def analisar(caminho: str) -> CaminhoAnalisado:
+        """
+        Analisa a string do caminho em uma única passada.
+
+        Args:
+            caminho: Caminho de qualquer sistema operacional
+
+        Returns:
+            CaminhoAnalisado com sistema, forma, drive, raiz e partes.
+        """
+        if not caminho or not caminho.strip():
+            return CaminhoAnalisado(caminho, "desconhecido", "vazio", "", "", (), False, "", "", "")
+
+        # Atalhos para as formas mais comuns, sem passar pela regex de prefixos
+        inicial = caminho[0]
+        if inicial == "/":
+            resto = caminho.lstrip("/")
+            primeiro = resto.split("/", 1)[0]
+            sistema: Sistema = "mac" if primeiro in _RAIZES_MAC else "posix"
+            return Ifa._montar(caminho, sistema, "absoluto", "", "/", resto, True)
+        if inicial not in "\\~fF" and caminho[1:2] != ":":
+            return Ifa._relativo(caminho)
+
+        casamento = _PREFIXO.match(caminho)
+        grupo = casamento.lastgroup if casamento else None
+        resto = caminho[casamento.end():] if casamento else caminho
+
+        if grupo == "url":
+            return Ifa._analisar_url(caminho, resto)
+        if grupo in _FORMA_DO_GRUPO:
+            forma = _FORMA_DO_GRUPO[grupo]
+            drive = casamento.group(forma)  # type: ignore[union-attr]
+            raiz = "\\" if casamento.group(f"{forma}_raiz") else ""  # type: ignore[union-attr]
+            return Ifa._montar(caminho, "windows", forma, drive, raiz, resto, True)
+        if grupo in ("drive", "drive_raiz"):
+            drive = casamento.group("drive")  # type: ignore[union-attr]
+            if casamento.group("drive_raiz"):  # type: ignore[union-attr]
+                return Ifa._montar(caminho, "windows", "absoluto", drive, "\\", resto, True)
+            return Ifa._montar(caminho, "windows", "drive_relativo", drive, "", resto, False)
+        if grupo == "home":
+            sistema = "windows" if "\\" in resto and "/" not in resto else "posix"
+            partes = (casamento.group("home"),)  # type: ignore[union-attr]
+            return Ifa._montar(caminho, sistema, "home", "", "", resto, False, partes)
+        if grupo == "raiz_windows":
+            return Ifa._montar(caminho, "windows", "raiz_relativo", "", "\\", resto, False)
+        return Ifa._relativo(caminho)
+
+    @staticmethod
+    def identificar_sistema(caminho: str) -> Sistema:
+        """Retorna apenas a família do sistema operacional do caminho."""
+        return Ifa.analisar(caminho).sistema
+
+    @staticmethod
+    def classificar_lote(caminhos: Iterable[Any], memoria: int = 65536) -> ClassificacaoLote:
+        """
+        Classifica uma sequência de caminhos em colunas compactas.
+
+        Usa exatamente as regras de ``analisar`` (as mesmas de CaminhoSOModel),
+        então o resultado de cada linha é idêntico ao da análise individual.
+        Caminhos repetidos dentro do lote são analisados uma única vez; a
+        memória dessa deduplicação é limitada a ``memoria`` caminhos distintos
+        e não interfere no cache LRU de ``analisar``.
+
+        Args:
+            caminhos: Sequência de ``str`` ou ``bytes`` (ex.: uma coluna de
+                manifesto, ou um array NumPy de strings/bytes)
+            memoria: Máximo de caminhos distintos lembrados entre linhas
+
+        Returns:
+            ClassificacaoLote com as colunas sistema, extensão, profundidade e
+            absoluto.
+        """
+        if hasattr(caminhos, "tolist"):  # arrays NumPy iteram muito mais rápido como lista
+            caminhos = caminhos.tolist()
+
+        lote = ClassificacaoLote()
+        sistemas, extensoes = lote.sistemas, lote.extensoes
+        profundidades, absolutos = lote.profundidades, lote.absolutos
+        analisar = Ifa.analisar.__wrapped__
+        vistos: dict[Any, tuple[int, str, int, int]] = {}
+
+        for caminho in caminhos:
+            linha = vistos.get(caminho)
+            if linha is None:
+                texto = caminho
+                if isinstance(texto, bytes):
+                    texto = texto.decode("utf-8", "surrogateescape")
+                analise = analisar(texto)
+                linha = (
+                    _CODIGO_SISTEMA[analise.sistema],
+                    sys.intern(analise.sufixo),
+                    len(analise.partes),
+                    int(analise.absoluto),
+                )
+                if len(vistos) >= memoria:
+                    vistos.clear()
+                vistos[caminho] = linha
+            sistemas.append(linha[0])
+            extensoes.append(linha[1])
+            profundidades.append(linha[2])
+            absolutos.append(linha[3])
+        return lote
+
+    @staticmethod
+    def _relativo(caminho: str) -> CaminhoAnalisado:
+        """Classifica um caminho relativo pelo separador que ele usa."""
+        if "\\" in caminho and "/" not in caminho:
+            return Ifa._montar(caminho, "windows", "relativo", "", "", caminho, False)
+        sistema: Sistema = "posix" if "/" in caminho else "desconhecido"
+        return Ifa._montar(caminho, sistema, "relativo", "", "", caminho, False)
+
+    @staticmethod
+    def _montar(
+        original: str,
+        sistema: Sistema,
+        forma: Forma,
+        drive: str,
+        raiz: str,
+        resto: str,
+        absoluto: bool,
+        prefixo: tuple[str, ...] = (),
+    ) -> CaminhoAnalisado:
+        """Divide o restante do caminho em partes conforme o separador do sistema."""
+        if sistema == "windows":
+            partes = tuple(filter(None, _SEPARADORES_WINDOWS.split(resto)))
+        else:
+            partes = tuple(filter(None, resto.split("/")))
+        if "." in partes:
+            partes = tuple(parte for parte in partes if parte != ".")
+        if prefixo:
+            partes = prefixo + partes
+
+        nome = partes[-1] if partes else ""
+        indice = nome.rfind(".")
+        if 0 < indice < len(nome) - 1:
+            stem, sufixo = nome[:indice], nome[indice:]
+        else:
+            stem, sufixo = nome, ""
+        return CaminhoAnalisado(
+            original, sistema, forma, drive, raiz, partes, absoluto, nome, stem, sufixo
+        )
+
+    @staticmethod
+    def _analisar_url(original: str, resto: str) -> CaminhoAnalisado:
+        """Analisa ``file://[host]/caminho`` convertendo-o para o caminho local."""
+        host, barra, caminho = resto.partition("/")
+        caminho = unquote(barra + caminho)
+        if host and host != "localhost":
+            interno = Ifa.analisar("\\\\" + host + caminho.replace("/", "\\"))
+        elif re.match(r"/[A-Za-z]:", caminho):
+            interno = Ifa.analisar(caminho[1:])
+        else:
+            interno = Ifa.analisar(caminho or "/")
+        return interno._replace(original=original, forma="url")
@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+"""
+app_cache.py
+
+Cache limitado de resultados de validação de caminhos.
+
+Evita que caminhos repetidos (digitados várias vezes na interface ou presentes
+em vários manifestos) voltem ao disco. Cada entrada guarda o resultado do
+Ogum junto com a assinatura do ``os.stat`` observado (inode, mtime, modo e
+tamanho), permitindo:
+
+- Despejo por LRU quando a capacidade é atingida;
+- Expiração por TTL (opcional);
+- Revalidação barata: um único stat decide se o resultado ainda vale;
+- Invalidação explícita por caminho ou total.
+
+Os resultados são guardados como ResultadoCompacto (ver app_compacto), que
+ocupa uma fração de um ResultadoValidacao e é lido da mesma forma.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional, TypedDict
+
+from app.utils.app_compacto import ResultadoCompacto
+from app.utils.app_normalizador import Oxala
+from app.utils.app_tools import Ogum, ResultadoValidacao
+
+
+class EstatisticasCache(TypedDict):
+    """
+    Contadores de uso do cache.
+
+    Atributos:
+        acertos (int): Consultas atendidas sem tocar o disco
+        falhas (int): Consultas que exigiram validação completa
+        despejos (int): Entradas removidas pela política LRU
+        expiracoes (int): Entradas com TTL vencido (revalidadas ou refeitas)
+        revalidacoes (int): Entradas confirmadas por um único stat
+        tamanho (int): Quantidade atual de entradas
+    """
+    acertos: int
+    falhas: int
+    despejos: int
+    expiracoes: int
+    revalidacoes: int
+    tamanho: int
+
+
+class _EntradaCache:
+    """Resultado armazenado e a assinatura do stat que o produziu."""
+
+    __slots__ = ("resultado", "st_ino", "st_mtime_ns", "st_mode", "st_size", "armazenado_em")
+
+    def __init__(
+        self,
+        resultado: ResultadoValidacao,
+        estado: Optional[os.stat_result],
+        armazenado_em: float,
+    ) -> None:
+        self.resultado = ResultadoCompacto.de_resultado(resultado)
+        self.armazenado_em = armazenado_em
+        if estado is None:
+            self.st_ino = self.st_mtime_ns = self.st_mode = self.st_size = None
+        else:
+            self.st_ino = estado.st_ino
+            self.st_mtime_ns = estado.st_mtime_ns
+            self.st_mode = estado.st_mode
+            self.st_size = estado.st_size
+
+    def confere(self, estado: Optional[os.stat_result]) -> bool:
+        """Indica se o stat atual é idêntico ao observado na validação."""
+        if estado is None:
+            return self.st_ino is None
+        return (
+            self.st_ino == estado.st_ino
+            and self.st_mtime_ns == estado.st_mtime_ns
+            and self.st_mode == estado.st_mode
+            and self.st_size == estado.st_size
+        )
+
+
+class CacheValidacao:
+    """
+    Cache LRU com TTL opcional para resultados do ``Ogum.validar``.
+
+    Seguro para uso concorrente (ex.: a partir do ``Ogum.validar_lote``). Os
+    resultados devolvidos são ResultadoCompacto imutáveis, compartilhados
+    entre consultas e lidos como um ResultadoValidacao.
+
+    Args:
+        capacidade: Número máximo de caminhos mantidos
+        ttl: Validade de cada entrada em segundos; None nunca expira
+        relogio: Fonte de tempo monotônica (substituível em testes)
+        nome: Identifica o cache nas métricas do Ogum (etapa 'cache.<nome>')
+        normalizar: Se True, caminhos equivalentes (``Oxala.normalizar``:
+            ``a//b/./c``, ``~/x``...) dividem a mesma entrada e é a forma
+            normalizada que vai ao disco e aparece no resultado
+    """
+
+    def __init__(
+        self,
+        capacidade: int = 4096,
+        ttl: Optional[float] = None,
+        relogio: Callable[[], float] = time.monotonic,
+        nome: str = "validacao",
+        normalizar: bool = False,
+    ) -> None:
+        if capacidade < 1:
+            raise ValueError("capacidade deve ser maior ou igual a 1")
+        self._capacidade = capacidade
+        self._ttl = ttl
+        self._relogio = relogio
+        self._entradas: "OrderedDict[str, _EntradaCache]" = OrderedDict()
+        self._trava = threading.Lock()
+        self._acertos = 0
+        self._falhas = 0
+        self._despejos = 0
+        self._expiracoes = 0
+        self._revalidacoes = 0
+        self._etapa = f"cache.{nome}"
+        self._normalizar: Optional[Callable[[str], str]] = Oxala.normalizar if normalizar else None
+
+    def __len__(self) -> int:
+        return len(self._entradas)
+
+    def __contains__(self, caminho: object) -> bool:
+        if self._normalizar is not None and isinstance(caminho, str):
+            caminho = self._normalizar(caminho)
+        return caminho in self._entradas
+
+    def validar(self, caminho: str) -> ResultadoCompacto:
+        """
+        Retorna o resultado do caminho, validando no disco apenas em caso de falha.
+
+        Entradas com TTL vencido não são descartadas às cegas: um único stat
+        confirma se o caminho mudou; se não mudou, a entrada é renovada.
+        """
+        if self._normalizar is not None:
+            caminho = self._normalizar(caminho)
+        with self._trava:
+            entrada = self._entradas.get(caminho)
+            if entrada is not None:
+                if not self._expirada(entrada):
+                    self._entradas.move_to_end(caminho)
+                    self._acertos += 1
+                    if Ogum.metricas.ativo:
+                        Ogum.metricas.contar(self._etapa, "acertos")
+                    return entrada.resultado
+                self._expiracoes += 1
+
+        if entrada is not None:
+            return self.revalidar(caminho)
+
+        resultado, estado = Ogum.validar_com_stat(caminho)
+        if Ogum.metricas.ativo:
+            Ogum.metricas.contar(self._etapa, "falhas")
+        with self._trava:
+            self._falhas += 1
+            return self._armazenar(caminho, resultado, estado)
+
+    def obter(self, caminho: str) -> Optional[ResultadoCompacto]:
+        """Consulta apenas o cache, sem nunca tocar o disco."""
+        if self._normalizar is not None:
+            caminho = self._normalizar(caminho)
+        with self._trava:
+            entrada = self._entradas.get(caminho)
+            if entrada is None or self._expirada(entrada):
+                return None
+            self._entradas.move_to_end(caminho)
+            self._acertos += 1
+            if Ogum.metricas.ativo:
+                Ogum.metricas.contar(self._etapa, "acertos")
+            return entrada.resultado
+
+    def revalidar(self, caminho: str) -> ResultadoCompacto:
+        """
+        Confirma a entrada do caminho com um único stat.
+
+        Se inode, mtime, modo e tamanho forem os mesmos já vistos, o resultado
+        armazenado é mantido e seu TTL renovado; caso contrário o caminho é
+        validado de novo por completo.
+        """
+        if self._normalizar is not None:
+            caminho = self._normalizar(caminho)
+        with self._trava:
+            entrada = self._entradas.get(caminho)
+
+        if entrada is not None and Ogum.metricas.ativo:
+            Ogum.metricas.contar(self._etapa, "syscalls")  # O stat da confirmação
+        if entrada is not None and entrada.confere(Ogum.obter_stat(caminho)):
+            with self._trava:
+                entrada.armazenado_em = self._relogio()
+                self._revalidacoes += 1
+                if caminho in self._entradas:
+                    self._entradas.move_to_end(caminho)
+            if Ogum.metricas.ativo:
+                Ogum.metricas.contar(self._etapa, "revalidacoes")
+            return entrada.resultado
+
+        resultado, estado = Ogum.validar_com_stat(caminho)
+        if Ogum.metricas.ativo:
+            Ogum.metricas.contar(self._etapa, "falhas")
+        with self._trava:
+            self._falhas += 1
+            return self._armazenar(caminho, resultado, estado)
+
+    def invalidar(self, caminho: str) -> bool:
+        """Remove o caminho do cache. Retorna True se havia uma entrada."""
+        if self._normalizar is not None:
+            caminho = self._normalizar(caminho)
+        with self._trava:
+            return self._entradas.pop(caminho, None) is not None
+
+    def limpar(self) -> None:
+        """Remove todas as entradas, preservando os contadores."""
+        with self._trava:
+            self._entradas.clear()
+
+    @property
+    def estatisticas(self) -> EstatisticasCache:
+        """Fotografia dos contadores de uso do cache."""
+        with self._trava:
+            return {
+                "acertos": self._acertos,
+                "falhas": self._falhas,
+                "despejos": self._despejos,
+                "expiracoes": self._expiracoes,
+                "revalidacoes": self._revalidacoes,
+                "tamanho": len(self._entradas),
+            }
+
+    def _expirada(self, entrada: _EntradaCache) -> bool:
+        """Verifica o TTL da entrada. Deve ser chamado com a trava adquirida."""
+        return self._ttl is not None and self._relogio() - entrada.armazenado_em >= self._ttl
+
+    def _armazenar(
+        self,
+        caminho: str,
+        resultado: ResultadoValidacao,
+        estado: Optional[os.stat_result],
+    ) -> ResultadoCompacto:
+        """Guarda a entrada e aplica o LRU. Deve ser chamado com a trava adquirida."""
+        entrada = _EntradaCache(resultado, estado, self._relogio())
+        self._entradas[caminho] = entrada
+        self._entradas.move_to_end(caminho)
+        while len(self._entradas) > self._capacidade:
+            self._entradas.popitem(last=False)
+            self._despejos += 1
+        return entrada.resultado
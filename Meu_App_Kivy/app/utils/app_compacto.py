@@ -0,0 +1,302 @@
+# -*- coding: utf-8 -*-
+"""
+app_compacto.py
+
+Representações compactas dos resultados de validação.
+
+Um ``ResultadoValidacao`` é um dicionário com chaves de texto e uma mensagem
+por caminho; com milhões de caminhos isso ocupa gigabytes. Este módulo oferece:
+
+- TipoCaminho: o campo ``tipo`` como um inteiro pequeno;
+- ResultadoCompacto: registro com ``__slots__`` para um único resultado, com
+  leitura compatível com dicionário (``r["valido"]``, ``r.get``, ``dict(r)``);
+- LoteResultados: contêiner colunar para muitos resultados, com as flags
+  valido/legivel/vazio num único byte e os diretórios dos caminhos internados
+  (cada diretório é guardado uma única vez, não uma vez por arquivo).
+"""
+
+import sys
+from array import array
+from collections.abc import Mapping
+from enum import IntEnum
+from typing import Any, Callable, Iterable, Iterator, Literal, Optional
+
+from app.mensagens.app_mensageiro import Exu, Mensagem
+from app.utils.app_tools import ResultadoValidacao
+
+BIT_VALIDO = 0b001
+BIT_LEGIVEL = 0b010
+BIT_VAZIO = 0b100
+
+# Tabela fixa de códigos de mensagem: cada resultado guarda apenas o índice
+CODIGOS: tuple[str, ...] = tuple(sorted(Exu.CODIGOS))
+_INDICE_CODIGO: dict[str, int] = {codigo: indice for indice, codigo in enumerate(CODIGOS)}
+
+_CHAVES: tuple[str, ...] = ("caminho", "valido", "legivel", "tipo", "vazio", "mensagem")
+
+# Resultados examinados entre duas consultas ao sinal de cancelamento
+_BLOCO_SELECAO = 65536
+
+Ordem = Literal["caminho", "nome", "tipo", "extensao"]
+
+
+class TipoCaminho(IntEnum):
+    """Tipo do caminho codificado como inteiro."""
+
+    DESCONHECIDO = 0
+    ARQUIVO = 1
+    DIRETORIO = 2
+
+    @property
+    def rotulo(self) -> Literal["arquivo", "diretorio", "desconhecido"]:
+        """Texto usado em ResultadoValidacao['tipo']."""
+        return _ROTULOS[self]
+
+    @classmethod
+    def de_rotulo(cls, rotulo: str) -> "TipoCaminho":
+        """Converte 'arquivo'/'diretorio'/'desconhecido' no inteiro correspondente."""
+        return _TIPOS_POR_ROTULO.get(rotulo, cls.DESCONHECIDO)
+
+
+_ROTULOS: dict[TipoCaminho, Literal["arquivo", "diretorio", "desconhecido"]] = {
+    TipoCaminho.DESCONHECIDO: "desconhecido",
+    TipoCaminho.ARQUIVO: "arquivo",
+    TipoCaminho.DIRETORIO: "diretorio",
+}
+_TIPOS_POR_ROTULO: dict[str, TipoCaminho] = {rotulo: tipo for tipo, rotulo in _ROTULOS.items()}
+
+
+def _sufixo(nome: str) -> str:
+    """Extensão de um nome em minúsculas, com a mesma regra de ``Path.suffix``."""
+    indice = nome.rfind(".")
+    return nome[indice:].lower() if 0 < indice < len(nome) - 1 else ""
+
+
+def _empacotar(resultado: Mapping) -> tuple[int, int, int]:
+    """Converte um ResultadoValidacao em (flags, tipo, índice do código)."""
+    flags = (
+        (BIT_VALIDO if resultado["valido"] else 0)
+        | (BIT_LEGIVEL if resultado["legivel"] else 0)
+        | (BIT_VAZIO if resultado["vazio"] else 0)
+    )
+    mensagem = resultado["mensagem"]
+    if not isinstance(mensagem, Mensagem) or mensagem.dados:
+        raise ValueError(f"Mensagem não compactável: {mensagem!r}")
+    return flags, TipoCaminho.de_rotulo(resultado["tipo"]), _INDICE_CODIGO[mensagem.codigo]
+
+
+class ResultadoCompacto(Mapping):
+    """
+    Resultado de validação de um caminho em quatro slots.
+
+    Lido como um ResultadoValidacao: ``r["tipo"]`` devolve o texto do tipo e
+    ``r["mensagem"]`` uma Mensagem adiada, criada apenas quando acessada.
+    """
+
+    __slots__ = ("caminho", "_flags", "_tipo", "_codigo")
+
+    def __init__(self, caminho: str, flags: int, tipo: int, codigo: int) -> None:
+        self.caminho = caminho
+        self._flags = flags
+        self._tipo = tipo
+        self._codigo = codigo
+
+    @classmethod
+    def de_resultado(cls, resultado: Mapping) -> "ResultadoCompacto":
+        """Compacta um ResultadoValidacao (ou outro mapeamento equivalente)."""
+        if isinstance(resultado, ResultadoCompacto):
+            return resultado
+        return cls(resultado["caminho"], *_empacotar(resultado))
+
+    @property
+    def valido(self) -> bool:
+        return bool(self._flags & BIT_VALIDO)
+
+    @property
+    def legivel(self) -> bool:
+        return bool(self._flags & BIT_LEGIVEL)
+
+    @property
+    def vazio(self) -> bool:
+        return bool(self._flags & BIT_VAZIO)
+
+    @property
+    def tipo(self) -> Literal["arquivo", "diretorio", "desconhecido"]:
+        return _ROTULOS[TipoCaminho(self._tipo)]
+
+    @property
+    def mensagem(self) -> Mensagem:
+        return Mensagem(CODIGOS[self._codigo], self.caminho)
+
+    def __getitem__(self, chave: str) -> Any:
+        if chave not in _CHAVES:
+            raise KeyError(chave)
+        return getattr(self, chave)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_CHAVES)
+
+    def __len__(self) -> int:
+        return len(_CHAVES)
+
+    def __repr__(self) -> str:
+        return f"ResultadoCompacto({dict(self)!r})"
+
+    def to_dict(self) -> ResultadoValidacao:
+        """Expande o registro de volta para um ResultadoValidacao."""
+        return {
+            "caminho": self.caminho,
+            "valido": self.valido,
+            "legivel": self.legivel,
+            "tipo": self.tipo,
+            "vazio": self.vazio,
+            "mensagem": self.mensagem,
+        }
+
+
+class LoteResultados:
+    """
+    Contêiner colunar de resultados de validação.
+
+    Cada resultado ocupa um índice de diretório (4 bytes), uma referência ao
+    nome (internado com ``sys.intern``) e três bytes para flags, tipo e código
+    da mensagem. Os registros só são materializados quando acessados.
+
+    Args:
+        resultados: Resultados iniciais (dicionários ou ResultadoCompacto)
+    """
+
+    def __init__(self, resultados: Iterable[Mapping] = ()) -> None:
+        self._pastas: list[str] = []
+        self._indice_pasta: dict[str, int] = {}
+        self._pasta = array("I")
+        self._nomes: list[str] = []
+        self._flags = bytearray()
+        self._tipos = bytearray()
+        self._codigos = bytearray()
+        self.estender(resultados)
+
+    def __len__(self) -> int:
+        return len(self._nomes)
+
+    def __getitem__(self, indice: int) -> ResultadoCompacto:
+        return ResultadoCompacto(
+            self.caminho(indice), self._flags[indice], self._tipos[indice], self._codigos[indice]
+        )
+
+    def __iter__(self) -> Iterator[ResultadoCompacto]:
+        for indice in range(len(self)):
+            yield self[indice]
+
+    def adicionar(self, resultado: Mapping) -> None:
+        """Acrescenta um resultado ao final do lote."""
+        if isinstance(resultado, ResultadoCompacto):
+            caminho = resultado.caminho
+            flags, tipo, codigo = resultado._flags, resultado._tipo, resultado._codigo
+        else:
+            caminho = resultado["caminho"]
+            flags, tipo, codigo = _empacotar(resultado)
+
+        corte = max(caminho.rfind("/"), caminho.rfind("\\")) + 1
+        pasta, nome = caminho[:corte], caminho[corte:]
+        indice = self._indice_pasta.get(pasta)
+        if indice is None:
+            indice = self._indice_pasta[pasta] = len(self._pastas)
+            self._pastas.append(pasta)
+
+        self._pasta.append(indice)
+        self._nomes.append(sys.intern(nome))
+        self._flags.append(flags)
+        self._tipos.append(tipo)
+        self._codigos.append(codigo)
+
+    def estender(self, resultados: Iterable[Mapping]) -> None:
+        """Acrescenta vários resultados, consumindo o iterável sob demanda."""
+        for resultado in resultados:
+            self.adicionar(resultado)
+
+    def caminho(self, indice: int) -> str:
+        """Reconstrói o caminho original do resultado ``indice``."""
+        return self._pastas[self._pasta[indice]] + self._nomes[indice]
+
+    def flags(self, indice: int) -> int:
+        """Flags empacotadas (BIT_VALIDO | BIT_LEGIVEL | BIT_VAZIO) do resultado."""
+        return self._flags[indice]
+
+    def tipo(self, indice: int) -> TipoCaminho:
+        """Tipo do resultado ``indice`` sem materializar o registro."""
+        return TipoCaminho(self._tipos[indice])
+
+    def extensao(self, indice: int) -> str:
+        """Extensão (em minúsculas) do nome do resultado ``indice``."""
+        return _sufixo(self._nomes[indice])
+
+    def selecionar(
+        self,
+        tipo: Optional[str] = None,
+        vazio: Optional[bool] = None,
+        extensao: Optional[str] = None,
+        ordem: Optional[Ordem] = None,
+        decrescente: bool = False,
+        desde: int = 0,
+        ate: Optional[int] = None,
+        cancelado: Optional[Callable[[], bool]] = None,
+    ) -> array:
+        """
+        Índices dos resultados que passam nos filtros, na ordem pedida.
+
+        Pensado para rodar fora da thread da interface: só lê as colunas, e
+        ``cancelado`` é consultado a cada bloco de resultados para abandonar
+        uma seleção que ficou obsoleta.
+
+        Args:
+            tipo: 'arquivo', 'diretorio' ou 'desconhecido'; None não filtra
+            vazio: Filtra pela flag de vazio; None não filtra
+            extensao: Extensão exigida (ex.: '.txt' ou 'txt', sem diferenciar
+                maiúsculas); '' seleciona nomes sem extensão
+            ordem: Campo de ordenação; None mantém a ordem de inserção
+            decrescente: Inverte a ordenação
+            desde: Ignora os primeiros ``desde`` resultados (com ``ate``,
+                seleciona só os acrescentados desde a seleção anterior)
+            ate: Considera apenas os primeiros ``ate`` resultados (útil
+                enquanto outro thread ainda acrescenta resultados)
+            cancelado: Função que, ao retornar True, interrompe a seleção
+
+        Returns:
+            array('I') de índices (vazio se a seleção foi cancelada).
+        """
+        total = len(self) if ate is None else min(ate, len(self))
+        if extensao:
+            extensao = ("" if extensao.startswith(".") else ".") + extensao.lower()
+        tipo_alvo = None if tipo is None else TipoCaminho.de_rotulo(tipo)
+        nomes, flags, tipos = self._nomes, self._flags, self._tipos
+
+        if tipo_alvo is None and vazio is None and extensao is None:
+            indices = array("I", range(desde, total))
+        else:
+            indices = array("I")
+            for inicio in range(desde, total, _BLOCO_SELECAO):
+                if cancelado is not None and cancelado():
+                    return array("I")
+                for indice in range(inicio, min(inicio + _BLOCO_SELECAO, total)):
+                    if tipo_alvo is not None and tipos[indice] != tipo_alvo:
+                        continue
+                    if vazio is not None and bool(flags[indice] & BIT_VAZIO) != vazio:
+                        continue
+                    if extensao is not None and _sufixo(nomes[indice]) != extensao:
+                        continue
+                    indices.append(indice)
+
+        if ordem is None:
+            if decrescente:
+                indices.reverse()
+            return indices
+        if cancelado is not None and cancelado():
+            return array("I")
+        chaves: dict[str, Callable[[int], Any]] = {
+            "caminho": self.caminho,
+            "nome": nomes.__getitem__,
+            "tipo": tipos.__getitem__,
+            "extensao": self.extensao,
+        }
+        return array("I", sorted(indices, key=chaves[ordem], reverse=decrescente))
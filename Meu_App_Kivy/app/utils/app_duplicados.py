@@ -0,0 +1,304 @@
+# -*- coding: utf-8 -*-
+"""
+app_duplicados.py
+
+Detecção de arquivos duplicados em árvores de diretórios.
+
+Ibeji, os gêmeos, reconhece arquivos de conteúdo idêntico lendo o mínimo
+possível do disco. Os arquivos vêm da varredura do Oxossi (que já traz o
+tamanho de cada um) e passam por três peneiras, cada uma aplicada apenas aos
+que sobreviveram à anterior:
+
+1. Tamanho: arquivos com tamanho único não podem ter duplicata e nunca são
+   abertos;
+2. Resumo parcial: hash do início e do fim do arquivo (alguns KiB de cada);
+   para arquivos pequenos essas amostras já cobrem todo o conteúdo;
+3. Resumo completo: hash de todo o conteúdo, lido em blocos grandes.
+
+As leituras das etapas 2 e 3 rodam num pool de threads: o ``hashlib`` libera
+o GIL ao processar blocos grandes, então a leitura de um arquivo se sobrepõe
+ao hash de outro.
+
+Links físicos para o mesmo arquivo (mesmo dispositivo e inode) são contados
+uma única vez, pois não ocupam espaço extra.
+"""
+
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Callable, Iterable, NamedTuple, Optional, Union
+
+from app.utils.app_varredura import Oxossi
+
+# Bytes lidos do início e do fim de cada arquivo na peneira parcial
+AMOSTRA_PADRAO = 4096
+# Tamanho de cada leitura no resumo completo
+BLOCO_PADRAO = 1 << 20
+# Arquivos entregues ao pool de threads de cada vez
+_FATIA = 1024
+
+
+class GrupoDuplicados(NamedTuple):
+    """
+    Arquivos com o mesmo conteúdo.
+
+    Atributos:
+        tamanho (int): Tamanho de cada arquivo do grupo, em bytes
+        resumo (str): Hash hexadecimal do conteúdo
+        caminhos (tuple[str, ...]): Arquivos do grupo, em ordem alfabética
+    """
+    tamanho: int
+    resumo: str
+    caminhos: tuple[str, ...]
+
+    @property
+    def desperdicio(self) -> int:
+        """Bytes que seriam liberados mantendo apenas uma cópia."""
+        return self.tamanho * (len(self.caminhos) - 1)
+
+
+class RelatorioDuplicados(NamedTuple):
+    """
+    Resultado de ``Ibeji.encontrar``.
+
+    Atributos:
+        grupos (list[GrupoDuplicados]): Grupos, do maior desperdício ao menor
+        arquivos (int): Arquivos considerados (após o tamanho mínimo)
+        candidatos (int): Arquivos que compartilham tamanho com outro
+        resumos_parciais (int): Arquivos lidos na peneira parcial
+        resumos_completos (int): Arquivos lidos por inteiro
+        bytes_lidos (int): Total de bytes lidos do disco
+        erros (tuple[str, ...]): Arquivos que não puderam ser lidos ou mudaram
+            durante a leitura (ficam fora dos grupos)
+    """
+    grupos: list[GrupoDuplicados]
+    arquivos: int
+    candidatos: int
+    resumos_parciais: int
+    resumos_completos: int
+    bytes_lidos: int
+    erros: tuple[str, ...]
+
+    @property
+    def desperdicio(self) -> int:
+        """Bytes ocupados por cópias redundantes em todos os grupos."""
+        return sum(grupo.desperdicio for grupo in self.grupos)
+
+
+class Ibeji:
+    """
+    Gêmeos sagrados - Encontram arquivos de conteúdo idêntico.
+
+    Métodos principais:
+        encontrar: Varre as raízes e agrupa os arquivos duplicados
+        resumo_parcial: Hash do início e do fim de um arquivo
+        resumo_completo: Hash de todo o conteúdo, em blocos
+    """
+
+    @staticmethod
+    def encontrar(
+        raizes: Union[str, Iterable[str]],
+        tamanho_minimo: int = 1,
+        amostra: int = AMOSTRA_PADRAO,
+        bloco: int = BLOCO_PADRAO,
+        workers: int = 4,
+        algoritmo: str = "blake2b",
+        excluir: Iterable[str] = (),
+        cancelado: Optional[Callable[[], bool]] = None,
+    ) -> RelatorioDuplicados:
+        """
+        Procura arquivos duplicados sob ``raizes``.
+
+        Args:
+            raizes: Diretório (ou arquivo) inicial, ou vários
+            tamanho_minimo: Arquivos menores são ignorados (o padrão deixa de
+                fora os vazios, todos idênticos entre si)
+            amostra: Bytes lidos do início e do fim na peneira parcial
+            bloco: Tamanho de cada leitura no resumo completo
+            workers: Threads de leitura
+            algoritmo: Nome do hash no ``hashlib``
+            excluir: Padrões glob repassados ao ``Oxossi.varrer``
+            cancelado: Consultado entre as peneiras; se devolver True a busca
+                termina com os grupos já confirmados
+
+        Returns:
+            RelatorioDuplicados com os grupos e os totais de cada peneira.
+        """
+        if isinstance(raizes, str):
+            raizes = (raizes,)
+        excluir = tuple(excluir)
+        cancelar = cancelado or (lambda: False)
+
+        # Peneira 1: tamanho (nenhum arquivo é aberto)
+        por_tamanho: dict[int, list[str]] = {}
+        vistos: set[tuple[int, int, int, int]] = set()
+        arquivos = 0
+        for raiz in raizes:
+            for registro in Oxossi.varrer(raiz, excluir=excluir):
+                if registro["tipo"] != "arquivo" or not registro["legivel"]:
+                    continue
+                tamanho = registro["tamanho"]
+                if tamanho < tamanho_minimo:
+                    continue
+                # Links físicos do mesmo inode não são cópias; o inode só
+                # identifica o arquivo dentro do seu sistema de arquivos
+                if registro["inode"]:
+                    identidade = (
+                        registro["dispositivo"], registro["inode"], tamanho, registro["mtime_ns"]
+                    )
+                    if identidade in vistos:
+                        continue
+                    vistos.add(identidade)
+                arquivos += 1
+                por_tamanho.setdefault(tamanho, []).append(registro["caminho"])
+
+        candidatos = [
+            (tamanho, caminho)
+            for tamanho, caminhos in por_tamanho.items() if len(caminhos) > 1
+            for caminho in caminhos
+        ]
+        del por_tamanho, vistos
+
+        erros: list[str] = []
+        bytes_lidos = 0
+        lidos_parcial = lidos_completo = 0
+        grupos: list[GrupoDuplicados] = []
+
+        with ThreadPoolExecutor(max(1, workers), thread_name_prefix="ibeji") as executor:
+
+            def peneirar(
+                funcao: Callable[..., tuple[str, int]], parametro: int, entradas: list
+            ) -> dict[tuple[int, str], list[str]]:
+                """Resume as entradas no pool e as agrupa por (tamanho, resumo)."""
+                nonlocal bytes_lidos
+                iguais: dict[tuple[int, str], list[str]] = {}
+                # Em fatias, para não criar um Future por arquivo de uma só vez
+                for inicio in range(0, len(entradas), _FATIA):
+                    fatia = entradas[inicio:inicio + _FATIA]
+                    leituras = executor.map(
+                        lambda par: Ibeji._tentar(funcao, par[1], par[0], parametro, algoritmo),
+                        fatia,
+                    )
+                    for (tamanho, caminho), (resumo, lidos) in zip(fatia, leituras):
+                        bytes_lidos += lidos
+                        if resumo is None:
+                            erros.append(caminho)
+                        else:
+                            iguais.setdefault((tamanho, resumo), []).append(caminho)
+                return iguais
+
+            # Peneira 2: início e fim de cada candidato
+            completos: list[tuple[int, str]] = []
+            if candidatos and not cancelar():
+                lidos_parcial = len(candidatos)
+                for (tamanho, resumo), caminhos in peneirar(
+                    Ibeji.resumo_parcial, amostra, candidatos
+                ).items():
+                    if len(caminhos) < 2:
+                        continue
+                    if tamanho <= 2 * amostra:
+                        # As amostras cobriram o arquivo inteiro: resumo definitivo
+                        grupos.append(GrupoDuplicados(tamanho, resumo, tuple(sorted(caminhos))))
+                    else:
+                        completos.extend((tamanho, caminho) for caminho in caminhos)
+
+            # Peneira 3: conteúdo completo dos que ainda empatam
+            if completos and not cancelar():
+                lidos_completo = len(completos)
+                grupos.extend(
+                    GrupoDuplicados(tamanho, resumo, tuple(sorted(caminhos)))
+                    for (tamanho, resumo), caminhos in peneirar(
+                        Ibeji.resumo_completo, bloco, completos
+                    ).items()
+                    if len(caminhos) > 1
+                )
+
+        grupos.sort(key=lambda grupo: (-grupo.desperdicio, grupo.caminhos))
+        return RelatorioDuplicados(
+            grupos=grupos,
+            arquivos=arquivos,
+            candidatos=len(candidatos),
+            resumos_parciais=lidos_parcial,
+            resumos_completos=lidos_completo,
+            bytes_lidos=bytes_lidos,
+            erros=tuple(erros),
+        )
+
+    @staticmethod
+    def resumo_parcial(
+        caminho: str, tamanho: int, amostra: int = AMOSTRA_PADRAO, algoritmo: str = "blake2b"
+    ) -> tuple[str, int]:
+        """
+        Hash das primeiras e das últimas ``amostra`` bytes do arquivo.
+
+        Quando o arquivo tem até ``2 * amostra`` bytes, ele é lido por inteiro.
+
+        Returns:
+            Tupla (resumo hexadecimal, bytes lidos).
+
+        Raises:
+            OSError: Se o arquivo não puder ser lido ou não tiver mais ``tamanho`` bytes
+        """
+        resumo = hashlib.new(algoritmo)
+        with open(caminho, "rb", buffering=0) as arquivo:
+            if tamanho <= 2 * amostra:
+                resumo.update(Ibeji._ler_exato(arquivo, tamanho))
+                return resumo.hexdigest(), tamanho
+            resumo.update(Ibeji._ler_exato(arquivo, amostra))
+            arquivo.seek(tamanho - amostra)
+            resumo.update(Ibeji._ler_exato(arquivo, amostra))
+        return resumo.hexdigest(), 2 * amostra
+
+    @staticmethod
+    def resumo_completo(
+        caminho: str, tamanho: int, bloco: int = BLOCO_PADRAO, algoritmo: str = "blake2b"
+    ) -> tuple[str, int]:
+        """
+        Hash de todo o conteúdo, lido em blocos de ``bloco`` bytes num único buffer.
+
+        Returns:
+            Tupla (resumo hexadecimal, bytes lidos).
+
+        Raises:
+            OSError: Se o arquivo não puder ser lido ou mudou de tamanho
+        """
+        resumo = hashlib.new(algoritmo)
+        buffer = bytearray(min(bloco, max(tamanho, 1)))
+        visao = memoryview(buffer)
+        lidos = 0
+        with open(caminho, "rb", buffering=0) as arquivo:
+            while True:
+                quantidade = arquivo.readinto(buffer)
+                if not quantidade:
+                    break
+                resumo.update(visao[:quantidade])
+                lidos += quantidade
+        if lidos != tamanho:
+            raise OSError(f"tamanho mudou durante a leitura: {caminho}")
+        return resumo.hexdigest(), lidos
+
+    @staticmethod
+    def _ler_exato(arquivo: BinaryIO, quantidade: int) -> bytes:
+        """Lê ``quantidade`` bytes da posição atual; falha se o arquivo encolheu."""
+        partes: list[bytes] = []
+        restante = quantidade
+        while restante:
+            dados = arquivo.read(restante)
+            if not dados:
+                raise OSError("arquivo menor que o tamanho observado na varredura")
+            partes.append(dados)
+            restante -= len(dados)
+        return b"".join(partes)
+
+    @staticmethod
+    def _tentar(
+        funcao: Callable[[str, int, int, str], tuple[str, int]],
+        caminho: str,
+        tamanho: int,
+        parametro: int,
+        algoritmo: str,
+    ) -> tuple[Optional[str], int]:
+        """Executa ``funcao`` no pool; uma falha de leitura vira (None, 0)."""
+        try:
+            return funcao(caminho, tamanho, parametro, algoritmo)
+        except (OSError, ValueError):
+            return None, 0
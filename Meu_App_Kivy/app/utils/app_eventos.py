@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=E0401, C0413
+"""
+app_eventos.py
+
+Canal de eventos estruturados emitidos durante as validações.
+
+Substitui os ``print`` espalhados no caminho crítico por um observador
+plugável. Cada evento carrega apenas um código (o nome da mensagem do Exu) e
+o caminho; nenhum texto é formatado no momento da emissão.
+
+- CanalEventos: ponto de emissão; sem ouvintes, emitir é praticamente gratuito.
+- OuvinteLogging: encaminha eventos para o ``logging``, formatando a mensagem
+  do Exu apenas se o nível estiver habilitado.
+- ColetorMemoria: guarda os últimos eventos em memória (útil em testes e na UI).
+"""
+
+import logging
+import threading
+from collections import deque
+from typing import Callable, NamedTuple, Optional
+
+from app.mensagens.app_mensageiro import Exu
+
+
+class Evento(NamedTuple):
+    """
+    Evento emitido por uma etapa de validação.
+
+    Atributos:
+        codigo (str): Nome do método do Exu que descreve o evento
+        caminho (str): Caminho ao qual o evento se refere
+        dados (tuple): Argumentos adicionais da mensagem, se houver
+    """
+    codigo: str
+    caminho: str
+    dados: tuple = ()
+
+    def renderizar(self) -> str:
+        """Converte o evento no texto do Exu correspondente."""
+        return getattr(Exu, self.codigo)(self.caminho, *self.dados)
+
+
+Ouvinte = Callable[[Evento], None]
+
+
+class CanalEventos:
+    """
+    Distribui eventos para os ouvintes inscritos.
+
+    O atributo ``ativo`` permite ao código quente pular até a criação do
+    evento quando ninguém está ouvindo::
+
+        if canal.ativo:
+            canal.emitir("caminho_encontrado", caminho)
+    """
+
+    def __init__(self) -> None:
+        self._ouvintes: tuple[Ouvinte, ...] = ()
+        self._trava = threading.Lock()
+        self.ativo = False
+
+    def inscrever(self, ouvinte: Ouvinte) -> Ouvinte:
+        """Registra um ouvinte e o devolve (permite uso como decorador)."""
+        with self._trava:
+            self._ouvintes = (*self._ouvintes, ouvinte)
+            self.ativo = True
+        return ouvinte
+
+    def cancelar(self, ouvinte: Ouvinte) -> None:
+        """Remove um ouvinte previamente inscrito (ignora se não estiver)."""
+        with self._trava:
+            self._ouvintes = tuple(o for o in self._ouvintes if o is not ouvinte)
+            self.ativo = bool(self._ouvintes)
+
+    def emitir(self, codigo: str, caminho: str, *dados: object) -> None:
+        """Entrega o evento a todos os ouvintes; não faz nada se não houver nenhum."""
+        ouvintes = self._ouvintes
+        if not ouvintes:
+            return
+        evento = Evento(codigo, caminho, dados)
+        for ouvinte in ouvintes:
+            ouvinte(evento)
+
+
+class _TextoPreguicoso:
+    """Adia a renderização do evento até o ``logging`` realmente precisar do texto."""
+
+    __slots__ = ("_evento",)
+
+    def __init__(self, evento: Evento) -> None:
+        self._evento = evento
+
+    def __str__(self) -> str:
+        return self._evento.renderizar()
+
+
+class OuvinteLogging:
+    """
+    Ouvinte que registra os eventos num ``logging.Logger``.
+
+    Args:
+        logger: Logger de destino (padrão: ``app.eventos``)
+        nivel: Nível usado para todos os eventos
+    """
+
+    def __init__(self, logger: Optional[logging.Logger] = None, nivel: int = logging.DEBUG):
+        self._logger = logger or logging.getLogger("app.eventos")
+        self._nivel = nivel
+
+    def __call__(self, evento: Evento) -> None:
+        if self._logger.isEnabledFor(self._nivel):
+            self._logger.log(self._nivel, "%s", _TextoPreguicoso(evento))
+
+
+class ColetorMemoria:
+    """
+    Ouvinte que mantém os últimos eventos recebidos.
+
+    Args:
+        limite: Quantidade máxima de eventos guardados; None guarda todos
+    """
+
+    def __init__(self, limite: Optional[int] = 1000):
+        self._eventos: deque[Evento] = deque(maxlen=limite)
+
+    def __call__(self, evento: Evento) -> None:
+        self._eventos.append(evento)
+
+    @property
+    def eventos(self) -> list[Evento]:
+        """Cópia dos eventos coletados, do mais antigo ao mais recente."""
+        return list(self._eventos)
+
+    def limpar(self) -> None:
+        """Descarta os eventos coletados."""
+        self._eventos.clear()
@@ -0,0 +1,430 @@
+# -*- coding: utf-8 -*-
+"""
+app_indice.py
+
+Índice persistente (SQLite) dos resultados de validação de uma árvore.
+
+Nanã, guardiã da memória antiga, lembra o que foi visto na última varredura
+para que a próxima só volte ao disco onde algo mudou. Cada entrada guarda o
+resultado do Ogum (flags, tipo e código da mensagem) junto com tamanho, mtime,
+ctime e inode.
+
+Como funciona a re-varredura (``Nana.atualizar``):
+
+- Um diretório cujo (inode, mtime, ctime) não mudou tem o mesmo conjunto de
+  filhos: ele não é listado de novo e seus arquivos são reaproveitados do
+  índice. Apenas os subdiretórios conhecidos recebem um stat, porque uma
+  alteração dentro deles não muda o mtime do pai;
+- Um diretório alterado é listado; filhos que sumiram são removidos do índice
+  com toda a sua subárvore;
+- Alterações no conteúdo de um arquivo não mudam o mtime do diretório; use
+  ``verificar_arquivos=True`` para também conferir o stat de cada arquivo.
+
+As consultas (``diretorios_vazios``, ``ilegiveis``, ``por_extensao``...) leem
+apenas o banco, sem tocar o sistema de arquivos.
+
+Os caminhos são guardados como bytes (``os.fsencode``), então nomes que não
+são UTF-8 válido atravessam o índice sem perdas. Links simbólicos não são
+indexados, como na política padrão do Oxossi.
+"""
+
+import os
+import sqlite3
+import stat
+from typing import Iterator, Optional, TypedDict
+
+from app.mensagens.app_mensageiro import Mensagem
+from app.utils.app_compacto import BIT_LEGIVEL, BIT_VALIDO, BIT_VAZIO, TipoCaminho
+from app.utils.app_tools import Ogum, ResultadoValidacao
+from app.utils.app_varredura import _extensao
+
+VERSAO_ESQUEMA = 1
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS entradas (
+    caminho  BLOB PRIMARY KEY,
+    pai      BLOB NOT NULL,
+    flags    INTEGER NOT NULL,
+    tipo     INTEGER NOT NULL,
+    codigo   TEXT NOT NULL,
+    tamanho  INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    ctime_ns INTEGER NOT NULL,
+    inode    INTEGER NOT NULL,
+    extensao BLOB NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS entradas_pai ON entradas (pai);
+CREATE INDEX IF NOT EXISTS entradas_extensao ON entradas (extensao, caminho);
+"""
+
+_COLUNAS = "caminho, flags, tipo, codigo, tamanho, mtime_ns, inode"
+
+_SEPARADOR = os.fsencode(os.sep)
+
+
+class RegistroIndice(ResultadoValidacao):
+    """
+    Entrada lida do índice.
+
+    Atributos (além dos de ResultadoValidacao):
+        tamanho (int): ``st_size`` observado na última varredura
+        mtime_ns (int): ``st_mtime_ns`` observado na última varredura
+        inode (int): ``st_ino`` observado na última varredura
+    """
+    tamanho: int
+    mtime_ns: int
+    inode: int
+
+
+class EstatisticasIndice(TypedDict):
+    """
+    Resumo de uma chamada a ``Nana.atualizar``.
+
+    Atributos:
+        diretorios_listados (int): Diretórios novos ou alterados, lidos com scandir
+        diretorios_reaproveitados (int): Diretórios inalterados, não listados
+        stats (int): Chamadas de stat feitas na atualização
+        inseridos (int): Entradas novas no índice
+        atualizados (int): Entradas existentes regravadas
+        removidos (int): Entradas apagadas (inclui subárvores)
+    """
+    diretorios_listados: int
+    diretorios_reaproveitados: int
+    stats: int
+    inseridos: int
+    atualizados: int
+    removidos: int
+
+
+def _faixa(caminho: bytes) -> tuple[bytes, bytes]:
+    """Limites [inicio, fim) das chaves de todos os descendentes de ``caminho``."""
+    prefixo = caminho if caminho.endswith(_SEPARADOR) else caminho + _SEPARADOR
+    return prefixo, prefixo[:-1] + bytes((prefixo[-1] + 1,))
+
+
+def _mesmo_diretorio(linha: Optional[tuple], estado: os.stat_result) -> bool:
+    """Indica se o diretório indexado em ``linha`` não mudou desde a varredura."""
+    return (
+        linha is not None
+        and linha[1] == TipoCaminho.DIRETORIO
+        and linha[2] == estado.st_ino
+        and linha[3] == estado.st_mtime_ns
+        and linha[4] == estado.st_ctime_ns
+    )
+
+
+class Nana:
+    """
+    Memória das varreduras - Índice incremental de uma ou mais árvores.
+
+    Args:
+        banco: Arquivo SQLite do índice (":memory:" mantém só em memória)
+
+    Métodos principais:
+        atualizar: Varre (ou re-varre) uma raiz, indo ao disco só onde mudou
+        obter: Registro indexado de um caminho
+        diretorios_vazios / ilegiveis / por_extensao: Consultas sem disco
+    """
+
+    def __init__(self, banco: str = ":memory:") -> None:
+        self._conexao = sqlite3.connect(banco)
+        versao = self._conexao.execute("PRAGMA user_version").fetchone()[0]
+        if versao not in (0, VERSAO_ESQUEMA):
+            self._conexao.close()
+            raise ValueError(f"Índice em versão desconhecida: {versao}")
+        if banco != ":memory:":
+            self._conexao.execute("PRAGMA journal_mode=WAL")
+        self._conexao.execute("PRAGMA synchronous=NORMAL")
+        self._conexao.executescript(_ESQUEMA)
+        self._conexao.execute(f"PRAGMA user_version={VERSAO_ESQUEMA}")
+
+    def __enter__(self) -> "Nana":
+        return self
+
+    def __exit__(self, *_excecao: object) -> None:
+        self.fechar()
+
+    def __len__(self) -> int:
+        return self._conexao.execute("SELECT COUNT(*) FROM entradas").fetchone()[0]
+
+    def fechar(self) -> None:
+        """Fecha a conexão com o banco."""
+        self._conexao.close()
+
+    # ------------------------------------------------------------------
+    # Atualização
+    # ------------------------------------------------------------------
+
+    def atualizar(self, raiz: str, verificar_arquivos: bool = False) -> EstatisticasIndice:
+        """
+        Sincroniza o índice com a árvore em ``raiz``.
+
+        Na primeira chamada equivale a uma varredura completa; nas seguintes,
+        só diretórios alterados são listados de novo (ver docstring do módulo).
+        Tudo roda numa única transação: uma falha no meio mantém o índice
+        anterior intacto.
+
+        Args:
+            raiz: Diretório (ou arquivo) a indexar
+            verificar_arquivos: Também confere o stat dos arquivos em
+                diretórios inalterados, detectando conteúdo modificado
+
+        Returns:
+            EstatisticasIndice com o trabalho realizado.
+        """
+        raiz = os.path.abspath(raiz)
+        totais: EstatisticasIndice = {
+            "diretorios_listados": 0, "diretorios_reaproveitados": 0, "stats": 1,
+            "inseridos": 0, "atualizados": 0, "removidos": 0,
+        }
+        with self._conexao:
+            estado = Ogum.obter_stat(raiz)
+            if estado is None:
+                self._remover(os.fsencode(raiz), totais)
+                return totais
+            if not stat.S_ISDIR(estado.st_mode):
+                self._gravar(raiz, estado, totais)
+                return totais
+
+            pilha: list[tuple[str, os.stat_result]] = [(raiz, estado)]
+            while pilha:
+                diretorio, estado = pilha.pop()
+                self._sincronizar_diretorio(diretorio, estado, verificar_arquivos, pilha, totais)
+        return totais
+
+    def _sincronizar_diretorio(
+        self,
+        diretorio: str,
+        estado: os.stat_result,
+        verificar_arquivos: bool,
+        pilha: list[tuple[str, os.stat_result]],
+        totais: EstatisticasIndice,
+    ) -> None:
+        """Atualiza um diretório e empilha os subdiretórios que precisam de visita."""
+        chave = os.fsencode(diretorio)
+        linha = self._conexao.execute(
+            "SELECT flags, tipo, inode, mtime_ns, ctime_ns FROM entradas WHERE caminho = ?",
+            (chave,),
+        ).fetchone()
+
+        if _mesmo_diretorio(linha, estado):
+            totais["diretorios_reaproveitados"] += 1
+            if linha[0] & BIT_LEGIVEL:
+                self._revisitar_filhos(chave, verificar_arquivos, pilha, totais)
+            return
+
+        totais["diretorios_listados"] += 1
+        conhecidos = {
+            filho for (filho,) in
+            self._conexao.execute(
+                "SELECT caminho FROM entradas WHERE pai = ? AND caminho != pai", (chave,)
+            )
+        }
+        vistos: set[bytes] = set()
+        vazio = True
+        legivel = Ogum.legivel_por_stat(estado)
+        if legivel:
+            try:
+                with os.scandir(diretorio) as iterador:
+                    for entrada in iterador:
+                        vazio = False
+                        if entrada.is_symlink():
+                            continue
+                        try:
+                            estado_filho = entrada.stat(follow_symlinks=False)
+                        except OSError:
+                            continue
+                        totais["stats"] += 1
+                        vistos.add(os.fsencode(entrada.path))
+                        if stat.S_ISDIR(estado_filho.st_mode):
+                            pilha.append((entrada.path, estado_filho))
+                        else:
+                            self._gravar(entrada.path, estado_filho, totais)
+            except OSError:
+                legivel = False
+
+        for filho in conhecidos - vistos:
+            self._remover(filho, totais)
+
+        codigo = (
+            "caminho_nao_legivel" if not legivel
+            else "diretorio_vazio" if vazio
+            else "caminho_valido"
+        )
+        self._gravar(diretorio, estado, totais, legivel=legivel, vazio=vazio, codigo=codigo)
+
+    def _revisitar_filhos(
+        self,
+        chave: bytes,
+        verificar_arquivos: bool,
+        pilha: list[tuple[str, os.stat_result]],
+        totais: EstatisticasIndice,
+    ) -> None:
+        """Confere os filhos conhecidos de um diretório inalterado."""
+        filhos = self._conexao.execute(
+            "SELECT caminho, tipo, inode, mtime_ns, ctime_ns, tamanho "
+            "FROM entradas WHERE pai = ? AND caminho != pai",
+            (chave,),
+        ).fetchall()
+        for filho, tipo, inode, mtime_ns, ctime_ns, tamanho in filhos:
+            eh_diretorio = tipo == TipoCaminho.DIRETORIO
+            if not eh_diretorio and not verificar_arquivos:
+                continue
+            caminho = os.fsdecode(filho)
+            totais["stats"] += 1
+            try:
+                estado = os.lstat(caminho)
+            except OSError:
+                self._remover(filho, totais)
+                continue
+            if stat.S_ISDIR(estado.st_mode):
+                pilha.append((caminho, estado))
+                continue
+            if not eh_diretorio and (inode, mtime_ns, ctime_ns, tamanho) == (
+                estado.st_ino, estado.st_mtime_ns, estado.st_ctime_ns, estado.st_size
+            ):
+                continue
+            self._gravar(caminho, estado, totais)
+
+    def _gravar(
+        self,
+        caminho: str,
+        estado: os.stat_result,
+        totais: EstatisticasIndice,
+        legivel: Optional[bool] = None,
+        vazio: Optional[bool] = None,
+        codigo: Optional[str] = None,
+    ) -> None:
+        """Insere ou regrava a entrada de ``caminho`` a partir do seu stat."""
+        tipo = TipoCaminho.de_rotulo(Ogum.tipo_por_stat(estado))
+        if legivel is None:
+            legivel = Ogum.legivel_por_stat(estado)
+            vazio = tipo == TipoCaminho.ARQUIVO and estado.st_size == 0
+            codigo = (
+                "caminho_nao_legivel" if not legivel
+                else "tipo_nao_suportado" if tipo == TipoCaminho.DESCONHECIDO
+                else "arquivo_vazio" if vazio
+                else "caminho_valido"
+            )
+        flags = BIT_VALIDO | (BIT_LEGIVEL if legivel else 0) | (BIT_VAZIO if vazio else 0)
+        chave = os.fsencode(caminho)
+        valores = (
+            flags, int(tipo), codigo, estado.st_size, estado.st_mtime_ns,
+            estado.st_ctime_ns, estado.st_ino,
+        )
+        atual = self._conexao.execute(
+            "SELECT flags, tipo, codigo, tamanho, mtime_ns, ctime_ns, inode "
+            "FROM entradas WHERE caminho = ?",
+            (chave,),
+        ).fetchone()
+        if atual == valores:
+            return
+        if atual is not None and atual[1] == TipoCaminho.DIRETORIO != tipo:
+            # Deixou de ser diretório: a subárvore antiga não existe mais
+            self._remover(chave, totais, descendentes=True)
+        totais["inseridos" if atual is None else "atualizados"] += 1
+        extensao = _extensao(caminho).lower() if tipo == TipoCaminho.ARQUIVO else ""
+        self._conexao.execute(
+            "INSERT OR REPLACE INTO entradas VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (chave, os.fsencode(os.path.dirname(caminho)), *valores, os.fsencode(extensao)),
+        )
+
+    def _remover(
+        self, chave: bytes, totais: EstatisticasIndice, descendentes: bool = False
+    ) -> None:
+        """Apaga a entrada ``chave`` (salvo com ``descendentes``) e toda a subárvore."""
+        inicio, fim = _faixa(chave)
+        cursor = self._conexao.execute(
+            "DELETE FROM entradas WHERE (caminho = ? AND NOT ?) OR (caminho >= ? AND caminho < ?)",
+            (chave, descendentes, inicio, fim),
+        )
+        totais["removidos"] += cursor.rowcount
+
+    # ------------------------------------------------------------------
+    # Consultas (somente o banco, sem tocar o disco)
+    # ------------------------------------------------------------------
+
+    def obter(self, caminho: str) -> Optional[RegistroIndice]:
+        """Registro indexado de ``caminho``, ou None se não estiver no índice."""
+        linha = self._conexao.execute(
+            f"SELECT {_COLUNAS} FROM entradas WHERE caminho = ?",
+            (os.fsencode(os.path.abspath(caminho)),),
+        ).fetchone()
+        return None if linha is None else self._registro(linha)
+
+    def filhos(self, caminho: str) -> Iterator[RegistroIndice]:
+        """Entradas indexadas diretamente dentro de ``caminho``."""
+        chave = os.fsencode(os.path.abspath(caminho))
+        yield from self._consultar("pai = ? AND caminho != pai", (chave,))
+
+    def diretorios_vazios(self, raiz: Optional[str] = None) -> Iterator[RegistroIndice]:
+        """Diretórios sem itens, opcionalmente só dentro de ``raiz``."""
+        yield from self._consultar(
+            f"tipo = {int(TipoCaminho.DIRETORIO)} AND flags & {BIT_VAZIO}", (), raiz
+        )
+
+    def ilegiveis(
+        self, raiz: Optional[str] = None, tipo: Optional[str] = None
+    ) -> Iterator[RegistroIndice]:
+        """Entradas sem permissão de leitura; ``tipo`` restringe a 'arquivo' ou 'diretorio'."""
+        condicao = f"NOT flags & {BIT_LEGIVEL}"
+        if tipo is not None:
+            condicao += f" AND tipo = {int(TipoCaminho.de_rotulo(tipo))}"
+        yield from self._consultar(condicao, (), raiz)
+
+    def por_extensao(self, extensao: str, raiz: Optional[str] = None) -> Iterator[RegistroIndice]:
+        """Arquivos com a extensão informada (ex.: '.txt'), sem diferenciar maiúsculas."""
+        if extensao and not extensao.startswith("."):
+            extensao = "." + extensao
+        yield from self._consultar("extensao = ?", (os.fsencode(extensao.lower()),), raiz)
+
+    def bytes_por_extensao(self, raiz: Optional[str] = None) -> dict[str, int]:
+        """Soma de ``st_size`` dos arquivos por extensão, como no EstatisticasVarredura."""
+        condicao, parametros = self._restringir(f"tipo = {int(TipoCaminho.ARQUIVO)}", (), raiz)
+        linhas = self._conexao.execute(
+            f"SELECT extensao, SUM(tamanho) FROM entradas WHERE {condicao} GROUP BY extensao",
+            parametros,
+        )
+        return {os.fsdecode(extensao): total for extensao, total in linhas}
+
+    def _consultar(
+        self, condicao: str, parametros: tuple, raiz: Optional[str] = None
+    ) -> Iterator[RegistroIndice]:
+        """Executa um SELECT nas entradas, em ordem de caminho."""
+        condicao, parametros = self._restringir(condicao, parametros, raiz)
+        cursor = self._conexao.execute(
+            f"SELECT {_COLUNAS} FROM entradas WHERE {condicao} ORDER BY caminho", parametros
+        )
+        for linha in cursor:
+            yield self._registro(linha)
+
+    @staticmethod
+    def _restringir(
+        condicao: str, parametros: tuple, raiz: Optional[str]
+    ) -> tuple[str, tuple]:
+        """Acrescenta à condição o filtro da subárvore de ``raiz`` (inclusive)."""
+        if raiz is None:
+            return condicao, parametros
+        chave = os.fsencode(os.path.abspath(raiz))
+        inicio, fim = _faixa(chave)
+        return (
+            f"({condicao}) AND (caminho = ? OR (caminho >= ? AND caminho < ?))",
+            (*parametros, chave, inicio, fim),
+        )
+
+    @staticmethod
+    def _registro(linha: tuple) -> RegistroIndice:
+        """Converte uma linha do banco num RegistroIndice."""
+        chave, flags, tipo, codigo, tamanho, mtime_ns, inode = linha
+        caminho = os.fsdecode(chave)
+        return {
+            "caminho": caminho,
+            "valido": bool(flags & BIT_VALIDO),
+            "legivel": bool(flags & BIT_LEGIVEL),
+            "tipo": TipoCaminho(tipo).rotulo,
+            "vazio": bool(flags & BIT_VAZIO),
+            "mensagem": Mensagem(codigo, caminho),
+            "tamanho": tamanho,
+            "mtime_ns": mtime_ns,
+            "inode": inode,
+        }
@@ -0,0 +1,356 @@
+# -*- coding: utf-8 -*-
+"""
+app_instantaneo.py
+
+Instantâneos ordenados de varreduras e comparação entre eles.
+
+Olokun, guardião das profundezas, registra o estado de uma árvore num arquivo
+binário cujas entradas ficam em ordem de componentes do caminho (``/a/b``
+antes de ``/a.b``, e todo diretório antes de seus descendentes). Com os dois
+lados ordenados pela mesma chave, ``comparar`` é um merge-join: lê os dois
+arquivos em paralelo, uma entrada por vez, e emite o que apareceu, sumiu ou
+mudou (tipo, vazio, legível, tamanho, mtime). O tempo é linear no número de
+entradas e a memória é constante, mesmo com dezenas de milhões de caminhos.
+
+Formato do arquivo::
+
+    cabeçalho: MAGICO, [versão:u16][tamanho:u32][JSON com a tabela de códigos]
+    entradas:  [tamanho da chave:u32][flags:u8][tipo:u8][código:u8]
+               [tamanho:u64][mtime_ns:i64][chave]
+
+A chave é o caminho em ``os.fsencode`` com o separador trocado por ``\\0``
+(que nunca aparece num nome), então a ordem dos bytes é a ordem dos
+componentes. O código da mensagem é um índice na tabela do cabeçalho, de modo
+que instantâneos antigos continuam legíveis se novos códigos surgirem.
+
+``gravar`` aceita os registros em qualquer ordem: eles são ordenados em blocos
+de tamanho limitado, despejados em arquivos temporários e intercalados
+(ordenação externa), sem nunca manter a varredura inteira na memória.
+"""
+
+import heapq
+import json
+import os
+import struct
+import tempfile
+from operator import itemgetter
+from typing import BinaryIO, Iterable, Iterator, Literal, Mapping, NamedTuple, Optional
+
+from app.mensagens.app_mensageiro import Mensagem
+from app.utils.app_compacto import BIT_LEGIVEL, BIT_VALIDO, BIT_VAZIO, CODIGOS, TipoCaminho
+from app.utils.app_tools import ResultadoValidacao
+from app.utils.app_varredura import Oxossi
+
+MAGICO = b"APONTADOR-INSTANTANEO\n"
+VERSAO_FORMATO = 1
+
+# Campos comparados por padrão em ``Olokun.comparar``
+CAMPOS_COMPARADOS: tuple[str, ...] = ("tipo", "vazio", "legivel", "tamanho", "mtime_ns")
+
+_VERSAO = struct.Struct(">HI")
+_ENTRADA = struct.Struct(">IBBBQq")
+_SEPARADOR = os.fsencode(os.sep)
+_INDICE_CODIGO: dict[str, int] = {codigo: indice for indice, codigo in enumerate(CODIGOS)}
+
+Situacao = Literal["adicionado", "removido", "alterado"]
+
+# (chave, flags, tipo, código, tamanho, mtime_ns): forma interna de uma entrada
+_Linha = tuple[bytes, int, int, int, int, int]
+
+
+class EntradaInstantaneo(ResultadoValidacao):
+    """
+    Entrada lida de um instantâneo.
+
+    Atributos (além dos de ResultadoValidacao):
+        tamanho (int): ``st_size`` no momento da varredura (0 se desconhecido)
+        mtime_ns (int): ``st_mtime_ns`` no momento da varredura (0 se desconhecido)
+    """
+    tamanho: int
+    mtime_ns: int
+
+
+class Diferenca(NamedTuple):
+    """
+    Mudança de um caminho entre dois instantâneos.
+
+    Atributos:
+        caminho (str): Caminho afetado
+        situacao (str): 'adicionado', 'removido' ou 'alterado'
+        campos (tuple[str, ...]): Campos que mudaram (vazio se não for 'alterado')
+        antes (EntradaInstantaneo | None): Entrada no instantâneo antigo
+        depois (EntradaInstantaneo | None): Entrada no instantâneo novo
+    """
+    caminho: str
+    situacao: Situacao
+    campos: tuple[str, ...]
+    antes: Optional[EntradaInstantaneo]
+    depois: Optional[EntradaInstantaneo]
+
+    @property
+    def ficou_vazio(self) -> bool:
+        """Se o caminho existia com conteúdo e agora está vazio."""
+        return "vazio" in self.campos and bool(self.depois and self.depois["vazio"])
+
+    @property
+    def perdeu_leitura(self) -> bool:
+        """Se o caminho era legível e deixou de ser."""
+        return "legivel" in self.campos and bool(self.antes and self.antes["legivel"])
+
+
+def _chave(caminho: str) -> bytes:
+    """Chave de ordenação: o caminho em bytes, com o separador trocado por NUL."""
+    return os.fsencode(caminho).replace(_SEPARADOR, b"\0")
+
+
+def _caminho(chave: bytes) -> str:
+    """Inverso de ``_chave``."""
+    return os.fsdecode(chave.replace(b"\0", _SEPARADOR))
+
+
+def _linha(registro: Mapping) -> _Linha:
+    """Converte um ResultadoValidacao/EntradaVarredura na forma interna."""
+    flags = (
+        (BIT_VALIDO if registro["valido"] else 0)
+        | (BIT_LEGIVEL if registro["legivel"] else 0)
+        | (BIT_VAZIO if registro["vazio"] else 0)
+    )
+    mensagem = registro["mensagem"]
+    codigo = mensagem.codigo if isinstance(mensagem, Mensagem) else str(mensagem)
+    return (
+        _chave(registro["caminho"]),
+        flags,
+        TipoCaminho.de_rotulo(registro["tipo"]),
+        _INDICE_CODIGO.get(codigo, _INDICE_CODIGO["caminho_invalido"]),
+        registro.get("tamanho", 0),
+        registro.get("mtime_ns", 0),
+    )
+
+
+def _escrever_linhas(destino: BinaryIO, linhas: Iterable[_Linha]) -> int:
+    """Escreve as entradas (sem cabeçalho), omitindo chaves repetidas em sequência."""
+    empacotar = _ENTRADA.pack
+    escrever = destino.write
+    anterior: Optional[bytes] = None
+    total = 0
+    for chave, flags, tipo, codigo, tamanho, mtime_ns in linhas:
+        if chave == anterior:
+            continue
+        escrever(empacotar(len(chave), flags, tipo, codigo, tamanho, mtime_ns))
+        escrever(chave)
+        anterior = chave
+        total += 1
+    return total
+
+
+def _ler_linhas(origem: BinaryIO) -> Iterator[_Linha]:
+    """Lê as entradas a partir da posição atual até o fim do arquivo."""
+    ler = origem.read
+    tamanho_cabecalho = _ENTRADA.size
+    desempacotar = _ENTRADA.unpack
+    while True:
+        cabecalho = ler(tamanho_cabecalho)
+        if not cabecalho:
+            return
+        if len(cabecalho) < tamanho_cabecalho:
+            raise ValueError("instantâneo truncado")
+        tamanho_chave, flags, tipo, codigo, tamanho, mtime_ns = desempacotar(cabecalho)
+        chave = ler(tamanho_chave)
+        if len(chave) < tamanho_chave:
+            raise ValueError("instantâneo truncado")
+        yield chave, flags, tipo, codigo, tamanho, mtime_ns
+
+
+class Olokun:
+    """
+    Guardião das profundezas - Registra instantâneos de varreduras e os compara.
+
+    Métodos principais:
+        capturar: Varre uma raiz e grava o instantâneo
+        gravar: Grava registros em qualquer ordem como instantâneo ordenado
+        ler: Percorre as entradas de um instantâneo, em ordem
+        comparar: Merge-join de dois instantâneos, emitindo as diferenças
+    """
+
+    @staticmethod
+    def capturar(raiz: str, arquivo: str, memoria: int = 500_000, **opcoes: object) -> int:
+        """
+        Varre ``raiz`` com o Oxossi e grava o instantâneo em ``arquivo``.
+
+        Aceita as mesmas opções de ``Oxossi.varrer``.
+
+        Returns:
+            Quantidade de entradas gravadas.
+        """
+        registros = Oxossi.varrer(raiz, **opcoes)  # type: ignore[arg-type]
+        try:
+            return Olokun.gravar(registros, arquivo, memoria)
+        finally:
+            registros.close()
+
+    @staticmethod
+    def gravar(
+        registros: Iterable[Mapping],
+        arquivo: str,
+        memoria: int = 500_000,
+        pasta_temporaria: Optional[str] = None,
+    ) -> int:
+        """
+        Grava os registros, em qualquer ordem, como um instantâneo ordenado.
+
+        Até ``memoria`` entradas são ordenadas de cada vez; blocos excedentes
+        vão para arquivos temporários e são intercalados no final. O arquivo
+        só aparece, completo, ao fim da gravação (troca atômica). Caminhos
+        repetidos ficam com a primeira ocorrência.
+
+        Args:
+            registros: ResultadoValidacao, EntradaVarredura ou equivalentes
+                (``tamanho``/``mtime_ns`` ausentes valem 0)
+            arquivo: Destino do instantâneo
+            memoria: Entradas mantidas em memória por bloco
+            pasta_temporaria: Onde criar os blocos temporários
+
+        Returns:
+            Quantidade de entradas gravadas.
+        """
+        por_chave = itemgetter(0)
+        blocos: list[BinaryIO] = []
+        bloco: list[_Linha] = []
+        temporario = f"{arquivo}.{os.getpid()}.tmp"
+        try:
+            for registro in registros:
+                bloco.append(_linha(registro))
+                if len(bloco) >= memoria:
+                    bloco.sort(key=por_chave)
+                    temporaria = tempfile.TemporaryFile(dir=pasta_temporaria)
+                    _escrever_linhas(temporaria, bloco)
+                    temporaria.seek(0)
+                    blocos.append(temporaria)
+                    bloco = []
+            bloco.sort(key=por_chave)
+
+            with open(temporario, "wb") as destino:
+                cabecalho = json.dumps(CODIGOS).encode()
+                destino.write(MAGICO + _VERSAO.pack(VERSAO_FORMATO, len(cabecalho)) + cabecalho)
+                if blocos:
+                    linhas: Iterable[_Linha] = heapq.merge(
+                        *(_ler_linhas(despejo) for despejo in blocos), bloco, key=por_chave
+                    )
+                else:
+                    linhas = bloco
+                total = _escrever_linhas(destino, linhas)
+            os.replace(temporario, arquivo)
+            return total
+        finally:
+            for despejo in blocos:
+                despejo.close()
+            if os.path.exists(temporario):
+                os.unlink(temporario)
+
+    @staticmethod
+    def ler(arquivo: str) -> Iterator[EntradaInstantaneo]:
+        """Percorre as entradas do instantâneo em ordem de componentes."""
+        for linha in Olokun._linhas(arquivo):
+            yield Olokun._entrada(*linha)
+
+    @staticmethod
+    def comparar(
+        antigo: str, novo: str, campos: Iterable[str] = CAMPOS_COMPARADOS
+    ) -> Iterator[Diferenca]:
+        """
+        Compara dois instantâneos num único passo sobre cada um.
+
+        Args:
+            antigo: Instantâneo de referência
+            novo: Instantâneo mais recente
+            campos: Campos verificados nas entradas presentes nos dois
+                (entre 'tipo', 'vazio', 'legivel', 'valido', 'tamanho',
+                'mtime_ns' e 'mensagem')
+
+        Yields:
+            Diferenca de cada caminho adicionado, removido ou alterado, em
+            ordem de componentes.
+        """
+        campos = tuple(campos)
+        desconhecidos = set(campos) - set(_COMPARADORES)
+        if desconhecidos:
+            raise ValueError(f"campos desconhecidos: {sorted(desconhecidos)}")
+        comparadores = [(campo, _COMPARADORES[campo]) for campo in campos]
+
+        esquerda = Olokun._linhas(antigo)
+        direita = Olokun._linhas(novo)
+        a = next(esquerda, None)
+        b = next(direita, None)
+        while a is not None or b is not None:
+            if b is None or (a is not None and a[0] < b[0]):
+                entrada = Olokun._entrada(*a)  # type: ignore[misc]
+                yield Diferenca(entrada["caminho"], "removido", (), entrada, None)
+                a = next(esquerda, None)
+            elif a is None or b[0] < a[0]:
+                entrada = Olokun._entrada(*b)
+                yield Diferenca(entrada["caminho"], "adicionado", (), None, entrada)
+                b = next(direita, None)
+            else:
+                # Entradas idênticas (o caso comum) dispensam os comparadores
+                mudaram = a != b and tuple(campo for campo, difere in comparadores if difere(a, b))
+                if mudaram:
+                    antes, depois = Olokun._entrada(*a), Olokun._entrada(*b)
+                    yield Diferenca(antes["caminho"], "alterado", mudaram, antes, depois)
+                a = next(esquerda, None)
+                b = next(direita, None)
+
+    @staticmethod
+    def _linhas(arquivo: str) -> Iterator[_Linha]:
+        """Entradas na forma interna, com os códigos traduzidos para a tabela atual."""
+        with open(arquivo, "rb", buffering=1 << 20) as origem:
+            if origem.read(len(MAGICO)) != MAGICO:
+                raise ValueError(f"não é um instantâneo do Apontador: {arquivo}")
+            versao_bruta = origem.read(_VERSAO.size)
+            if len(versao_bruta) < _VERSAO.size:
+                raise ValueError("instantâneo truncado")
+            versao, tamanho = _VERSAO.unpack(versao_bruta)
+            if versao != VERSAO_FORMATO:
+                raise ValueError(f"versão de instantâneo não suportada: {versao}")
+            tabela = origem.read(tamanho)
+            if len(tabela) < tamanho:
+                raise ValueError("instantâneo truncado")
+            # JSONDecodeError já é um ValueError
+            invalido = _INDICE_CODIGO["caminho_invalido"]
+            traducao = [_INDICE_CODIGO.get(codigo, invalido) for codigo in json.loads(tabela)]
+            anterior = b""
+            for chave, flags, tipo, codigo, tamanho_arquivo, mtime_ns in _ler_linhas(origem):
+                if chave <= anterior and anterior:
+                    raise ValueError(f"instantâneo fora de ordem em {_caminho(chave)!r}")
+                if codigo >= len(traducao):
+                    raise ValueError(f"código fora da tabela em {_caminho(chave)!r}: {codigo}")
+                anterior = chave
+                yield chave, flags, tipo, traducao[codigo], tamanho_arquivo, mtime_ns
+
+    @staticmethod
+    def _entrada(
+        chave: bytes, flags: int, tipo: int, codigo: int, tamanho: int, mtime_ns: int
+    ) -> EntradaInstantaneo:
+        """Converte a forma interna numa EntradaInstantaneo."""
+        caminho = _caminho(chave)
+        return {
+            "caminho": caminho,
+            "valido": bool(flags & BIT_VALIDO),
+            "legivel": bool(flags & BIT_LEGIVEL),
+            "tipo": TipoCaminho(tipo).rotulo,
+            "vazio": bool(flags & BIT_VAZIO),
+            "mensagem": Mensagem(CODIGOS[codigo], caminho),
+            "tamanho": tamanho,
+            "mtime_ns": mtime_ns,
+        }
+
+
+# Como detectar a mudança de cada campo comparando duas entradas na forma interna
+_COMPARADORES = {
+    "tipo": lambda a, b: a[2] != b[2],
+    "vazio": lambda a, b: (a[1] ^ b[1]) & BIT_VAZIO,
+    "legivel": lambda a, b: (a[1] ^ b[1]) & BIT_LEGIVEL,
+    "valido": lambda a, b: (a[1] ^ b[1]) & BIT_VALIDO,
+    "mensagem": lambda a, b: a[3] != b[3],
+    "tamanho": lambda a, b: a[4] != b[4],
+    "mtime_ns": lambda a, b: a[5] != b[5],
+}
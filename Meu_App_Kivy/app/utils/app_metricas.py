@@ -0,0 +1,358 @@
+# -*- coding: utf-8 -*-
+"""
+app_metricas.py
+
+Instrumentação opcional das etapas quentes da validação.
+
+Oxum guarda, por etapa (stat, legibilidade, tipo, vazio, mensagem, caches),
+contadores de chamadas, erros e syscalls e um histograma de latências. Os
+números saem como um dicionário (``instantaneo``) ou no formato texto do
+Prometheus, gravado num arquivo (``gravar_prometheus``) ou servido por HTTP
+em localhost (``servir``). ``capturar`` envolve um trecho com cProfile e/ou
+tracemalloc para investigações pontuais.
+
+Desligada (o padrão), a instrumentação custa uma verificação de ``ativo``
+por validação, mais um teste barato por etapa::
+
+    if Ogum.metricas.ativo:
+        ...
+
+Os módulos pesados (cProfile, tracemalloc, http.server) só são importados
+quando usados.
+"""
+
+import bisect
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional, TypedDict
+
+# Limites superiores (em segundos) dos baldes dos histogramas de latência
+LIMITES_PADRAO: tuple[float, ...] = (
+    1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4,
+    1e-3, 5e-3, 1e-2, 5e-2, 0.1, 0.5, 1.0,
+)
+
+# Contadores mantidos para toda etapa, mesmo que nunca incrementados
+CONTADORES_PADRAO = ("chamadas", "erros", "syscalls")
+
+
+class HistogramaMedido(TypedDict):
+    """
+    Histograma de latências de uma etapa.
+
+    Atributos:
+        soma (float): Tempo total observado, em segundos
+        contagem (int): Observações registradas
+        baldes (dict): Observações acumuladas até cada limite ('+Inf' inclui todas)
+    """
+    soma: float
+    contagem: int
+    baldes: dict[str, int]
+
+
+class EtapaMedida(TypedDict):
+    """
+    Métricas de uma etapa.
+
+    Atributos:
+        contadores (dict): Chamadas, erros, syscalls e contadores específicos
+            da etapa (ex.: 'acertos' e 'falhas' dos caches)
+        segundos (HistogramaMedido): Latências observadas
+    """
+    contadores: dict[str, int]
+    segundos: HistogramaMedido
+
+
+class _Histograma:
+    """Contagens por balde (não acumuladas) e soma das durações em nanossegundos."""
+
+    __slots__ = ("baldes", "soma_ns", "contagem")
+
+    def __init__(self, quantidade: int) -> None:
+        self.baldes = [0] * (quantidade + 1)
+        self.soma_ns = 0
+        self.contagem = 0
+
+
+class Captura:
+    """
+    Resultado de ``Oxum.capturar``, preenchido ao sair do bloco.
+
+    Atributos:
+        perfil (str): Relatório do cProfile (funções por tempo acumulado)
+        memoria (list[str]): Linhas do tracemalloc com mais memória alocada
+        pico_memoria (int): Pico de bytes alocados durante o bloco
+    """
+
+    def __init__(self) -> None:
+        self.perfil = ""
+        self.memoria: list[str] = []
+        self.pico_memoria = 0
+
+
+class Oxum:
+    """
+    Guardiã das medidas - conta e cronometra as etapas das validações.
+
+    Segura para uso concorrente (ex.: a partir do ``Ogum.validar_lote``).
+    Nada é registrado enquanto ``ativo`` for False; cabe ao código
+    instrumentado verificar o atributo antes de medir.
+
+    Args:
+        limites: Limites superiores, em segundos, dos baldes dos histogramas
+        prefixo: Prefixo dos nomes das métricas no formato Prometheus
+    """
+
+    def __init__(
+        self, limites: tuple[float, ...] = LIMITES_PADRAO, prefixo: str = "apontador"
+    ) -> None:
+        self._limites_ns = [int(limite * 1e9) for limite in limites]
+        self._limites = tuple(limites)
+        self._prefixo = prefixo
+        self._trava = threading.Lock()
+        self._contadores: dict[str, dict[str, int]] = {}
+        self._histogramas: dict[str, _Histograma] = {}
+        self.ativo = False
+
+    def ligar(self) -> None:
+        """Passa a registrar as medidas."""
+        self.ativo = True
+
+    def desligar(self) -> None:
+        """Para de registrar; os valores acumulados são mantidos."""
+        self.ativo = False
+
+    def zerar(self) -> None:
+        """Descarta todas as medidas acumuladas."""
+        with self._trava:
+            self._contadores.clear()
+            self._histogramas.clear()
+
+    def registrar(
+        self, etapa: str, duracao_ns: int, erro: bool = False, syscalls: int = 0
+    ) -> None:
+        """Registra uma execução da etapa: chamada, duração, erro e syscalls."""
+        indice = bisect.bisect_left(self._limites_ns, duracao_ns)
+        with self._trava:
+            contadores = self._contadores.get(etapa)
+            if contadores is None:
+                contadores = self._nova_etapa(etapa)
+            contadores["chamadas"] += 1
+            contadores["syscalls"] += syscalls
+            if erro:
+                contadores["erros"] += 1
+            histograma = self._histogramas[etapa]
+            histograma.baldes[indice] += 1
+            histograma.soma_ns += duracao_ns
+            histograma.contagem += 1
+
+    def contar(self, etapa: str, contador: str, valor: int = 1) -> None:
+        """Incrementa um contador da etapa (ex.: ``contar("cache", "acertos")``)."""
+        with self._trava:
+            contadores = self._contadores.get(etapa)
+            if contadores is None:
+                contadores = self._nova_etapa(etapa)
+            contadores[contador] = contadores.get(contador, 0) + valor
+
+    @contextmanager
+    def medir(self, etapa: str, syscalls: int = 0) -> Iterator[None]:
+        """
+        Cronometra o bloco como uma execução da etapa.
+
+        Exceções são contadas como erro e propagadas. Com a instrumentação
+        desligada, o bloco roda sem medição.
+        """
+        if not self.ativo:
+            yield
+            return
+        inicio = time.perf_counter_ns()
+        try:
+            yield
+        except BaseException:
+            self.registrar(etapa, time.perf_counter_ns() - inicio, True, syscalls)
+            raise
+        self.registrar(etapa, time.perf_counter_ns() - inicio, False, syscalls)
+
+    def instantaneo(self) -> dict[str, EtapaMedida]:
+        """Fotografia de todas as etapas medidas, pronta para JSON."""
+        with self._trava:
+            copias = {
+                etapa: (dict(contadores), list(histograma.baldes), histograma.soma_ns,
+                        histograma.contagem)
+                for etapa, contadores in self._contadores.items()
+                for histograma in (self._histogramas[etapa],)
+            }
+
+        rotulos = self._rotulos_limites()
+        resultado: dict[str, EtapaMedida] = {}
+        for etapa, (contadores, baldes, soma_ns, contagem) in sorted(copias.items()):
+            acumulado = 0
+            cumulativos: dict[str, int] = {}
+            for rotulo, quantidade in zip(rotulos, baldes):
+                acumulado += quantidade
+                cumulativos[rotulo] = acumulado
+            resultado[etapa] = {
+                "contadores": contadores,
+                "segundos": {"soma": soma_ns / 1e9, "contagem": contagem, "baldes": cumulativos},
+            }
+        return resultado
+
+    def prometheus(self) -> str:
+        """Medidas no formato de exposição em texto do Prometheus."""
+        etapas = self.instantaneo()
+        linhas: list[str] = []
+        nomes = sorted({nome for medida in etapas.values() for nome in medida["contadores"]})
+        for nome in nomes:
+            metrica = f"{self._prefixo}_etapa_{nome}_total"
+            linhas.append(f"# TYPE {metrica} counter")
+            for etapa, medida in etapas.items():
+                if nome in medida["contadores"]:
+                    linhas.append(
+                        f'{metrica}{{etapa="{_escapar(etapa)}"}} {medida["contadores"][nome]}'
+                    )
+        metrica = f"{self._prefixo}_etapa_segundos"
+        linhas.append(f"# TYPE {metrica} histogram")
+        for etapa, medida in etapas.items():
+            histograma = medida["segundos"]
+            if not histograma["contagem"]:
+                continue  # Etapas só com contadores (ex.: caches) não têm latência
+            rotulo = f'etapa="{_escapar(etapa)}"'
+            for limite, acumulado in histograma["baldes"].items():
+                linhas.append(f'{metrica}_bucket{{{rotulo},le="{limite}"}} {acumulado}')
+            linhas.append(f"{metrica}_sum{{{rotulo}}} {histograma['soma']:.9f}")
+            linhas.append(f"{metrica}_count{{{rotulo}}} {histograma['contagem']}")
+        return "\n".join(linhas) + "\n"
+
+    def gravar_prometheus(self, arquivo: str) -> None:
+        """
+        Grava ``prometheus()`` em ``arquivo`` de forma atômica.
+
+        Adequado ao textfile collector do node_exporter, que nunca deve ler um
+        arquivo pela metade.
+        """
+        temporario = f"{arquivo}.{os.getpid()}.tmp"
+        with open(temporario, "w", encoding="utf-8") as destino:
+            destino.write(self.prometheus())
+        os.replace(temporario, arquivo)
+
+    def servir(self, porta: int = 0, endereco: str = "127.0.0.1"):
+        """
+        Expõe as medidas por HTTP numa thread de fundo.
+
+        ``GET /metrics`` devolve o texto do Prometheus e ``GET /metrics.json``
+        o ``instantaneo()``. Com ``porta`` 0 o sistema escolhe uma porta livre,
+        lida em ``servidor.server_address``.
+
+        Returns:
+            O ThreadingHTTPServer em execução; ``shutdown()`` o encerra.
+        """
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer  # pylint: disable=C0415
+
+        metricas = self
+
+        class _Manipulador(BaseHTTPRequestHandler):
+            def do_GET(self):  # pylint: disable=C0103
+                rota = self.path.split("?", 1)[0]
+                if rota == "/metrics":
+                    corpo = metricas.prometheus().encode()
+                    tipo = "text/plain; version=0.0.4; charset=utf-8"
+                elif rota == "/metrics.json":
+                    corpo = json.dumps(metricas.instantaneo()).encode()
+                    tipo = "application/json"
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", tipo)
+                self.send_header("Content-Length", str(len(corpo)))
+                self.end_headers()
+                self.wfile.write(corpo)
+
+            def log_message(self, *_args):  # pylint: disable=W0221
+                pass  # Sem ruído no stderr a cada coleta
+
+        servidor = ThreadingHTTPServer((endereco, porta), _Manipulador)
+        servidor.daemon_threads = True
+        threading.Thread(
+            target=servidor.serve_forever, name="oxum-metricas", daemon=True
+        ).start()
+        return servidor
+
+    @contextmanager
+    def capturar(
+        self,
+        perfil: bool = True,
+        memoria: bool = False,
+        linhas: int = 20,
+        arquivo_perfil: Optional[str] = None,
+    ) -> Iterator[Captura]:
+        """
+        Perfila o bloco com cProfile e/ou tracemalloc.
+
+        Args:
+            perfil: Ativa o cProfile
+            memoria: Ativa o tracemalloc (se ainda não estiver rodando)
+            linhas: Quantidade de linhas mantidas em cada relatório
+            arquivo_perfil: Se informado, grava as estatísticas brutas do
+                cProfile (lidas por ``pstats``/snakeviz)
+
+        Yields:
+            Captura, preenchida ao final do bloco.
+        """
+        captura = Captura()
+        perfilador = None
+        iniciou_memoria = False
+        if perfil:
+            import cProfile  # pylint: disable=C0415
+            perfilador = cProfile.Profile()
+        if memoria:
+            import tracemalloc  # pylint: disable=C0415
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                iniciou_memoria = True
+            tracemalloc.reset_peak()
+        if perfilador is not None:
+            perfilador.enable()
+        try:
+            yield captura
+        finally:
+            if perfilador is not None:
+                perfilador.disable()
+                captura.perfil = _relatorio_perfil(perfilador, linhas)
+                if arquivo_perfil is not None:
+                    perfilador.dump_stats(arquivo_perfil)
+            if memoria:
+                _, captura.pico_memoria = tracemalloc.get_traced_memory()
+                estatisticas = tracemalloc.take_snapshot().statistics("lineno")
+                captura.memoria = [str(item) for item in estatisticas[:linhas]]
+                if iniciou_memoria:
+                    tracemalloc.stop()
+
+    def _nova_etapa(self, etapa: str) -> dict[str, int]:
+        """Cria os contadores e o histograma da etapa. Deve ser chamado com a trava adquirida."""
+        contadores = dict.fromkeys(CONTADORES_PADRAO, 0)
+        self._contadores[etapa] = contadores
+        self._histogramas[etapa] = _Histograma(len(self._limites_ns))
+        return contadores
+
+    def _rotulos_limites(self) -> list[str]:
+        """Rótulos 'le' dos baldes, terminando em '+Inf'."""
+        return [repr(limite) for limite in self._limites] + ["+Inf"]
+
+
+def _escapar(valor: str) -> str:
+    """Escapa um valor de rótulo do Prometheus."""
+    return valor.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _relatorio_perfil(perfilador, linhas: int) -> str:
+    """Texto do pstats ordenado por tempo acumulado."""
+    import io  # pylint: disable=C0415
+    import pstats  # pylint: disable=C0415
+
+    saida = io.StringIO()
+    pstats.Stats(perfilador, stream=saida).sort_stats("cumulative").print_stats(linhas)
+    return saida.getvalue()
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+"""
+app_normalizador.py
+
+Normalização sintática de caminhos de qualquer sistema operacional.
+
+Oxalá, o pai da criação, devolve a cada caminho sua forma canônica sem tocar
+o disco e sem depender do sistema em que o app roda: a anatomia vem do Ifa e
+as regras seguem o sistema do próprio caminho.
+
+Regras de ``normalizar``:
+    - Separadores repetidos e segmentos ``.`` são removidos; ``..`` consome o
+      componente anterior (em caminhos com raiz, ``..`` na raiz é descartado).
+      Como no ``os.path.normpath``, a regra é léxica: ``a/link/..`` vira
+      ``a`` mesmo que ``link`` seja um link simbólico;
+    - ``~`` no início é expandido para a pasta pessoal (``~usuario`` não é,
+      pois exigiria consultar a base de usuários);
+    - Windows: separador ``\\``, letra do drive em maiúscula e pontos/espaços
+      finais de cada componente removidos, como faz a API Win32. Caminhos
+      longos (``\\\\?\\``) e de dispositivo são literais e saem intactos;
+    - macOS: nomes em Unicode NFC, para que as formas composta e decomposta
+      (NFD, gravada pelo HFS+) do mesmo nome coincidam;
+    - URLs ``file://`` viram o caminho local correspondente.
+
+``chave`` acrescenta a comparação sem distinção de maiúsculas dos sistemas
+que a adotam (Windows e macOS) e serve para deduplicar e indexar caminhos.
+
+Caminhos que já estão na forma canônica mais comum (POSIX absoluto, ASCII,
+sem ``//``, ``.`` ou ``..``) são devolvidos sem análise; os demais passam por
+caches LRU, pois os mesmos caminhos costumam se repetir.
+"""
+
+import os
+import unicodedata
+from functools import lru_cache
+from typing import Iterable, Optional
+
+from app.utils.app_analisador import CaminhoAnalisado, Ifa
+
+# Sistemas cujos sistemas de arquivos, por padrão, não distinguem maiúsculas
+_SEM_CAIXA = frozenset({"windows", "mac"})
+# Formas do Windows cujo texto é repassado literalmente ao sistema
+_LITERAIS = frozenset({"longo", "dispositivo"})
+
+
+class Oxala:
+    """
+    Pai da criação - Dá a cada caminho sua forma canônica, sem acessar o disco.
+
+    Métodos principais:
+        normalizar: Forma canônica do caminho (com cache LRU)
+        chave: Forma canônica para comparação (sem caixa no Windows/macOS)
+        normalizar_lote: Normaliza uma sequência, analisando repetidos uma vez
+        deduplicar: Remove caminhos equivalentes, mantendo a primeira ocorrência
+    """
+
+    TAMANHO_CACHE = 65536
+
+    # Pasta pessoal usada na expansão de '~'; None a lê do ambiente no primeiro uso
+    pasta_pessoal: Optional[str] = None
+
+    @staticmethod
+    def normalizar(caminho: str) -> str:
+        """
+        Devolve a forma canônica de ``caminho``.
+
+        Args:
+            caminho: Caminho de qualquer sistema operacional
+
+        Returns:
+            O caminho normalizado; o próprio objeto recebido se ele já estava
+            na forma canônica. Caminhos vazios são devolvidos como vieram.
+        """
+        if (
+            caminho[:1] == "/"
+            and caminho.isascii()
+            and "/." not in caminho
+            and "//" not in caminho
+            and "\\" not in caminho
+            and (caminho[-1] != "/" or len(caminho) == 1)
+        ):
+            return caminho
+        return Oxala._normalizar(caminho)
+
+    @staticmethod
+    @lru_cache(maxsize=TAMANHO_CACHE)
+    def chave(caminho: str) -> str:
+        """
+        Forma de comparação: ``normalizar`` e, no Windows e no macOS, sem caixa.
+
+        Dois caminhos com a mesma chave apontam para a mesma entrada nas
+        configurações padrão desses sistemas.
+        """
+        normalizado = Oxala.normalizar(caminho)
+        if Ifa.analisar(normalizado).sistema in _SEM_CAIXA:
+            return normalizado.casefold()
+        return normalizado
+
+    @staticmethod
+    def normalizar_lote(
+        caminhos: Iterable[str], chaves: bool = False, memoria: int = 65536
+    ) -> list[str]:
+        """
+        Normaliza uma sequência de caminhos, na ordem recebida.
+
+        Repetidos dentro do lote são normalizados uma única vez, sem passar
+        pelo cache LRU de ``normalizar``/``chave``; a memória dessa
+        deduplicação é limitada a ``memoria`` caminhos distintos.
+
+        Args:
+            caminhos: Caminhos de qualquer sistema
+            chaves: Devolve ``chave`` em vez de ``normalizar``
+            memoria: Máximo de caminhos distintos lembrados entre linhas
+        """
+        funcao = Oxala.chave.__wrapped__ if chaves else Oxala._normalizar.__wrapped__
+        vistos: dict[str, str] = {}
+        saida: list[str] = []
+        for caminho in caminhos:
+            normalizado = vistos.get(caminho)
+            if normalizado is None:
+                normalizado = funcao(caminho)
+                if len(vistos) >= memoria:
+                    vistos.clear()
+                vistos[caminho] = normalizado
+            saida.append(normalizado)
+        return saida
+
+    @staticmethod
+    def deduplicar(caminhos: Iterable[str]) -> list[str]:
+        """Remove caminhos com a mesma ``chave``, mantendo a primeira ocorrência."""
+        vistas: set[str] = set()
+        unicos: list[str] = []
+        originais = list(caminhos)
+        for caminho, chave in zip(originais, Oxala.normalizar_lote(originais, chaves=True)):
+            if chave not in vistas:
+                vistas.add(chave)
+                unicos.append(caminho)
+        return unicos
+
+    @staticmethod
+    @lru_cache(maxsize=TAMANHO_CACHE)
+    def _normalizar(caminho: str) -> str:
+        """Caminho lento de ``normalizar``: análise pelo Ifa e aplicação das regras."""
+        if not caminho or not caminho.strip():
+            return caminho
+        analise = Ifa.analisar(caminho)
+        if analise.forma == "home":
+            expandido = Oxala._expandir(analise)
+            if expandido is not None:
+                analise = Ifa.analisar(expandido)
+        if analise.forma in _LITERAIS:
+            return caminho
+
+        windows = analise.sistema == "windows"
+        partes = analise.partes
+        if windows:
+            partes = tuple(
+                parte if parte == ".." else (parte.rstrip(". ") or parte) for parte in partes
+            )
+        partes = Oxala._resolver_pontos(partes, bool(analise.raiz or analise.absoluto))
+        if analise.sistema == "mac":
+            partes = tuple(unicodedata.normalize("NFC", parte) for parte in partes)
+
+        drive = analise.drive
+        if windows and len(drive) == 2 and drive[1] == ":":
+            drive = drive.upper()
+        separador = "\\" if windows else "/"
+        ancora = drive + (separador if analise.raiz else "")
+        if not partes:
+            return ancora or "."
+        return ancora + separador.join(partes)
+
+    @staticmethod
+    def _resolver_pontos(partes: tuple[str, ...], com_raiz: bool) -> tuple[str, ...]:
+        """Aplica os segmentos ``..`` (as partes do Ifa já vêm sem ``.`` e vazios)."""
+        if ".." not in partes:
+            return partes
+        saida: list[str] = []
+        for parte in partes:
+            if parte != "..":
+                saida.append(parte)
+            elif saida and saida[-1] != "..":
+                saida.pop()
+            elif not com_raiz:
+                saida.append(parte)
+        return tuple(saida)
+
+    @staticmethod
+    def _expandir(analise: CaminhoAnalisado) -> Optional[str]:
+        """Troca o '~' inicial pela pasta pessoal; None se não houver o que expandir."""
+        if analise.partes[0] != "~":
+            return None
+        if Oxala.pasta_pessoal is None:
+            Oxala.pasta_pessoal = os.path.expanduser("~")
+        if Oxala.pasta_pessoal == "~":
+            return None
+        # A pasta pessoal é do computador atual, então a junção segue o os.path
+        return os.path.join(Oxala.pasta_pessoal, *analise.partes[1:])
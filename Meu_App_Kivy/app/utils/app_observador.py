@@ -0,0 +1,414 @@
+# -*- coding: utf-8 -*-
+"""
+app_observador.py
+
+Observação contínua de caminhos já validados.
+
+Oxumarê, a serpente do arco-íris, acompanha o movimento: mantém os resultados
+de validação de um conjunto de caminhos atualizados enquanto o app está
+aberto, sem varrer o disco periodicamente.
+
+- No Linux, usa o inotify (via ctypes, sem dependências externas). Cada
+  caminho observado é coberto por um watch no diretório pai (criação,
+  remoção, renomeação, escrita e permissões do próprio caminho) e, se for um
+  diretório, por um watch nele mesmo (para saber se ficou vazio ou não).
+  Caminhos no mesmo diretório compartilham o watch, e a thread fica bloqueada
+  no ``select`` enquanto nada muda: CPU praticamente zero em repouso;
+- Fora do Linux, ou quando um watch não pode ser criado (pai inexistente,
+  limite ``max_user_watches`` atingido), o caminho cai na sondagem: um stat a
+  cada ``intervalo`` segundos, comparando inode, mtime, ctime, modo e tamanho.
+  No inotify, os caminhos sondados tentam recuperar o watch a cada rodada.
+
+Rajadas de eventos (um editor salvando um arquivo gera vários) são agrupadas:
+cada caminho é revalidado uma única vez por rodada. O novo resultado é gravado
+no CacheValidacao e entregue ao callback ``ao_mudar`` e ao canal ``eventos``
+(código 'caminho_alterado'). Ambos são chamados na thread do observador; a
+interface deve repassar o trabalho para a sua thread (ex.: Clock.schedule_once,
+como faz a TelaPrincipal com o ``AppController.ao_mudar``). Exceções levantadas
+por eles são registradas no ``logging`` e não interrompem a observação.
+"""
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from typing import Callable, Literal, Optional
+
+from app.utils.app_cache import CacheValidacao
+from app.utils.app_compacto import ResultadoCompacto
+from app.utils.app_eventos import CanalEventos
+
+Backend = Literal["auto", "inotify", "sondagem"]
+AoMudar = Callable[[str, ResultadoCompacto], None]
+
+# Constantes de <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+
+# Eventos que mudam o conjunto de itens de um diretório
+_MEMBROS = IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO
+_MASCARA = (
+    IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | _MEMBROS
+    | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+)
+_CABECALHO = struct.Struct("iIII")
+
+_logger = logging.getLogger(__name__)
+
+
+def _carregar_inotify() -> Optional[ctypes.CDLL]:
+    """Carrega a libc com as funções do inotify, ou None se indisponível."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+def _assinatura(caminho: str) -> Optional[tuple[int, int, int, int, int]]:
+    """Assinatura do stat usada pela sondagem (None se o caminho não existe)."""
+    try:
+        estado = os.stat(caminho)
+    except (OSError, ValueError):
+        return None
+    return (estado.st_ino, estado.st_mtime_ns, estado.st_ctime_ns, estado.st_mode, estado.st_size)
+
+
+class Oxumare:
+    """
+    Observador de caminhos - Mantém resultados de validação sempre atuais.
+
+    Args:
+        cache: Cache onde os resultados atualizados são gravados (um novo,
+            se omitido); pode ser o mesmo usado pela Model
+        ao_mudar: Chamado com (caminho, resultado) a cada alteração
+        intervalo: Segundos entre rodadas de sondagem
+        agrupar: Janela, em segundos, para juntar uma rajada de eventos
+        backend: 'auto' usa inotify quando disponível; 'sondagem' força stat
+            periódico; 'inotify' falha se o inotify não estiver disponível
+
+    Uso:
+        with Oxumare(cache, ao_mudar=atualizar_tela) as observador:
+            observador.observar("/home/usuario/relatorio.txt")
+    """
+
+    def __init__(
+        self,
+        cache: Optional[CacheValidacao] = None,
+        ao_mudar: Optional[AoMudar] = None,
+        intervalo: float = 2.0,
+        agrupar: float = 0.05,
+        backend: Backend = "auto",
+    ) -> None:
+        self.cache = cache if cache is not None else CacheValidacao(nome="observador")
+        self.eventos = CanalEventos()
+        self._ao_mudar = ao_mudar
+        self._intervalo = intervalo
+        self._agrupar = agrupar
+
+        self._libc = None if backend == "sondagem" else _carregar_inotify()
+        if backend == "inotify" and self._libc is None:
+            raise OSError("inotify não está disponível nesta plataforma")
+        self._fd = -1
+        if self._libc is not None:
+            self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+            if self._fd < 0:
+                if backend == "inotify":
+                    erro = ctypes.get_errno()
+                    raise OSError(erro, os.strerror(erro))
+                self._libc = None
+
+        self._trava = threading.RLock()
+        self._observados: set[str] = set()
+        self._sondados: dict[str, Optional[tuple]] = {}
+        self._wd_diretorio: dict[int, str] = {}
+        self._diretorio_wd: dict[str, int] = {}
+        self._interessados: dict[str, set[str]] = {}
+        self._leitura, self._escrita = os.pipe()
+        os.set_blocking(self._leitura, False)
+        self._parar = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def backend(self) -> Literal["inotify", "sondagem"]:
+        """Mecanismo em uso."""
+        return "inotify" if self._libc is not None else "sondagem"
+
+    @property
+    def observados(self) -> frozenset[str]:
+        """Caminhos atualmente observados."""
+        with self._trava:
+            return frozenset(self._observados)
+
+    def __enter__(self) -> "Oxumare":
+        self.iniciar()
+        return self
+
+    def __exit__(self, *_excecao: object) -> None:
+        self.parar()
+
+    # ------------------------------------------------------------------
+    # API pública
+    # ------------------------------------------------------------------
+
+    def observar(self, caminho: str) -> ResultadoCompacto:
+        """
+        Passa a observar ``caminho`` e devolve o seu resultado atual.
+
+        O resultado inicial vem do cache (validando no disco se necessário).
+        """
+        caminho = os.path.abspath(caminho)
+        resultado = self.cache.validar(caminho)
+        with self._trava:
+            if caminho in self._observados:
+                return resultado
+            self._observados.add(caminho)
+            if not self._vigiar(caminho, resultado):
+                self._sondados[caminho] = _assinatura(caminho)
+        self._despertar()
+        return resultado
+
+    def deixar(self, caminho: str) -> None:
+        """Para de observar ``caminho`` (ignora se não estiver observado)."""
+        caminho = os.path.abspath(caminho)
+        with self._trava:
+            if caminho not in self._observados:
+                return
+            self._observados.discard(caminho)
+            self._sondados.pop(caminho, None)
+            self._soltar(os.path.dirname(caminho), caminho)
+            self._soltar(caminho, caminho)
+
+    def iniciar(self) -> None:
+        """Inicia a thread do observador (idempotente)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._parar.clear()
+        self._thread = threading.Thread(target=self._laco, name="Oxumare", daemon=True)
+        self._thread.start()
+
+    def parar(self, espera: Optional[float] = 5.0) -> None:
+        """Encerra a thread e libera o inotify. O observador não pode ser reiniciado."""
+        self._parar.set()
+        self._despertar()
+        if self._thread is not None:
+            self._thread.join(espera)
+        with self._trava:
+            for descritor in (self._fd, self._leitura, self._escrita):
+                if descritor >= 0:
+                    os.close(descritor)
+            self._fd = self._leitura = self._escrita = -1
+            self._wd_diretorio.clear()
+            self._diretorio_wd.clear()
+
+    # ------------------------------------------------------------------
+    # Watches (chamados com a trava adquirida)
+    # ------------------------------------------------------------------
+
+    def _vigiar(self, caminho: str, resultado: ResultadoCompacto) -> bool:
+        """Cria os watches que cobrem ``caminho``. False se for preciso sondar."""
+        if self._libc is None:
+            return False
+        if not self._prender(os.path.dirname(caminho), caminho):
+            return False
+        if resultado.tipo == "diretorio":
+            self._prender(caminho, caminho)
+        return True
+
+    def _prender(self, diretorio: str, caminho: str) -> bool:
+        """Registra o interesse de ``caminho`` nos eventos de ``diretorio``."""
+        assert self._libc is not None  # Só chamado no backend inotify
+        if diretorio not in self._diretorio_wd:
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(diretorio), _MASCARA)
+            if wd < 0:
+                return False
+            self._diretorio_wd[diretorio] = wd
+            self._wd_diretorio[wd] = diretorio
+        self._interessados.setdefault(diretorio, set()).add(caminho)
+        return True
+
+    def _soltar(self, diretorio: str, caminho: str) -> None:
+        """Remove o interesse e, se ninguém mais depender dele, o watch."""
+        interessados = self._interessados.get(diretorio)
+        if interessados is None:
+            return
+        interessados.discard(caminho)
+        if interessados:
+            return
+        del self._interessados[diretorio]
+        wd = self._diretorio_wd.pop(diretorio, None)
+        if wd is not None:
+            self._wd_diretorio.pop(wd, None)
+            if self._libc is not None and self._fd >= 0:
+                self._libc.inotify_rm_watch(self._fd, wd)
+
+    def _esquecer_wd(self, wd: int) -> set[str]:
+        """Trata um watch removido pelo kernel; os dependentes passam à sondagem."""
+        diretorio = self._wd_diretorio.pop(wd, None)
+        if diretorio is None:
+            return set()
+        self._diretorio_wd.pop(diretorio, None)
+        afetados = self._interessados.pop(diretorio, set())
+        for caminho in afetados & self._observados:
+            # Só quem dependia deste watch como pai perde a cobertura
+            if os.path.dirname(caminho) == diretorio:
+                self._sondados.setdefault(caminho, None)
+        return afetados
+
+    # ------------------------------------------------------------------
+    # Laço da thread
+    # ------------------------------------------------------------------
+
+    def _despertar(self) -> None:
+        """Acorda o ``select`` para recalcular o tempo de espera."""
+        try:
+            os.write(self._escrita, b"\0")
+        except OSError:
+            pass
+
+    def _laco(self) -> None:
+        """Espera eventos (ou o próximo ciclo de sondagem) até ``parar``."""
+        proxima_sondagem = time.monotonic() + self._intervalo
+        while not self._parar.is_set():
+            with self._trava:
+                sondar = bool(self._sondados) or self._libc is None
+                espera = max(0.0, proxima_sondagem - time.monotonic()) if sondar else None
+                leitores = [self._leitura] + ([self._fd] if self._libc is not None else [])
+            try:
+                prontos, _, _ = select.select(leitores, [], [], espera)
+            except (OSError, ValueError):
+                return
+            if self._parar.is_set():
+                return
+            if self._leitura in prontos:
+                try:
+                    os.read(self._leitura, 4096)
+                except OSError:
+                    pass
+
+            afetados: set[str] = set()
+            if self._libc is not None and self._fd in prontos:
+                afetados |= self._drenar()
+            if sondar and time.monotonic() >= proxima_sondagem:
+                afetados |= self._sondar()
+                proxima_sondagem = time.monotonic() + self._intervalo
+            elif not sondar:
+                proxima_sondagem = time.monotonic() + self._intervalo
+            self._atualizar(afetados)
+
+    def _drenar(self) -> set[str]:
+        """Lê os eventos pendentes, esperando ``agrupar`` segundos por mais."""
+        afetados: set[str] = set()
+        while True:
+            try:
+                dados = os.read(self._fd, 65536)
+            except BlockingIOError:
+                dados = b""
+            except OSError:
+                return afetados
+            if dados:
+                with self._trava:
+                    afetados |= self._interpretar(dados)
+                continue
+            try:
+                prontos, _, _ = select.select([self._fd], [], [], self._agrupar)
+            except (OSError, ValueError):
+                return afetados
+            if not prontos:
+                return afetados
+
+    def _interpretar(self, dados: bytes) -> set[str]:
+        """Converte um bloco de ``inotify_event`` nos caminhos observados afetados."""
+        afetados: set[str] = set()
+        deslocamento = 0
+        while deslocamento + _CABECALHO.size <= len(dados):
+            wd, mascara, _cookie, tamanho = _CABECALHO.unpack_from(dados, deslocamento)
+            inicio = deslocamento + _CABECALHO.size
+            nome = dados[inicio:inicio + tamanho].rstrip(b"\0")
+            deslocamento = inicio + tamanho
+
+            if mascara & IN_Q_OVERFLOW:
+                afetados |= self._observados
+                continue
+            if mascara & IN_IGNORED:
+                afetados |= self._esquecer_wd(wd)
+                continue
+            diretorio = self._wd_diretorio.get(wd)
+            if diretorio is None:
+                continue
+            interessados = self._interessados.get(diretorio, ())
+            if nome:
+                filho = os.path.join(diretorio, os.fsdecode(nome))
+                if filho in interessados:
+                    afetados.add(filho)
+                if mascara & _MEMBROS and diretorio in interessados:
+                    afetados.add(diretorio)
+            elif mascara & (IN_DELETE_SELF | IN_MOVE_SELF) and diretorio in interessados:
+                afetados.add(diretorio)
+        return afetados
+
+    def _sondar(self) -> set[str]:
+        """Compara a assinatura dos caminhos sondados e tenta recuperar watches."""
+        afetados: set[str] = set()
+        with self._trava:
+            sondados = list(self._sondados.items())
+        for caminho, anterior in sondados:
+            atual = _assinatura(caminho)
+            with self._trava:
+                if caminho not in self._sondados:
+                    continue
+                if atual != anterior:
+                    self._sondados[caminho] = atual
+                    afetados.add(caminho)
+                if self._libc is not None and self._prender(os.path.dirname(caminho), caminho):
+                    del self._sondados[caminho]
+                    afetados.add(caminho)
+        return afetados
+
+    def _atualizar(self, afetados: set[str]) -> None:
+        """Revalida cada caminho afetado uma vez e notifica os interessados."""
+        for caminho in afetados:
+            with self._trava:
+                if caminho not in self._observados:
+                    continue
+            self.cache.invalidar(caminho)
+            resultado = self.cache.validar(caminho)
+            with self._trava:
+                if caminho not in self._observados:
+                    continue
+                if caminho not in self._sondados and self._libc is not None:
+                    # Um caminho pode virar (ou deixar de ser) diretório
+                    if resultado.tipo == "diretorio":
+                        self._prender(caminho, caminho)
+                    else:
+                        self._soltar(caminho, caminho)
+            # Uma falha de quem escuta não pode matar a thread do observador
+            try:
+                if self.eventos.ativo:
+                    self.eventos.emitir("caminho_alterado", caminho)
+                if self._ao_mudar is not None:
+                    self._ao_mudar(caminho, resultado)
+            except Exception:  # pylint: disable=broad-exception-caught
+                _logger.exception("Falha ao notificar a alteração de %s", caminho)
@@ -18,13 +18,21 @@ Pode ser usada tanto pela Model quanto pela Controller, conforme o escopo.
 """
 
 import os
-from pathlib import Path
-from typing import Literal, TypedDict
-import sys
+import stat
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from typing import TYPE_CHECKING, AsyncIterator, Iterable, Iterator, Literal, Optional, TypedDict
 
-# Garante que o diretório raiz esteja no sys.path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from mensagens.app_mensageiro import Exu  # noqa: E402
+from app.mensagens.app_mensageiro import Mensagem
+from app.utils.app_analisador import Ifa
+from app.utils.app_eventos import CanalEventos
+from app.utils.app_metricas import Oxum
+
+if TYPE_CHECKING:
+    # asyncio é pesado para importar; as APIs assíncronas o importam ao rodar
+    import asyncio
 
 
 class ResultadoValidacao(TypedDict):
@@ -37,14 +45,14 @@ class ResultadoValidacao(TypedDict):
         valido (bool): Se o caminho é válido e existente
         tipo (Literal): Tipo do caminho ('arquivo', 'diretorio' ou 'desconhecido')
         vazio (bool): Se o caminho está vazio (arquivo 0 bytes ou diretório sem itens)
-        mensagem (str): Mensagem semântica do status (gerada por Exu)
+        mensagem (Mensagem): Mensagem semântica adiada do Exu (texto via str())
     """
     caminho: str
     legivel: bool
     valido: bool
     tipo: Literal["arquivo", "diretorio", "desconhecido"]
     vazio: bool
-    mensagem: str
+    mensagem: Mensagem
 
 
 class Ogum:
@@ -55,18 +63,35 @@ class Ogum:
     de caminhos no sistema de arquivos, seguindo os princípios da mitologia africana.
 
     Métodos principais:
-        validar: Realiza validação completa do caminho
-        _existe: Verifica existência do caminho
-        _eh_legivel: Verifica permissões de leitura
-        _tipo_caminho: Identifica o tipo da entidade
-        _eh_vazio: Verifica se está vazio
+        validar: Realiza validação completa do caminho (um único stat por caminho)
+        validar_com_stat: Valida e devolve o stat usado (para caches)
+        validar_lote: Valida muitos caminhos em paralelo num pool de threads
+        validar_async: Versão assíncrona de validar, para loops de eventos
+        validar_async_iter: Iterador assíncrono sobre muitos caminhos
+        obter_stat: Obtém o stat do caminho, base de todas as verificações
+        legivel_por_stat / tipo_por_stat: Derivam permissão e tipo de um stat
+
+    Atributos:
+        eventos: CanalEventos onde cada etapa anuncia o que encontrou
+        metricas: Oxum que cronometra cada etapa quando ligada (``metricas.ligar()``)
     """
 
+    _IDENTIDADE: Optional[tuple[int, frozenset[int]]] = None
+
+    # Observadores das validações (sem ouvintes, nada é formatado nem emitido)
+    eventos = CanalEventos()
+    # Instrumentação opcional; desligada, custa uma verificação por validação
+    metricas = Oxum()
+
     @staticmethod
     def validar(caminho: str) -> ResultadoValidacao:
         """
             Realiza validação completa de um caminho no sistema de arquivos.
 
+            Todo o diagnóstico (existência, permissão, tipo e vazio) é derivado de
+            um único ``os.stat``; diretórios pagam apenas uma leitura extra da
+            primeira entrada para decidir se estão vazios.
+
             Args:
                 caminho: Caminho absoluto ou relativo a ser validado
 
@@ -78,108 +103,392 @@ class Ogum:
                 - Status de vazio
                 - Mensagem semântica do Exu
         """
-        resultado: ResultadoValidacao = {
-            "caminho": caminho,
-            "valido": False,
-            "legivel": False,
-            "tipo": "desconhecido",
-            "vazio": False,
-            "mensagem": Exu.caminho_invalido(caminho)  # Mensagem padrão inicial
-        }
+        return Ogum.validar_com_stat(caminho)[0]
 
-        # Validação em etapas com curto-circuito
-        if not caminho or not caminho.strip():
-            return resultado
+    @staticmethod
+    def validar_com_stat(
+        caminho: str,
+    ) -> tuple[ResultadoValidacao, Optional[os.stat_result]]:
+        """
+        Executa a validação e devolve também o ``os.stat`` que a originou.
 
-        resultado["valido"] = Ogum._existe(caminho)
-        if not resultado["valido"]:
-            resultado["mensagem"] = Exu.caminho_nao_encontrado(caminho)
-            return resultado
+        Usado por quem precisa guardar a assinatura do caminho (inode, mtime)
+        para revalidá-lo depois sem repetir todas as etapas.
 
-        resultado["legivel"] = Ogum._eh_legivel(caminho)
-        if not resultado["legivel"]:
-            resultado["mensagem"] = Exu.caminho_nao_legivel(caminho)
-            return resultado
+        Returns:
+            Tupla (resultado, stat). O stat é None quando o caminho é vazio ou
+            não existe.
+        """
+        # Etapas com curto-circuito; a mensagem é criada uma única vez, no ponto
+        # de saída, e só vira texto quando alguém a exibir. Com Ogum.metricas
+        # ligada, cada etapa é cronometrada (stat, legivel, tipo, vazio,
+        # mensagem e o total em 'validar'); desligada, custa um teste por etapa.
+        metricas: Optional[Oxum] = Ogum.metricas if Ogum.metricas.ativo else None
+        relogio = time.perf_counter_ns
+        inicio = relogio() if metricas is not None else 0
+        if not caminho or not caminho.strip():
+            return Ogum._concluir(metricas, inicio, caminho, "caminho_invalido")
+
+        estado = (
+            Ogum.obter_stat(caminho) if metricas is None else Ogum._stat_medido(caminho, metricas)
+        )
+        if Ogum.eventos.ativo:
+            Ogum.eventos.emitir(
+                "caminho_encontrado" if estado else "caminho_nao_encontrado", caminho
+            )
+        if estado is None:
+            return Ogum._concluir(metricas, inicio, caminho, "caminho_nao_encontrado")
+
+        antes = relogio() if metricas is not None else 0
+        legivel = Ogum.legivel_por_stat(estado)
+        if metricas is not None:
+            metricas.registrar("legivel", relogio() - antes)
+        if not legivel:
+            return Ogum._concluir(
+                metricas, inicio, caminho, "caminho_nao_legivel", estado, valido=True
+            )
 
-        resultado["tipo"] = Ogum._tipo_caminho(caminho)
+        antes = relogio() if metricas is not None else 0
+        tipo = Ogum.tipo_por_stat(estado)
+        if metricas is not None:
+            metricas.registrar("tipo", relogio() - antes)
 
         # Verificação de conteúdo apenas para tipos conhecidos
-        if resultado["tipo"] in ("arquivo", "diretorio"):
-            resultado["vazio"] = Ogum._eh_vazio(caminho)
-            resultado["mensagem"] = Ogum._gerar_mensagem_final(
-                caminho,
-                resultado["tipo"],
-                resultado["vazio"]
+        if tipo == "desconhecido":
+            return Ogum._concluir(
+                metricas, inicio, caminho, "tipo_nao_suportado", estado,
+                valido=True, legivel=True,
             )
-        else:
-            resultado["mensagem"] = Exu.tipo_nao_suportado(caminho)
 
-        return resultado
+        antes = relogio() if metricas is not None else 0
+        vazio = Ogum._vazio_por_stat(caminho, estado)
+        if metricas is not None:
+            metricas.registrar(
+                "vazio", relogio() - antes, syscalls=int(tipo == "diretorio")
+            )
+        return Ogum._concluir(
+            metricas, inicio, caminho, Ogum._codigo_mensagem_final(tipo, vazio), estado,
+            valido=True, legivel=True, tipo=tipo, vazio=vazio,
+        )
 
     @staticmethod
-    def _gerar_mensagem_final(caminho: str, tipo: str, vazio: bool) -> str:
-        """Seleciona a mensagem final apropriada baseada no tipo e status."""
-        if tipo == "arquivo" and vazio:
-            return Exu.arquivo_vazio(caminho)
-        if tipo == "diretorio" and vazio:
-            return Exu.diretorio_vazio(caminho)
-        return Exu.caminho_valido(caminho)
+    def _stat_medido(caminho: str, metricas: Oxum) -> Optional[os.stat_result]:
+        """``obter_stat`` cronometrado, separando 'não existe' de erro de acesso."""
+        antes = time.perf_counter_ns()
+        erro = False
+        try:
+            estado: Optional[os.stat_result] = os.stat(caminho)
+        except FileNotFoundError:
+            estado = None
+        except (OSError, ValueError):
+            estado, erro = None, True
+        metricas.registrar("stat", time.perf_counter_ns() - antes, erro, syscalls=1)
+        return estado
 
     @staticmethod
-    def _existe(caminho: str) -> bool:
-        """Verifica existência do caminho com mensagem semântica."""
-        existe = Path(caminho).exists()
-        print(Exu.caminho_encontrado(caminho) if existe else Exu.caminho_nao_encontrado(caminho))
-        return existe
+    def _concluir(
+        metricas: Optional[Oxum],
+        inicio: int,
+        caminho: str,
+        codigo: str,
+        estado: Optional[os.stat_result] = None,
+        valido: bool = False,
+        legivel: bool = False,
+        tipo: Literal["arquivo", "diretorio", "desconhecido"] = "desconhecido",
+        vazio: bool = False,
+    ) -> tuple[ResultadoValidacao, Optional[os.stat_result]]:
+        """Monta o resultado de saída da validação, registrando os tempos se medida."""
+        if metricas is None:
+            return Ogum._resultado(caminho, codigo, valido, legivel, tipo, vazio), estado
+        antes = time.perf_counter_ns()
+        resultado = Ogum._resultado(caminho, codigo, valido, legivel, tipo, vazio)
+        fim = time.perf_counter_ns()
+        metricas.registrar("mensagem", fim - antes)
+        metricas.registrar("validar", fim - inicio)
+        return resultado, estado
 
     @staticmethod
-    def _eh_legivel(caminho: str) -> bool:
-        """Verifica permissão de leitura no caminho."""
-        return os.access(caminho, os.R_OK)
+    def _resultado(
+        caminho: str,
+        codigo: str,
+        valido: bool = False,
+        legivel: bool = False,
+        tipo: Literal["arquivo", "diretorio", "desconhecido"] = "desconhecido",
+        vazio: bool = False,
+    ) -> ResultadoValidacao:
+        """Monta o ResultadoValidacao com a mensagem adiada de ``codigo``."""
+        return {
+            "caminho": caminho,
+            "valido": valido,
+            "legivel": legivel,
+            "tipo": tipo,
+            "vazio": vazio,
+            "mensagem": Mensagem(codigo, caminho),
+        }
 
     @staticmethod
-    def obter_nome_arquivo(caminho: str) -> str:
-        """~"""
-        return caminho
+    def validar_lote(
+        caminhos: Iterable[str],
+        workers: int = 8,
+        ordenado: bool = True,
+        timeout: Optional[float] = None,
+    ) -> Iterator[ResultadoValidacao]:
+        """
+        Valida uma sequência de caminhos num pool limitado de threads.
+
+        A entrada é consumida sob demanda: no máximo ``workers * 4`` validações
+        ficam em andamento, então iteráveis enormes (manifestos, geradores)
+        são processados com memória constante.
+
+        Args:
+            caminhos: Iterável de caminhos a validar
+            workers: Número máximo de threads de validação
+            ordenado: True mantém a ordem de entrada; False entrega os
+                resultados conforme ficam prontos
+            timeout: Tempo máximo em segundos por caminho, contado a partir da
+                submissão. Caminhos que estouram recebem ``valido=False`` e a
+                mensagem ``Exu.tempo_esgotado``. A chamada bloqueada continua
+                ocupando sua thread até o sistema operacional responder.
+
+        Yields:
+            Um ResultadoValidacao por caminho de entrada.
+        """
+        if workers < 1:
+            raise ValueError("workers deve ser maior ou igual a 1")
+
+        janela = workers * 4
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ogum")
+        pendentes: deque[tuple[str, float, Future]] = deque()
+        try:
+            for caminho in caminhos:
+                if len(pendentes) >= janela:
+                    if ordenado:
+                        yield Ogum._colher(pendentes.popleft(), timeout)
+                    else:
+                        yield from Ogum._colher_prontos(pendentes, timeout)
+                futuro = executor.submit(Ogum.validar, caminho)
+                pendentes.append((caminho, time.monotonic(), futuro))
+
+            while pendentes:
+                if ordenado:
+                    yield Ogum._colher(pendentes.popleft(), timeout)
+                else:
+                    yield from Ogum._colher_prontos(pendentes, timeout)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    async def validar_async(
+        caminho: str,
+        semaforo: Optional["asyncio.Semaphore"] = None,
+        executor: Optional[Executor] = None,
+    ) -> ResultadoValidacao:
+        """
+        Valida um caminho sem bloquear o loop de eventos.
+
+        As chamadas ao disco rodam em ``executor`` (ou no executor padrão do
+        loop). Cancelar a corrotina libera quem a aguarda imediatamente; a
+        thread termina o stat em andamento e o resultado é descartado.
+
+        Args:
+            caminho: Caminho a validar
+            semaforo: Limita quantas validações rodam ao mesmo tempo
+            executor: Executor onde o trabalho bloqueante é executado
+
+        Returns:
+            ResultadoValidacao do caminho.
+        """
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        loop = asyncio.get_running_loop()
+        if semaforo is None:
+            return await loop.run_in_executor(executor, Ogum.validar, caminho)
+        async with semaforo:
+            return await loop.run_in_executor(executor, Ogum.validar, caminho)
+
+    @staticmethod
+    async def validar_async_iter(
+        caminhos: Iterable[str],
+        concorrencia: int = 64,
+        executor: Optional[Executor] = None,
+    ) -> AsyncIterator[ResultadoValidacao]:
+        """
+        Valida muitos caminhos de forma assíncrona, entregando-os conforme terminam.
+
+        Um semáforo limita as validações simultâneas a ``concorrencia`` e a
+        entrada é consumida aos poucos, então não há uma tarefa por caminho em
+        memória. Encerrar o iterador (``break``, ``aclose`` ou cancelamento da
+        tarefa consumidora) cancela todas as validações pendentes.
+
+        Args:
+            caminhos: Iterável de caminhos a validar
+            concorrencia: Número máximo de validações em andamento
+            executor: Executor onde o trabalho bloqueante é executado
+
+        Yields:
+            Um ResultadoValidacao por caminho, em ordem de conclusão.
+        """
+        if concorrencia < 1:
+            raise ValueError("concorrencia deve ser maior ou igual a 1")
+
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        semaforo = asyncio.Semaphore(concorrencia)
+        pendentes: set["asyncio.Task"] = set()
+        try:
+            for caminho in caminhos:
+                if len(pendentes) >= concorrencia:
+                    prontas, pendentes = await asyncio.wait(
+                        pendentes, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for tarefa in prontas:
+                        yield tarefa.result()
+                pendentes.add(asyncio.ensure_future(
+                    Ogum.validar_async(caminho, semaforo, executor)
+                ))
+
+            while pendentes:
+                prontas, pendentes = await asyncio.wait(
+                    pendentes, return_when=asyncio.FIRST_COMPLETED
+                )
+                for tarefa in prontas:
+                    yield tarefa.result()
+        finally:
+            for tarefa in pendentes:
+                tarefa.cancel()
 
     @staticmethod
-    def _eh_vazio(caminho: str) -> bool:
-        """Verifica se o caminho está vazio (arquivo ou diretório)."""
-        path = Path(caminho)
+    def _colher(
+        pendente: tuple[str, float, Future], timeout: Optional[float]
+    ) -> ResultadoValidacao:
+        """Aguarda uma validação do lote respeitando o prazo do caminho."""
+        caminho, submetido_em, futuro = pendente
+        restante = None
+        if timeout is not None:
+            restante = max(0.0, submetido_em + timeout - time.monotonic())
         try:
-            if path.is_file():
-                return path.stat().st_size == 0
-            if path.is_dir():
-                return not any(path.iterdir())
-        except OSError:
-            return True  # Considera como vazio se não puder verificar
-        return False
+            return futuro.result(timeout=restante)
+        except FuturesTimeoutError:
+            futuro.cancel()
+            return Ogum._resultado_tempo_esgotado(caminho)
+
+    @staticmethod
+    def _colher_prontos(
+        pendentes: deque[tuple[str, float, Future]], timeout: Optional[float]
+    ) -> Iterator[ResultadoValidacao]:
+        """Entrega, fora de ordem, as validações concluídas ou vencidas do lote."""
+        restante = None
+        if timeout is not None:
+            prazo = min(submetido_em for _, submetido_em, _ in pendentes) + timeout
+            restante = max(0.0, prazo - time.monotonic())
+        wait([futuro for _, _, futuro in pendentes], timeout=restante,
+             return_when=FIRST_COMPLETED)
+
+        agora = time.monotonic()
+        for _ in range(len(pendentes)):
+            pendente = pendentes.popleft()
+            _, submetido_em, futuro = pendente
+            vencido = timeout is not None and agora >= submetido_em + timeout
+            if futuro.done() or vencido:
+                yield Ogum._colher(pendente, timeout)
+            else:
+                pendentes.append(pendente)
+
+    @staticmethod
+    def _resultado_tempo_esgotado(caminho: str) -> ResultadoValidacao:
+        """Monta o resultado de um caminho cuja validação excedeu o prazo."""
+        return Ogum._resultado(caminho, "tempo_esgotado")
+
+    @staticmethod
+    def obter_stat(caminho: str) -> Optional[os.stat_result]:
+        """Executa o único ``os.stat`` da validação; ``None`` se o caminho não existe."""
+        try:
+            return os.stat(caminho)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _identidade() -> tuple[int, frozenset[int]]:
+        """Retorna (uid real, grupos) do processo, calculados uma única vez."""
+        if Ogum._IDENTIDADE is None:
+            grupos = {os.getgid(), *os.getgroups()}
+            Ogum._IDENTIDADE = (os.getuid(), frozenset(grupos))
+        return Ogum._IDENTIDADE
 
     @staticmethod
-    def _eh_arquivo(caminho: str) -> bool:
-        """Verifica se o caminho é um arquivo."""
-        return Path(caminho).is_file()
+    def legivel_por_stat(estado: os.stat_result) -> bool:
+        """
+        Deduz a permissão de leitura a partir dos bits de modo do ``stat``.
+
+        Reproduz a regra de ``os.access(caminho, os.R_OK)`` para o uid real do
+        processo (dono, grupo, outros; root sempre lê). ACLs estendidas não são
+        consideradas. Em sistemas sem uid (Windows) usa apenas ``S_IREAD``.
+        """
+        if not hasattr(os, "getuid"):
+            return bool(estado.st_mode & stat.S_IREAD)
+        uid, grupos = Ogum._identidade()
+        if uid == 0:
+            return True
+        if estado.st_uid == uid:
+            return bool(estado.st_mode & stat.S_IRUSR)
+        if estado.st_gid in grupos:
+            return bool(estado.st_mode & stat.S_IRGRP)
+        return bool(estado.st_mode & stat.S_IROTH)
 
     @staticmethod
-    def _eh_diretorio(caminho: str) -> bool:
-        """Verifica se o caminho é um diretório."""
-        return Path(caminho).is_dir()
+    def tipo_por_stat(estado: os.stat_result) -> Literal["arquivo", "diretorio", "desconhecido"]:
+        """Identifica o tipo do caminho a partir do modo do ``stat``."""
+        if stat.S_ISREG(estado.st_mode):
+            return "arquivo"
+        if stat.S_ISDIR(estado.st_mode):
+            return "diretorio"
+        return "desconhecido"
 
     @staticmethod
-    def _tipo_caminho(caminho: str) -> Literal["arquivo", "diretorio", "desconhecido"]:
-        """Identifica o tipo do caminho com fallback para desconhecido."""
-        return ("arquivo" if Ogum._eh_arquivo(caminho) else
-                "diretorio" if Ogum._eh_diretorio(caminho) else
-                "desconhecido")
+    def _vazio_por_stat(caminho: str, estado: os.stat_result) -> bool:
+        """
+        Verifica se o caminho está vazio usando o ``stat`` já obtido.
+
+        Arquivos usam ``st_size``; diretórios leem no máximo uma entrada, pois o
+        tamanho de um diretório não indica se ele possui itens.
+        """
+        if stat.S_ISREG(estado.st_mode):
+            return estado.st_size == 0
+        if stat.S_ISDIR(estado.st_mode):
+            try:
+                with os.scandir(caminho) as entradas:
+                    return next(entradas, None) is None
+            except OSError:
+                return True  # Considera como vazio se não puder verificar
+        return False
+
+    @staticmethod
+    def _codigo_mensagem_final(tipo: str, vazio: bool) -> str:
+        """Seleciona o código da mensagem final baseado no tipo e status."""
+        if tipo == "arquivo" and vazio:
+            return "arquivo_vazio"
+        if tipo == "diretorio" and vazio:
+            return "diretorio_vazio"
+        return "caminho_valido"
+
+    @staticmethod
+    def obter_nome_arquivo(caminho: str) -> str:
+        """~"""
+        return caminho
 
     @staticmethod
     def obter_metadados(caminho: str) -> dict:
-        """Obtém metadados básicos do caminho (nome, extensão, diretório pai)."""
-        path = Path(caminho)
+        """
+        Obtém metadados básicos do caminho (nome, extensão, diretório pai).
+
+        A análise é puramente sintática (Ifa) e respeita o sistema do caminho,
+        não o do computador onde o app roda.
+        """
+        analise = Ifa.analisar(caminho)
         return {
-            "nome": path.stem,
-            "extensao": path.suffix or "",
-            "diretorio_pai": str(path.parent)
+            "nome": analise.stem,
+            "extensao": analise.sufixo,
+            "diretorio_pai": analise.pai
         }
 
 
@@ -210,4 +519,5 @@ if __name__ == "__main__":
         "/caminho/inexistente/arquivo.txt",
         "/root/arquivo_secreto.txt",
     ]
+    Ogum.eventos.inscrever(lambda evento: print(evento.renderizar()))
     testar_ogum(caminhos_teste)
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""
+app_uso_disco.py
+
+Uso de disco por diretório ("para onde foi o espaço?"), no estilo do ``du``.
+
+Iroko, a árvore sagrada, soma tamanhos e contagens de baixo para cima numa
+única passada sobre a varredura do Oxossi. A varredura é em pré-ordem, então
+um diretório está completo assim que aparece uma entrada de profundidade
+igual ou menor que a dele: nesse momento seus totais são somados aos do pai e
+ele sai da pilha. A pilha só guarda os diretórios abertos do ramo atual, por
+isso a memória cresce com a profundidade da árvore, não com o número de
+entradas.
+
+Dos maiores arquivos, diretórios e filhos diretos da raiz são mantidos apenas
+os ``limite`` primeiros, em heaps de tamanho fixo.
+
+Os tamanhos são os aparentes (``st_size``) dos arquivos; o tamanho dos
+próprios diretórios e os blocos realmente alocados não entram na conta. Como
+no ``du``, um arquivo com vários links físicos dentro da árvore é contado uma
+única vez, no primeiro nome encontrado; só os arquivos com ``st_nlink > 1``
+são lembrados (por dispositivo e inode).
+"""
+
+import heapq
+from itertools import count
+from typing import Callable, Iterable, NamedTuple, Optional
+
+from app.utils.app_varredura import Oxossi
+
+# Entradas processadas entre duas chamadas de ``progresso``/``cancelado``
+_INTERVALO_AVISO = 2048
+
+
+class ItemUso(NamedTuple):
+    """
+    Espaço ocupado por um arquivo ou diretório.
+
+    Atributos:
+        caminho (str): Caminho do item
+        bytes (int): Soma dos tamanhos dos arquivos (o próprio, se for arquivo)
+        arquivos (int): Arquivos contidos (1 para um arquivo)
+        diretorios (int): Subdiretórios contidos, em qualquer profundidade
+        diretorio (bool): Se o item é um diretório
+    """
+    caminho: str
+    bytes: int
+    arquivos: int
+    diretorios: int
+    diretorio: bool
+
+
+class UsoDisco(NamedTuple):
+    """
+    Resultado de ``Iroko.medir``.
+
+    Atributos:
+        raiz (ItemUso): Totais da raiz
+        maiores_arquivos (list[ItemUso]): Maiores arquivos, do maior ao menor
+        maiores_diretorios (list[ItemUso]): Maiores diretórios (exceto a raiz)
+        filhos (list[ItemUso]): Maiores filhos diretos da raiz
+        ilegiveis (int): Entradas sem permissão de leitura (diretórios não são somados)
+        invalidos (int): Entradas que não puderam ser lidas (ex.: links quebrados)
+        interrompido (bool): Se ``cancelado`` encerrou a medição antes do fim
+    """
+    raiz: ItemUso
+    maiores_arquivos: list[ItemUso]
+    maiores_diretorios: list[ItemUso]
+    filhos: list[ItemUso]
+    ilegiveis: int
+    invalidos: int
+    interrompido: bool = False
+
+
+class _Acumulador:
+    """Totais de um diretório ainda aberto na pilha."""
+
+    __slots__ = ("caminho", "profundidade", "bytes", "arquivos", "diretorios")
+
+    def __init__(self, caminho: str, profundidade: int) -> None:
+        self.caminho = caminho
+        self.profundidade = profundidade
+        self.bytes = 0
+        self.arquivos = 0
+        self.diretorios = 0
+
+    def item(self) -> ItemUso:
+        return ItemUso(self.caminho, self.bytes, self.arquivos, self.diretorios, True)
+
+
+class _Maiores:
+    """Heap mínimo limitado aos ``limite`` maiores itens por bytes."""
+
+    __slots__ = ("limite", "heap", "_ordem")
+
+    def __init__(self, limite: int) -> None:
+        self.limite = limite
+        self.heap: list[tuple[int, int, ItemUso]] = []
+        self._ordem = count()  # Desempate estável; ItemUso nunca é comparado
+
+    def oferecer(self, item: ItemUso) -> None:
+        if self.limite <= 0:
+            return
+        chave = (item.bytes, -next(self._ordem), item)
+        if len(self.heap) < self.limite:
+            heapq.heappush(self.heap, chave)
+        elif chave[:2] > self.heap[0][:2]:
+            heapq.heapreplace(self.heap, chave)
+
+    def ordenados(self) -> list[ItemUso]:
+        return [item for *_, item in sorted(self.heap, key=lambda chave: chave[:2], reverse=True)]
+
+
+class Iroko:
+    """
+    Árvore sagrada - Mede quanto espaço cada ramo da árvore de diretórios ocupa.
+
+    Métodos principais:
+        medir: Soma tamanhos e contagens de baixo para cima em uma passada
+    """
+
+    @staticmethod
+    def medir(
+        raiz: str,
+        limite: int = 20,
+        excluir: Iterable[str] = (),
+        progresso: Optional[Callable[[int], None]] = None,
+        cancelado: Optional[Callable[[], bool]] = None,
+    ) -> UsoDisco:
+        """
+        Mede o uso de disco de ``raiz``.
+
+        Args:
+            raiz: Diretório (ou arquivo) a medir
+            limite: Quantidade de itens mantidos em cada lista de maiores
+            excluir: Padrões glob repassados ao ``Oxossi.varrer``
+            progresso: Chamado periodicamente com o número de entradas lidas
+            cancelado: Consultado periodicamente; se devolver True a medição
+                para e o resultado parcial é devolvido com ``interrompido``
+
+        Returns:
+            UsoDisco com os totais da raiz e as listas de maiores itens.
+        """
+        arquivos_maiores = _Maiores(limite)
+        diretorios_maiores = _Maiores(limite)
+        filhos = _Maiores(limite)
+        pilha: list[_Acumulador] = []
+        ilegiveis = invalidos = entradas = 0
+        vistos: set[tuple[int, int]] = set()  # (dispositivo, inode) com vários links
+        interrompido = False
+        total: Optional[ItemUso] = None
+
+        def fechar(acumulador: _Acumulador) -> None:
+            """Soma o diretório concluído ao pai e o oferece aos heaps."""
+            nonlocal total
+            item = acumulador.item()
+            if not pilha:
+                total = item
+                return
+            pai = pilha[-1]
+            pai.bytes += acumulador.bytes
+            pai.arquivos += acumulador.arquivos
+            pai.diretorios += acumulador.diretorios + 1
+            diretorios_maiores.oferecer(item)
+            if len(pilha) == 1:
+                filhos.oferecer(item)
+
+        registros = Oxossi.varrer(raiz, excluir=excluir)
+        try:
+            for registro in registros:
+                entradas += 1
+                if entradas % _INTERVALO_AVISO == 0:
+                    if cancelado is not None and cancelado():
+                        interrompido = True
+                        break
+                    if progresso is not None:
+                        progresso(entradas)
+
+                profundidade = registro["profundidade"]
+                while pilha and pilha[-1].profundidade >= profundidade:
+                    fechar(pilha.pop())
+
+                if not registro["valido"]:
+                    invalidos += 1
+                    continue
+                if not registro["legivel"]:
+                    ilegiveis += 1
+                tipo = registro["tipo"]
+                if tipo == "diretorio":
+                    pilha.append(_Acumulador(registro["caminho"], profundidade))
+                elif tipo == "arquivo":
+                    if registro["links_fisicos"] > 1:
+                        identidade = (registro["dispositivo"], registro["inode"])
+                        if identidade in vistos:
+                            continue
+                        vistos.add(identidade)
+                    item = ItemUso(registro["caminho"], registro["tamanho"], 1, 0, False)
+                    arquivos_maiores.oferecer(item)
+                    if not pilha:
+                        total = item
+                        continue
+                    acumulador = pilha[-1]
+                    acumulador.bytes += item.bytes
+                    acumulador.arquivos += 1
+                    if len(pilha) == 1:
+                        filhos.oferecer(item)
+        finally:
+            registros.close()
+
+        while pilha:
+            fechar(pilha.pop())
+
+        return UsoDisco(
+            raiz=total or ItemUso(raiz, 0, 0, 0, False),
+            maiores_arquivos=arquivos_maiores.ordenados(),
+            maiores_diretorios=diretorios_maiores.ordenados(),
+            filhos=filhos.ordenados(),
+            ilegiveis=ilegiveis,
+            invalidos=invalidos,
+            interrompido=interrompido,
+        )
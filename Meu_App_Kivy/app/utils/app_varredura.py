@@ -0,0 +1,473 @@
+# -*- coding: utf-8 -*-
+"""
+app_varredura.py
+
+Varredura recursiva e em fluxo de árvores de diretórios.
+
+Oxossi, o caçador, percorre a árvore com ``os.scandir`` e entrega um registro
+por entrada no mesmo formato do ``ResultadoValidacao`` do Ogum, acrescido de
+profundidade, tamanho, mtime e inode. O percurso é iterativo (pré-ordem) e a
+memória usada cresce apenas com a profundidade da árvore: cada nível mantém um
+único iterador do ``scandir`` aberto, nunca a lista de entradas.
+
+Para volumes grandes, ``Oxossi.varrer_paralelo`` distribui as subárvores entre
+processos e devolve apenas as estatísticas agregadas (EstatisticasVarredura).
+"""
+
+import fnmatch
+import math
+import os
+import re
+import stat
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Callable, Generator, Iterable, Literal, Optional
+
+from app.mensagens.app_mensageiro import Mensagem
+from app.utils.app_tools import Ogum, ResultadoValidacao
+
+PoliticaLinks = Literal["ignorar", "listar", "seguir"]
+
+
+class EntradaVarredura(ResultadoValidacao):
+    """
+    Registro de uma entrada encontrada na varredura.
+
+    Atributos (além dos de ResultadoValidacao):
+        profundidade (int): Distância até a raiz (a raiz tem profundidade 0)
+        tamanho (int): ``st_size`` da entrada (0 se não pôde ser lida)
+        mtime_ns (int): ``st_mtime_ns`` da entrada
+        inode (int): ``st_ino`` da entrada
+        dispositivo (int): ``st_dev`` da entrada (com ``inode``, identifica o arquivo)
+        links_fisicos (int): ``st_nlink`` da entrada (nomes do mesmo arquivo)
+        link (bool): Se a entrada é um link simbólico (dados são do alvo)
+    """
+    profundidade: int
+    tamanho: int
+    mtime_ns: int
+    inode: int
+    dispositivo: int
+    links_fisicos: int
+    link: bool
+
+
+class EstatisticasVarredura:
+    """
+    Totais de uma varredura, acumuláveis e combináveis entre processos.
+
+    Atributos:
+        entradas (int): Total de entradas contabilizadas
+        por_tipo (dict): Contagem por tipo ('arquivo', 'diretorio', 'desconhecido')
+        arquivos_vazios (int): Arquivos com 0 bytes
+        diretorios_vazios (int): Diretórios sem itens
+        ilegiveis (int): Entradas sem permissão de leitura
+        invalidos (int): Entradas que não puderam ser lidas (ex.: links quebrados)
+        bytes_total (int): Soma de ``st_size`` dos arquivos
+        bytes_por_extensao (dict): Soma de ``st_size`` dos arquivos por extensão
+    """
+
+    __slots__ = (
+        "entradas", "por_tipo", "arquivos_vazios", "diretorios_vazios",
+        "ilegiveis", "invalidos", "bytes_total", "bytes_por_extensao",
+    )
+
+    def __init__(self) -> None:
+        self.entradas = 0
+        self.por_tipo: dict[str, int] = {}
+        self.arquivos_vazios = 0
+        self.diretorios_vazios = 0
+        self.ilegiveis = 0
+        self.invalidos = 0
+        self.bytes_total = 0
+        self.bytes_por_extensao: dict[str, int] = {}
+
+    def __getstate__(self) -> tuple:
+        return tuple(getattr(self, campo) for campo in self.__slots__)
+
+    def __setstate__(self, estado: tuple) -> None:
+        for campo, valor in zip(self.__slots__, estado):
+            setattr(self, campo, valor)
+
+    def registrar(self, entrada: EntradaVarredura) -> None:
+        """Contabiliza uma entrada produzida por ``Oxossi.varrer``."""
+        self.entradas += 1
+        tipo = entrada["tipo"]
+        self.por_tipo[tipo] = self.por_tipo.get(tipo, 0) + 1
+        if not entrada["valido"]:
+            self.invalidos += 1
+            return
+        if not entrada["legivel"]:
+            self.ilegiveis += 1
+        if tipo == "arquivo":
+            tamanho = entrada["tamanho"]
+            self.bytes_total += tamanho
+            extensao = _extensao(entrada["caminho"])
+            self.bytes_por_extensao[extensao] = self.bytes_por_extensao.get(extensao, 0) + tamanho
+            if entrada["vazio"]:
+                self.arquivos_vazios += 1
+        elif tipo == "diretorio" and entrada["vazio"]:
+            self.diretorios_vazios += 1
+
+    def mesclar(self, outra: "EstatisticasVarredura") -> None:
+        """Soma os totais de outra estatística a esta."""
+        self.entradas += outra.entradas
+        self.arquivos_vazios += outra.arquivos_vazios
+        self.diretorios_vazios += outra.diretorios_vazios
+        self.ilegiveis += outra.ilegiveis
+        self.invalidos += outra.invalidos
+        self.bytes_total += outra.bytes_total
+        for tipo, quantidade in outra.por_tipo.items():
+            self.por_tipo[tipo] = self.por_tipo.get(tipo, 0) + quantidade
+        for extensao, tamanho in outra.bytes_por_extensao.items():
+            self.bytes_por_extensao[extensao] = self.bytes_por_extensao.get(extensao, 0) + tamanho
+
+    def to_dict(self) -> dict:
+        """Representação em dicionário, pronta para JSON."""
+        return {campo: getattr(self, campo) for campo in self.__slots__}
+
+
+def _extensao(caminho: str) -> str:
+    """Extensão do último componente, com a mesma regra de ``Path.suffix``."""
+    nome = caminho[caminho.rfind(os.sep) + 1:]
+    indice = nome.rfind(".")
+    return nome[indice:] if 0 < indice < len(nome) - 1 else ""
+
+
+def _trabalhar(
+    diretorios: list[tuple[str, int]],
+    orcamento: int,
+    profundidade_maxima: Optional[int],
+    excluir: tuple[str, ...],
+    links: PoliticaLinks,
+) -> tuple[EstatisticasVarredura, list[tuple[str, int]]]:
+    """
+    Tarefa executada nos processos de ``Oxossi.varrer_paralelo``.
+
+    Lista os diretórios recebidos (um nível por vez) e desce nos filhos até
+    contabilizar ``orcamento`` entradas. Os diretórios ainda não visitados são
+    devolvidos ao coordenador, que os redistribui entre os processos ociosos.
+    """
+    estatisticas = EstatisticasVarredura()
+    pilha = list(diretorios)
+    while pilha and estatisticas.entradas < orcamento:
+        caminho, profundidade = pilha.pop()
+        registros = Oxossi.varrer(caminho, profundidade_maxima=1, excluir=excluir, links=links)
+        next(registros, None)  # o próprio diretório já foi contado por quem o listou
+        for registro in registros:
+            registro["profundidade"] += profundidade
+            estatisticas.registrar(registro)
+            if _deve_descer(registro, profundidade_maxima):
+                pilha.append((registro["caminho"], registro["profundidade"]))
+    return estatisticas, pilha
+
+
+def _deve_descer(registro: EntradaVarredura, profundidade_maxima: Optional[int]) -> bool:
+    """Indica se a varredura paralela precisa listar o diretório do registro."""
+    return (
+        registro["tipo"] == "diretorio"
+        and registro["legivel"]
+        and not registro["vazio"]
+        and not registro["link"]
+        and Oxossi._pode_descer(registro["profundidade"], profundidade_maxima)
+    )
+
+
+class _Quadro:
+    """Um nível da pilha de varredura: o iterador aberto de um diretório."""
+
+    __slots__ = ("iterador", "pendente", "relativo", "profundidade", "chave")
+
+    def __init__(
+        self,
+        iterador: "os._ScandirIterator",
+        pendente: Optional[os.DirEntry],
+        relativo: str,
+        profundidade: int,
+        chave: tuple[int, int],
+    ) -> None:
+        self.iterador = iterador
+        self.pendente = pendente
+        self.relativo = relativo
+        self.profundidade = profundidade
+        self.chave = chave
+
+    def proxima(self) -> Optional[os.DirEntry]:
+        """Entrega a próxima entrada do diretório, ou None ao terminar."""
+        if self.pendente is not None:
+            entrada, self.pendente = self.pendente, None
+            return entrada
+        try:
+            return next(self.iterador, None)
+        except OSError:
+            return None
+
+
+class Oxossi:
+    """
+    Caçador dos caminhos - Rastreia árvores inteiras sem carregá-las na memória.
+
+    Métodos principais:
+        varrer: Percorre a árvore entregando um EntradaVarredura por entrada
+        agregar: Resume uma varredura sequencial em EstatisticasVarredura
+        varrer_paralelo: Resume a árvore usando vários processos
+    """
+
+    @staticmethod
+    def varrer(
+        raiz: str,
+        profundidade_maxima: Optional[int] = None,
+        incluir: Iterable[str] = (),
+        excluir: Iterable[str] = (),
+        links: PoliticaLinks = "ignorar",
+    ) -> Generator[EntradaVarredura, None, None]:
+        """
+        Percorre ``raiz`` em pré-ordem, entregando as entradas conforme são lidas.
+
+        O gerador só avança quando o consumidor pede o próximo item, então a
+        varredura acompanha o ritmo de quem a consome. Interromper a iteração
+        fecha todos os diretórios abertos.
+
+        Args:
+            raiz: Diretório (ou arquivo) inicial
+            profundidade_maxima: Profundidade máxima entregue; None não limita
+            incluir: Padrões glob; se informados, só entradas cujo nome ou
+                caminho relativo casar com algum são entregues (a descida em
+                diretórios continua normalmente)
+            excluir: Padrões glob de entradas ignoradas junto com toda a sua
+                subárvore
+            links: 'ignorar' pula links simbólicos; 'listar' entrega o alvo do
+                link sem descer nele; 'seguir' também desce em links para
+                diretórios, protegendo contra ciclos
+
+        Yields:
+            EntradaVarredura de cada entrada visitada, começando pela raiz
+            (que é sempre entregue, independentemente de ``incluir``).
+        """
+        casa_incluir = Oxossi._compilar(incluir)
+        casa_excluir = Oxossi._compilar(excluir)
+
+        estado = Ogum.obter_stat(raiz)
+        if estado is None:
+            yield Oxossi._registro(raiz, None, 0, False, "caminho_nao_encontrado")
+            return
+
+        pilha: list[_Quadro] = []
+        ancestrais: set[tuple[int, int]] = set()
+        try:
+            registro, quadro = Oxossi._visitar(
+                raiz, "", estado, 0, Oxossi._pode_descer(0, profundidade_maxima)
+            )
+            yield registro
+            if quadro is not None:
+                pilha.append(quadro)
+                ancestrais.add(quadro.chave)
+
+            while pilha:
+                topo = pilha[-1]
+                entrada = topo.proxima()
+                if entrada is None:
+                    topo.iterador.close()
+                    ancestrais.discard(topo.chave)
+                    pilha.pop()
+                    continue
+
+                nome = entrada.name
+                relativo = f"{topo.relativo}/{nome}" if topo.relativo else nome
+                if casa_excluir and (casa_excluir(nome) or casa_excluir(relativo)):
+                    continue
+
+                eh_link = entrada.is_symlink()
+                if eh_link and links == "ignorar":
+                    continue
+
+                profundidade = topo.profundidade + 1
+                try:
+                    estado = entrada.stat(follow_symlinks=True)
+                except OSError:
+                    registro = Oxossi._registro(
+                        entrada.path, None, profundidade, False, "caminho_nao_encontrado"
+                    )
+                    registro["link"] = eh_link
+                    yield registro
+                    continue
+
+                descer = Oxossi._pode_descer(profundidade, profundidade_maxima) and (
+                    not eh_link or links == "seguir"
+                ) and (estado.st_dev, estado.st_ino) not in ancestrais
+                registro, quadro = Oxossi._visitar(
+                    entrada.path, relativo, estado, profundidade, descer
+                )
+                registro["link"] = eh_link
+                if not casa_incluir or casa_incluir(nome) or casa_incluir(relativo):
+                    yield registro
+                if quadro is not None:
+                    pilha.append(quadro)
+                    ancestrais.add(quadro.chave)
+        finally:
+            for quadro in pilha:
+                quadro.iterador.close()
+
+    @staticmethod
+    def agregar(raiz: str, **opcoes: object) -> EstatisticasVarredura:
+        """
+        Varre ``raiz`` num único processo e devolve as estatísticas agregadas.
+
+        Aceita as mesmas opções de ``varrer``.
+        """
+        estatisticas = EstatisticasVarredura()
+        for registro in Oxossi.varrer(raiz, **opcoes):  # type: ignore[arg-type]
+            estatisticas.registrar(registro)
+        return estatisticas
+
+    @staticmethod
+    def varrer_paralelo(
+        raiz: str,
+        processos: Optional[int] = None,
+        orcamento: int = 5000,
+        profundidade_maxima: Optional[int] = None,
+        excluir: Iterable[str] = (),
+        links: Literal["ignorar", "listar"] = "ignorar",
+    ) -> EstatisticasVarredura:
+        """
+        Varre ``raiz`` distribuindo as subárvores num ``ProcessPoolExecutor``.
+
+        O coordenador lista o primeiro nível e reparte as subárvores entre os
+        processos. Cada tarefa para após ``orcamento`` entradas e devolve os
+        diretórios que ainda faltam; eles voltam para a fila e são divididos
+        entre os processos livres, de modo que uma subárvore gigante não deixa
+        os demais núcleos ociosos.
+
+        Args:
+            raiz: Diretório inicial
+            processos: Número de processos (padrão: ``os.cpu_count()``)
+            orcamento: Entradas processadas por tarefa antes de devolver o restante
+            profundidade_maxima: Mesma semântica de ``varrer``
+            excluir: Padrões glob comparados com o nome de cada entrada
+            links: 'ignorar' ou 'listar' (links nunca são seguidos em paralelo)
+
+        Returns:
+            EstatisticasVarredura da árvore inteira, incluindo a raiz.
+        """
+        if links not in ("ignorar", "listar"):
+            raise ValueError("varrer_paralelo aceita apenas links='ignorar' ou 'listar'")
+        processos = processos or os.cpu_count() or 1
+        excluir = tuple(excluir)
+
+        total = EstatisticasVarredura()
+        registro_raiz = next(Oxossi.varrer(raiz, profundidade_maxima=0))
+        total.registrar(registro_raiz)
+        if not _deve_descer(registro_raiz, profundidade_maxima):
+            return total
+
+        # Primeiro nível listado localmente: cada subárvore vira trabalho inicial
+        fila: list[tuple[str, int]] = []
+        for registro in Oxossi.varrer(raiz, profundidade_maxima=1, excluir=excluir, links=links):
+            if registro["profundidade"] == 0:
+                continue
+            total.registrar(registro)
+            if _deve_descer(registro, profundidade_maxima):
+                fila.append((registro["caminho"], 1))
+
+        with ProcessPoolExecutor(max_workers=processos) as executor:
+            pendentes: set[Future] = set()
+            while fila or pendentes:
+                livres = processos - len(pendentes)
+                if fila and livres > 0:
+                    tamanho_lote = math.ceil(len(fila) / livres)
+                    while fila and len(pendentes) < processos:
+                        lote, fila = fila[:tamanho_lote], fila[tamanho_lote:]
+                        pendentes.add(executor.submit(
+                            _trabalhar, lote, orcamento, profundidade_maxima, excluir, links
+                        ))
+                prontos, pendentes = wait(pendentes, return_when=FIRST_COMPLETED)
+                for futuro in prontos:
+                    estatisticas, restantes = futuro.result()
+                    total.mesclar(estatisticas)
+                    fila.extend(restantes)
+        return total
+
+    @staticmethod
+    def _pode_descer(profundidade: int, profundidade_maxima: Optional[int]) -> bool:
+        """Indica se os filhos de um diretório nesta profundidade serão visitados."""
+        return profundidade_maxima is None or profundidade < profundidade_maxima
+
+    @staticmethod
+    def _visitar(
+        caminho: str,
+        relativo: str,
+        estado: os.stat_result,
+        profundidade: int,
+        descer: bool,
+    ) -> tuple[EntradaVarredura, Optional[_Quadro]]:
+        """
+        Classifica uma entrada a partir do seu stat.
+
+        Diretórios legíveis são abertos uma única vez: a primeira entrada decide
+        se estão vazios e, se a varredura for descer neles, o mesmo iterador
+        vira o próximo nível da pilha.
+        """
+        legivel = Ogum.legivel_por_stat(estado)
+        if not legivel:
+            registro = Oxossi._registro(caminho, estado, profundidade, False, "caminho_nao_legivel")
+            return registro, None
+
+        if stat.S_ISREG(estado.st_mode):
+            vazio = estado.st_size == 0
+            codigo = "arquivo_vazio" if vazio else "caminho_valido"
+            return Oxossi._registro(caminho, estado, profundidade, True, codigo, vazio), None
+
+        if not stat.S_ISDIR(estado.st_mode):
+            registro = Oxossi._registro(caminho, estado, profundidade, True, "tipo_nao_suportado")
+            return registro, None
+
+        try:
+            iterador = os.scandir(caminho)
+        except OSError:
+            registro = Oxossi._registro(caminho, estado, profundidade, False, "caminho_nao_legivel")
+            return registro, None
+        try:
+            primeira = next(iterador, None)
+        except OSError:
+            primeira = None
+
+        vazio = primeira is None
+        codigo = "diretorio_vazio" if vazio else "caminho_valido"
+        registro = Oxossi._registro(caminho, estado, profundidade, True, codigo, vazio)
+        if not descer or vazio:
+            iterador.close()
+            return registro, None
+        chave = (estado.st_dev, estado.st_ino)
+        return registro, _Quadro(iterador, primeira, relativo, profundidade, chave)
+
+    @staticmethod
+    def _registro(
+        caminho: str,
+        estado: Optional[os.stat_result],
+        profundidade: int,
+        legivel: bool,
+        codigo: str,
+        vazio: bool = False,
+    ) -> EntradaVarredura:
+        """Monta o EntradaVarredura com a mensagem adiada de ``codigo``."""
+        return {
+            "caminho": caminho,
+            "valido": estado is not None,
+            "legivel": legivel,
+            "tipo": Ogum.tipo_por_stat(estado) if estado else "desconhecido",
+            "vazio": vazio,
+            "mensagem": Mensagem(codigo, caminho),
+            "profundidade": profundidade,
+            "tamanho": estado.st_size if estado else 0,
+            "mtime_ns": estado.st_mtime_ns if estado else 0,
+            "inode": estado.st_ino if estado else 0,
+            "dispositivo": estado.st_dev if estado else 0,
+            "links_fisicos": estado.st_nlink if estado else 0,
+            "link": False,
+        }
+
+    @staticmethod
+    def _compilar(padroes: Iterable[str]) -> Optional[Callable[[str], object]]:
+        """Une os padrões glob numa única regex; None se não houver padrões."""
+        lista = list(padroes)
+        if not lista:
+            return None
+        return re.compile("|".join(fnmatch.translate(p) for p in lista)).match
@@ -7,38 +7,72 @@ app_gerenciador_telas.py
 Gerenciador de telas (ScreenManager) da aplicação Kivy.
 
 Este módulo é responsável por gerenciar a navegação entre telas da aplicação.
-Carrega e registra as views (telas) no gerenciador, utilizando nomes únicos
-para cada tela a fim de permitir a transição de forma dinâmica.
+As telas são registradas por nome e só são importadas, com seu arquivo .kv,
+na primeira vez em que a navegação chega até elas. Assim a abertura do app
+paga apenas pela tela inicial.
 
 O módulo segue o padrão MVC, estando na camada de `View`.
 """
 
-from kivy.uix.screenmanager import ScreenManager
-from app.views.telas.tela_inicial import TelaInicial
-from app.views.telas.tela_principal import TelaPrincipal
+import importlib
+import os
+
+from kivy.lang import Builder
+from kivy.uix.screenmanager import Screen, ScreenManager
+
+# Pasta dos arquivos .kv, resolvida a partir deste módulo (independe do cwd)
+PASTA_TELAS: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "telas")
 
 
 class GerenciadorTelas(ScreenManager):
     """
     Gerenciador central de telas da aplicação.
 
-    Herda de ScreenManager e registra as telas iniciais no momento da inicialização.
+    Herda de ScreenManager e cria cada tela sob demanda: ao definir `current`
+    para uma tela registrada em `TELAS` que ainda não existe, o módulo da tela
+    é importado, o .kv correspondente é carregado e a instância é adicionada.
 
     Attributes:
-        tela_inicial (TelaInicial): Tela de entrada onde o usuário insere o caminho.
-        tela_principal (TelaPrincipal): Tela principal que exibe os resultados.
+        TELAS (dict[str, tuple[str, str]]): Nome da tela -> (módulo, classe).
     """
 
+    TELAS: dict[str, tuple[str, str]] = {
+        "tela_inicial": ("app.views.telas.tela_inicial", "TelaInicial"),
+        "tela_principal": ("app.views.telas.tela_principal", "TelaPrincipal"),
+        "tela_resultados": ("app.views.telas.tela_resultados", "TelaResultados"),
+        "tela_uso_disco": ("app.views.telas.tela_uso_disco", "TelaUsoDisco"),
+    }
+
     def __init__(self, **kwargs):
         """
-        Inicializa o GerenciadorTelas com as telas disponíveis no app.
+        Inicializa o GerenciadorTelas carregando apenas a tela inicial.
         """
         super().__init__(**kwargs)
+        self.carregar_tela("tela_inicial")
+
+    def carregar_tela(self, nome: str) -> Screen:
+        """
+        Garante que a tela `nome` exista no gerenciador e a retorna.
 
-        # Cria instâncias das telas
-        self.tela_inicial = TelaInicial(name="tela_inicial")
-        self.tela_principal = TelaPrincipal(name="tela_principal")
+        Na primeira chamada importa o módulo da tela e carrega seu .kv
+        (as regras precisam estar no Builder antes da instância ser criada).
+        """
+        if self.has_screen(nome):
+            return self.get_screen(nome)
+
+        modulo, classe = self.TELAS[nome]
+        arquivo_kv = os.path.join(PASTA_TELAS, f"{nome}.kv")
+        if arquivo_kv not in Builder.files:
+            Builder.load_file(arquivo_kv)
+
+        tela = getattr(importlib.import_module(modulo), classe)(name=nome)
+        self.add_widget(tela)
+        return tela
 
-        # Adiciona as telas ao gerenciador
-        self.add_widget(self.tela_inicial)
-        self.add_widget(self.tela_principal)
+    def on_current(self, instance, value):
+        """
+        Cria a tela de destino, se necessário, antes da transição padrão.
+        """
+        if value in self.TELAS:
+            self.carregar_tela(value)
+        return super().on_current(instance, value)
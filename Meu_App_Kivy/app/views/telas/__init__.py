@@ -1,7 +1,19 @@
 # pylint: disable=C0114
 
-from .tela_inicial import TelaInicial
+import importlib
 
-from .tela_principal import TelaPrincipal
+# As telas importam o Kivy; o carregamento é adiado até o primeiro acesso.
+_TELAS = {
+    "TelaInicial": ".tela_inicial",
+    "TelaPrincipal": ".tela_principal",
+    "TelaResultados": ".tela_resultados",
+    "TelaUsoDisco": ".tela_uso_disco",
+}
 
-__all__ = ["TelaInicial", "TelaPrincipal"]
+__all__ = ["TelaInicial", "TelaPrincipal", "TelaResultados", "TelaUsoDisco"]
+
+
+def __getattr__(nome: str):
+    if nome not in _TELAS:
+        raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+    return getattr(importlib.import_module(_TELAS[nome], __name__), nome)
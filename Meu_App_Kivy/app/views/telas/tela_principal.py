@@ -1,12 +1,112 @@
 # pylint: disable=C0114, C0115, C0116, R0901, R0903, W0221, E0611
 
+from collections import deque
+
+from kivy.clock import Clock
 from kivy.uix.screenmanager import Screen
 
+from app.controller.app_controler import AppController
+
 
 class TelaPrincipal(Screen):
+    # Frequência com que a fila de resultados é esvaziada (uma vez por quadro a 30 fps)
+    INTERVALO_DRENAGEM = 1 / 30
+    # Tempo máximo, por quadro, gasto lendo resultados
+    ORCAMENTO_QUADRO = 0.004
+    # Linhas mantidas no output_label; o restante aparece só no resumo
+    LIMITE_LINHAS = 200
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        self.controller = AppController()
+        self.controller.ao_mudar = self._ao_mudar_caminho
+        self._drenagem = None
+        self._linhas: deque[str] = deque(maxlen=self.LIMITE_LINHAS)
+        self._total = 0
+        self._concluida = None
+
+    def realizar_analise(self):
+        # Chamado pelo botão "Analisar": agenda a análise e passa a drenar resultados
+        caminho = self.ids.input_texto.text.strip()
+        if not caminho:
+            self.ids.output_label.text = ""
+            return
+        geracao = self.controller.geracao
+        if self.controller.analisar(caminho) != geracao:
+            self._linhas.clear()
+            self._total = 0
+            self._concluida = None
+            self.ids.output_label.text = "⏳ Analisando..."
+        if self._drenagem is None:
+            self._drenagem = Clock.schedule_interval(self._drenar, self.INTERVALO_DRENAGEM)
+
+    def ao_alterar_texto(self, _texto):
+        # O texto mudou: o que estava em análise não corresponde mais à entrada
+        if not self.controller.ocioso:
+            self.controller.cancelar()
+
+    def ver_resultados(self):
+        # Abre a lista virtualizada com o que a análise já produziu
+        tela = self.manager.carregar_tela("tela_resultados")
+        tela.mostrar(self.controller.resultados)
+        self.manager.current = "tela_resultados"
+
+    def ver_uso_disco(self):
+        # Mede para onde foi o espaço da pasta digitada
+        tela = self.manager.carregar_tela("tela_uso_disco")
+        self.manager.current = "tela_uso_disco"
+        tela.medir(self.ids.input_texto.text.strip() or None)
+
+    def on_leave(self, *args):
+        # Ir para os resultados não interrompe a análise em andamento
+        if self.manager.current != "tela_resultados":
+            self.controller.cancelar()
+        self._parar_drenagem()
+
+    def on_enter(self, *args):
+        if not self.controller.ocioso and self._drenagem is None:
+            self._drenagem = Clock.schedule_interval(self._drenar, self.INTERVALO_DRENAGEM)
 
     def on_press_voltar(self):
         # Navega de volta para a tela inicial quando o botão "Voltar" for pressionado
         self.manager.current = "tela_inicial"
+
+    def _drenar(self, _dt):
+        lotes = self.controller.drenar(self.ORCAMENTO_QUADRO)
+        concluida = None
+        for lote in lotes:
+            self._total += len(lote.registros)
+            self._linhas.extend(str(registro["mensagem"]) for registro in lote.registros)
+            if lote.concluida:
+                concluida = self._concluida = lote
+        if lotes:
+            self.ids.output_label.text = self._texto(concluida)
+        if self.controller.ocioso:
+            self._parar_drenagem()
+
+    def _ao_mudar_caminho(self, caminho, resultado):
+        # Chamado na thread do observador: a tela só é alterada na thread do Kivy
+        Clock.schedule_once(lambda _dt: self._mostrar_alteracao(caminho, resultado))
+
+    def _mostrar_alteracao(self, caminho, resultado):
+        if caminho != self.controller.observado:
+            return  # Já trocado por outro pedido
+        self._linhas.append(f"🔄 {resultado['mensagem']}")
+        self.ids.output_label.text = self._texto(self._concluida)
+
+    def _texto(self, concluida):
+        if concluida is None:
+            resumo = f"⏳ {self._total} entradas analisadas..."
+        elif concluida.erro is not None:
+            resumo = f"❌ Análise interrompida após {self._total} entradas: {concluida.erro}"
+        else:
+            resumo = f"✅ {self._total} entradas analisadas."
+        omitidas = self._total - len(self._linhas)
+        if omitidas > 0:
+            resumo += f" (exibindo as últimas {len(self._linhas)})"
+        return "\n".join((resumo, *self._linhas))
+
+    def _parar_drenagem(self):
+        if self._drenagem is not None:
+            self._drenagem.cancel()
+            self._drenagem = None
@@ -0,0 +1,156 @@
+# pylint: disable=C0114, C0115, C0116, R0901, R0903, W0221, E0611
+
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
+from kivy.clock import Clock
+from kivy.properties import StringProperty
+from kivy.uix.label import Label
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
+from kivy.uix.screenmanager import Screen
+
+from app.utils.app_compacto import LoteResultados
+
+# Todas as linhas compartilham o mesmo dicionário vazio: o texto de cada linha
+# visível é lido do LoteResultados em refresh_view_attrs, então o data do
+# RecycleView custa só um ponteiro por resultado.
+_LINHA: dict[str, object] = {}
+
+
+class LinhaResultado(RecycleDataViewBehavior, Label):
+    def refresh_view_attrs(self, rv, index, data):
+        self.text = rv.texto(index)
+        return super().refresh_view_attrs(rv, index, data)
+
+
+class ListaResultados(RecycleView):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.fonte = LoteResultados()
+        self.indices = array("I")
+
+    def exibir(self, fonte, indices, rolar_topo=True):
+        self.fonte = fonte
+        self.indices = indices
+        self.data = [_LINHA] * len(indices)
+        if rolar_topo:
+            self.scroll_y = 1
+
+    def acrescentar(self, indices):
+        # Sem ordenação, os resultados novos entram no fim, sem refazer o data
+        self.indices.extend(indices)
+        self.data.extend([_LINHA] * len(indices))
+
+    def texto(self, index):
+        return str(self.fonte[self.indices[index]].mensagem)
+
+
+class TelaResultados(Screen):
+    resumo = StringProperty("")
+
+    # Opções dos filtros exibidas nos Spinners
+    TIPOS = ("todos", "arquivo", "diretorio", "desconhecido")
+    ORDENS = ("inserção", "caminho", "nome", "tipo", "extensao")
+    # Segundos entre verificações de novos resultados da análise em andamento
+    INTERVALO_ATUALIZACAO = 0.5
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._resultados = None
+        self._fonte = LoteResultados()
+        self._total = 0
+        # Até onde do lote vai a seleção exibida (o ``ate`` que a produziu)
+        self._exibido_ate = 0
+        self._geracao = 0
+        self._pendente = False
+        self._atualizacao = None
+        # Uma única thread: cada nova seleção cancela a anterior pela geração
+        self._executor = ThreadPoolExecutor(1, thread_name_prefix="resultados")
+
+    def mostrar(self, resultados):
+        # Recebe a função que devolve o lote da análise e quantos resultados dele
+        # já estão completos (AppController.resultados). Enquanto a tela estiver
+        # aberta, os resultados que a análise ainda publicar entram na lista.
+        self._resultados = resultados
+        self._fonte, self._total = resultados()
+        self.aplicar_filtros()
+        if self._atualizacao is None:
+            self._atualizacao = Clock.schedule_interval(
+                self._verificar_novos, self.INTERVALO_ATUALIZACAO
+            )
+
+    def aplicar_filtros(self, *_args):
+        self._selecionar(rolar_topo=True)
+
+    def on_leave(self, *args):
+        # Seleções pendentes deixam de valer ao sair da tela
+        self._geracao += 1
+        self._pendente = False
+        if self._atualizacao is not None:
+            self._atualizacao.cancel()
+            self._atualizacao = None
+
+    def _verificar_novos(self, _dt):
+        # Uma seleção em andamento não é cancelada só porque chegaram resultados
+        if self._pendente or self._resultados is None:
+            return
+        fonte, total = self._resultados()
+        if fonte is self._fonte and total == self._total:
+            return
+        # Um lote novo é outra análise; crescer o atual mantém a rolagem
+        nova_analise = fonte is not self._fonte
+        self._fonte, self._total = fonte, total
+        if nova_analise or self._ordenado():
+            self._selecionar(rolar_topo=nova_analise)
+        else:
+            # Na ordem de inserção basta filtrar a faixa nova e acrescentá-la
+            self._selecionar(rolar_topo=False, desde=self._exibido_ate)
+
+    def _ordenado(self):
+        return "ordem" in self.ids and self.ids.ordem.text != "inserção"
+
+    def _selecionar(self, rolar_topo, desde=0):
+        if "lista" not in self.ids:
+            # Handlers do .kv disparados antes de a tela terminar de ser montada
+            return
+        self._geracao += 1
+        geracao = self._geracao
+        tipo = self.ids.filtro_tipo.text
+        extensao = self.ids.filtro_extensao.text.strip()
+        ordem = self.ids.ordem.text
+        criterios = {
+            "tipo": None if tipo == "todos" else tipo,
+            "vazio": True if self.ids.filtro_vazio.state == "down" else None,
+            "extensao": extensao or None,
+            "ordem": None if ordem == "inserção" else ordem,
+            "desde": desde,
+            "ate": self._total,
+            "cancelado": lambda: geracao != self._geracao,
+        }
+        if rolar_topo:
+            self.resumo = "⏳ Filtrando..."
+        self._pendente = True
+        fonte, ate = self._fonte, self._total
+        futuro = self._executor.submit(fonte.selecionar, **criterios)
+        futuro.add_done_callback(
+            lambda f: Clock.schedule_once(
+                lambda _dt: self._exibir(geracao, fonte, f, rolar_topo, desde, ate)
+            )
+        )
+
+    def _exibir(self, geracao, fonte, futuro, rolar_topo, desde, ate):
+        if geracao != self._geracao:
+            return
+        try:
+            indices = futuro.result()
+        finally:
+            # Mesmo se a seleção falhou, as próximas verificações não podem travar
+            self._pendente = False
+        lista = self.ids.lista
+        if desde:
+            lista.acrescentar(indices)
+        else:
+            lista.exibir(fonte, indices, rolar_topo)
+        self._exibido_ate = ate
+        self.resumo = f"{len(lista.indices)} de {self._total} resultados"
@@ -0,0 +1,94 @@
+# pylint: disable=C0114, C0115, C0116, R0901, R0903, W0221, E0611
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from kivy.clock import Clock
+from kivy.properties import StringProperty
+from kivy.uix.screenmanager import Screen
+
+from app.utils.app_uso_disco import Iroko
+
+UNIDADES = ("B", "KiB", "MiB", "GiB", "TiB")
+
+
+def formatar_bytes(quantidade):
+    valor = float(quantidade)
+    for unidade in UNIDADES:
+        if valor < 1024 or unidade == UNIDADES[-1]:
+            return f"{valor:.0f} {unidade}" if unidade == "B" else f"{valor:.1f} {unidade}"
+        valor /= 1024
+    return f"{quantidade} B"
+
+
+class TelaUsoDisco(Screen):
+    resumo = StringProperty("")
+    detalhes = StringProperty("")
+
+    # Itens exibidos em cada lista de maiores
+    LIMITE = 20
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._geracao = 0
+        # Uma única thread: cada nova medição torna a anterior obsoleta pela geração
+        self._executor = ThreadPoolExecutor(1, thread_name_prefix="uso_disco")
+
+    def medir(self, caminho=None):
+        if caminho is not None:
+            self.ids.input_caminho.text = caminho
+        caminho = self.ids.input_caminho.text.strip()
+        if not caminho:
+            return
+        caminho = os.path.abspath(os.path.expanduser(caminho))
+        self._geracao += 1
+        geracao = self._geracao
+        self.resumo = "⏳ Medindo..."
+        self.detalhes = ""
+        futuro = self._executor.submit(
+            Iroko.medir,
+            caminho,
+            limite=self.LIMITE,
+            progresso=lambda n: Clock.schedule_once(lambda _dt: self._progresso(geracao, n)),
+            cancelado=lambda: geracao != self._geracao,
+        )
+        futuro.add_done_callback(
+            lambda f: Clock.schedule_once(lambda _dt: self._exibir(geracao, f))
+        )
+
+    def on_leave(self, *args):
+        # Sair da tela interrompe a medição em andamento
+        self._geracao += 1
+
+    def _progresso(self, geracao, entradas):
+        if geracao == self._geracao:
+            self.resumo = f"⏳ {entradas} entradas medidas..."
+
+    def _exibir(self, geracao, futuro):
+        if geracao != self._geracao:
+            return
+        try:
+            uso = futuro.result()
+        except Exception as erro:  # pylint: disable=broad-exception-caught
+            self.resumo = f"❌ Falha ao medir: {erro}"
+            return
+        raiz = uso.raiz
+        self.resumo = (
+            f"📦 {formatar_bytes(raiz.bytes)} em {raiz.arquivos} arquivos "
+            f"e {raiz.diretorios} diretórios"
+        )
+        if uso.ilegiveis or uso.invalidos:
+            self.resumo += f" ({uso.ilegiveis} ilegíveis, {uso.invalidos} inválidos)"
+        linhas = ["Maiores itens da pasta:"]
+        linhas += [self._linha(item, raiz.bytes) for item in uso.filhos]
+        linhas += ["", "Maiores diretórios:"]
+        linhas += [self._linha(item, raiz.bytes) for item in uso.maiores_diretorios]
+        linhas += ["", "Maiores arquivos:"]
+        linhas += [self._linha(item, raiz.bytes) for item in uso.maiores_arquivos]
+        self.detalhes = "\n".join(linhas)
+
+    @staticmethod
+    def _linha(item, total):
+        fracao = item.bytes / total * 100 if total else 0.0
+        icone = "📁" if item.diretorio else "📄"
+        return f"{formatar_bytes(item.bytes):>10}  {fracao:5.1f}%  {icone} {item.caminho}"
@@ -0,0 +1 @@
+# pylint: disable=C0114
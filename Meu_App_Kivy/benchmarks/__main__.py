@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+__main__.py
+
+Executa a suíte completa de benchmarks (benchmarks/suite.py).
+
+Uso (a partir de Meu_App_Kivy/):
+    python -m benchmarks [--escala 1.0] [--repeticoes 5] [--filtro ogum]
+                         [--saida resultado.json] [--comparar base.json]
+                         [--tolerancia 0.15]
+
+Com ``--comparar``, o código de saída é 1 quando alguma regressão é encontrada,
+o que permite usar a suíte como verificação entre commits.
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+from typing import Optional
+
+from benchmarks.comum import liberar_permissoes
+from benchmarks.suite import comparar, executar, formatar_tabela
+
+
+def criar_parser() -> argparse.ArgumentParser:
+    """Opções de linha de comando da suíte."""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Suíte de benchmarks do Apontador."
+    )
+    parser.add_argument("--escala", type=float, default=1.0,
+                        help="Multiplicador do tamanho dos cenários")
+    parser.add_argument("--repeticoes", type=int, default=5)
+    parser.add_argument("--filtro", default="", help="Mede só casos cujo nome contém o texto")
+    parser.add_argument("--saida", help="Grava o resultado em JSON neste arquivo")
+    parser.add_argument("--comparar", help="JSON de uma execução anterior para comparação")
+    parser.add_argument("--tolerancia", type=float, default=0.15,
+                        help="Variação relativa aceita antes de acusar regressão")
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Ponto de entrada da suíte."""
+    argumentos = criar_parser().parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="apontador_suite_") as raiz:
+        try:
+            resultado = executar(
+                raiz, argumentos.escala, argumentos.repeticoes, argumentos.filtro,
+                progresso=lambda nome: print(f"… {nome}", file=sys.stderr),
+            )
+        finally:
+            liberar_permissoes(raiz)
+
+    print()
+    for linha in formatar_tabela(resultado):
+        print(linha)
+
+    if argumentos.saida:
+        with open(argumentos.saida, "w", encoding="utf-8") as arquivo:
+            json.dump(resultado, arquivo, ensure_ascii=False, indent=2)
+        print(f"\n💾 Resultado gravado em {argumentos.saida}")
+
+    if argumentos.comparar:
+        with open(argumentos.comparar, encoding="utf-8") as arquivo:
+            base = json.load(arquivo)
+        regressoes = comparar(base, resultado, argumentos.tolerancia)
+        origem = base.get("meta", {}).get("commit") or argumentos.comparar
+        if regressoes:
+            print(f"\n❌ {len(regressoes)} regressões em relação a {origem}:")
+            for regressao in regressoes:
+                print(f"   {regressao}")
+            return 1
+        print(f"\n✅ Sem regressões em relação a {origem}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
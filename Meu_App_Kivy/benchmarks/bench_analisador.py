@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+bench_analisador.py
+
+Mede a vazão (caminhos/s) do analisador sintático Ifa sobre um corpus de
+caminhos de vários sistemas gravado em disco, linha a linha.
+
+Compara:
+    - legado: heurística antiga de CaminhoSOModel + ``pathlib.Path`` do host
+    - ifa_frio: Ifa sem o cache LRU
+    - ifa_cache: Ifa com o cache LRU (corpus com caminhos repetidos)
+    - ifa_lote: ``Ifa.classificar_lote`` sobre a coluna inteira
+
+Uso (a partir de Meu_App_Kivy/):
+    python -m benchmarks.bench_analisador [--linhas 1000000] [--distintos 0.2]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+from app.utils.app_analisador import Ifa
+
+MODELOS: tuple[str, ...] = (
+    "/home/usuario{n}/projetos/app/modulo_{n}.py",
+    "/Users/ana{n}/Documents/relatorio_{n}.pdf",
+    "C:\\Users\\pedro{n}\\Desktop\\planilha_{n}.xlsx",
+    "\\\\servidor{n}\\compartilhado\\dados\\arquivo_{n}.csv",
+    "\\\\?\\C:\\muito\\longo\\caminho_{n}\\saida.log",
+    "D:dados\\relativo_{n}.txt",
+    "file:///var/log/servico_{n}.log",
+    "~/notas/{n}/leia-me.md",
+    "src/pacote_{n}/__init__.py",
+)
+
+
+def legado(caminho: str) -> tuple:
+    """Heurística anterior de sistema + metadados via Path do host."""
+    if ":" in caminho and "\\" in caminho:
+        sistema = "windows"
+    elif caminho.startswith("/"):
+        sistema = "posix"
+    else:
+        sistema = "desconhecido"
+    path = Path(caminho)
+    return sistema, path.stem, path.suffix, str(path.parent)
+
+
+def ifa_frio(caminho: str) -> tuple:
+    """Ifa sem cache, lendo os mesmos campos do legado."""
+    analise = Ifa.analisar.__wrapped__(caminho)
+    return analise.sistema, analise.stem, analise.sufixo, analise.pai
+
+
+def ifa_cache(caminho: str) -> tuple:
+    """Ifa com cache LRU, lendo os mesmos campos do legado."""
+    analise = Ifa.analisar(caminho)
+    return analise.sistema, analise.stem, analise.sufixo, analise.pai
+
+
+def gerar_corpus(destino: str, linhas: int, distintos: float) -> None:
+    """Grava ``linhas`` caminhos, dos quais cerca de ``distintos`` são únicos."""
+    sorteio = random.Random(42)
+    universo = max(1, int(linhas * distintos))
+    with open(destino, "w", encoding="utf-8") as arquivo:
+        for _ in range(linhas):
+            numero = sorteio.randrange(universo)
+            arquivo.write(MODELOS[numero % len(MODELOS)].format(n=numero) + "\n")
+
+
+def medir_arquivo(funcao: Callable[[str], tuple], corpus: str) -> float:
+    """Lê o corpus linha a linha aplicando ``funcao``; retorna caminhos/s."""
+    total = 0
+    inicio = time.perf_counter()
+    with open(corpus, encoding="utf-8") as arquivo:
+        for linha in arquivo:
+            funcao(linha.rstrip("\n"))
+            total += 1
+    return total / (time.perf_counter() - inicio)
+
+
+def medir_lote(corpus: str) -> float:
+    """Lê o corpus como uma coluna e o classifica de uma vez; retorna caminhos/s."""
+    inicio = time.perf_counter()
+    with open(corpus, encoding="utf-8") as arquivo:
+        coluna = arquivo.read().splitlines()
+    total = len(Ifa.classificar_lote(coluna))
+    return total / (time.perf_counter() - inicio)
+
+
+def executar(linhas: int, distintos: float) -> None:
+    """Gera o corpus e imprime a vazão de cada estratégia."""
+    with tempfile.TemporaryDirectory(prefix="apontador_bench_") as pasta:
+        corpus = os.path.join(pasta, "corpus.txt")
+        gerar_corpus(corpus, linhas, distintos)
+        print(f"\n🔮 Análise de {linhas} caminhos ({distintos:.0%} distintos)\n" + "-" * 60)
+        for nome, funcao in (("legado", legado), ("ifa_frio", ifa_frio), ("ifa_cache", ifa_cache)):
+            Ifa.analisar.cache_clear()
+            vazao = medir_arquivo(funcao, corpus)
+            print(f"{nome:>10}: {vazao:12,.0f} caminhos/s")
+        print(f"{'':>10}  {Ifa.analisar.cache_info()}")
+        print(f"{'ifa_lote':>10}: {medir_lote(corpus):12,.0f} caminhos/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark do analisador sintático Ifa.")
+    parser.add_argument("--linhas", type=int, default=1_000_000)
+    parser.add_argument("--distintos", type=float, default=0.2)
+    argumentos = parser.parse_args()
+    executar(argumentos.linhas, argumentos.distintos)
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+bench_inicializacao.py
+
+Mede o custo de abertura: tempo de importação dos módulos de núcleo (que não
+devem puxar o Kivy) e, se o Kivy estiver instalado, o tempo até o primeiro
+quadro da interface.
+
+Cada medição roda em um interpretador novo, para que nada já importado pelo
+processo do benchmark mascare o custo real.
+
+Uso (a partir de Meu_App_Kivy/):
+    python -m benchmarks.bench_inicializacao [--repeticoes 5]
+"""
+
+import argparse
+import importlib.util
+import os
+import statistics
+import subprocess
+import sys
+
+PASTA_PROJETO: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULOS_NUCLEO: tuple[str, ...] = (
+    "app.utils.app_tools",
+    "app.models.app_models",
+    "cli",
+)
+
+# Abre o app, agenda a medição para o quadro seguinte ao on_start e encerra.
+SCRIPT_PRIMEIRO_QUADRO = """
+import time
+inicio = time.perf_counter()
+from kivy.clock import Clock
+from main import MeuApp
+
+class AppMedido(MeuApp):
+    def on_start(self):
+        super().on_start()
+        Clock.schedule_once(self._medir, 0)
+
+    def _medir(self, _dt):
+        print(f"{(time.perf_counter() - inicio) * 1000:.1f}")
+        self.stop()
+
+AppMedido().run()
+"""
+
+
+def _rodar(argumentos: list[str]) -> subprocess.CompletedProcess:
+    """Executa o interpretador atual dentro da pasta do projeto."""
+    return subprocess.run(
+        [sys.executable, *argumentos], cwd=PASTA_PROJETO,
+        capture_output=True, text=True, check=True,
+    )
+
+
+def tempo_importacao(modulo: str) -> tuple[float, bool]:
+    """
+    Retorna (ms acumulados de importação, kivy_carregado) para `modulo`.
+
+    Usa ``-X importtime``: a linha do próprio módulo traz o tempo acumulado
+    de tudo o que ele importou.
+    """
+    codigo = f"import sys, {modulo}; print('kivy' in sys.modules)"
+    processo = _rodar(["-X", "importtime", "-c", codigo])
+    acumulado = 0
+    for linha in processo.stderr.splitlines():
+        partes = linha.split("|")
+        if len(partes) == 3 and partes[2].strip() == modulo:
+            acumulado = int(partes[1])
+    return acumulado / 1000, processo.stdout.strip() == "True"
+
+
+def tempo_primeiro_quadro() -> float:
+    """Retorna os ms entre o início do interpretador e o primeiro quadro do app."""
+    return float(_rodar(["-c", SCRIPT_PRIMEIRO_QUADRO]).stdout.strip().splitlines()[-1])
+
+
+def executar(repeticoes: int) -> None:
+    """Mede cada módulo de núcleo e, se possível, o primeiro quadro."""
+    print(f"\n🚀 Inicialização ({repeticoes} repetições, mediana)\n" + "-" * 60)
+    for modulo in MODULOS_NUCLEO:
+        medidas = [tempo_importacao(modulo) for _ in range(repeticoes)]
+        mediana = statistics.median(ms for ms, _ in medidas)
+        kivy = "sim" if any(carregado for _, carregado in medidas) else "não"
+        print(f"{modulo:>24}: {mediana:8.2f} ms | kivy importado: {kivy}")
+
+    if importlib.util.find_spec("kivy") is None:
+        print(f"{'primeiro quadro':>24}: Kivy não instalado, medição ignorada")
+        return
+    quadros = [tempo_primeiro_quadro() for _ in range(repeticoes)]
+    print(f"{'primeiro quadro':>24}: {statistics.median(quadros):8.2f} ms")
+
+
+def main() -> None:
+    """Ponto de entrada do benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark de inicialização do Apontador.")
+    parser.add_argument("--repeticoes", type=int, default=5)
+    argumentos = parser.parse_args()
+    executar(argumentos.repeticoes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+bench_servico.py
+
+Mede a latência do serviço de validação (Xango) vista por um cliente (Iansa):
+pedidos individuais com o cache frio e aquecido, e a vazão de LOTE com
+pipelining, comparados ao ``Ogum.validar`` embutido no processo.
+
+Uso (a partir de Meu_App_Kivy/):
+    python -m benchmarks.bench_servico [--arquivos 2000] [--repeticoes 5]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from app.servico.app_cliente import Iansa
+from app.servico.app_servidor import Xango
+from app.utils.app_tools import Ogum
+from benchmarks.comum import criar_arvore_larga, percentis
+
+
+def _latencias(funcao, caminhos: list[str]) -> list[float]:
+    """Latência de cada chamada, em microssegundos."""
+    relogio = time.perf_counter_ns
+    amostras = []
+    for caminho in caminhos:
+        antes = relogio()
+        funcao(caminho)
+        amostras.append((relogio() - antes) / 1000)
+    return amostras
+
+
+def _linha(rotulo: str, amostras: list[float]) -> str:
+    medidas = percentis(amostras)
+    return (
+        f"{rotulo:>22}: p50 {medidas['p50']:7.1f} µs | p95 {medidas['p95']:7.1f} µs | "
+        f"p99 {medidas['p99']:7.1f} µs"
+    )
+
+
+def executar(arquivos: int, repeticoes: int) -> None:
+    """Sobe o serviço num socket temporário e imprime as latências de cada modo."""
+    with tempfile.TemporaryDirectory(prefix="apontador_bench_") as raiz:
+        caminhos = criar_arvore_larga(raiz, arquivos)
+        endereco = os.path.join(raiz, "xango.sock")
+        print(f"\n⚡ Serviço de validação com {len(caminhos)} caminhos\n" + "-" * 60)
+        print(_linha("Ogum.validar embutido", _latencias(Ogum.validar, caminhos)))
+
+        with Xango(endereco, ttl=None), Iansa(endereco) as cliente:
+            print(_linha("serviço, cache frio", _latencias(cliente.validar, caminhos)))
+            quentes: list[float] = []
+            for _ in range(repeticoes):
+                quentes += _latencias(cliente.validar, caminhos)
+            print(_linha("serviço, cache quente", quentes))
+
+            inicio = time.perf_counter()
+            for _ in range(repeticoes):
+                cliente.validar_lote(caminhos)
+            decorrido = time.perf_counter() - inicio
+            total = len(caminhos) * repeticoes
+            print(
+                f"{'LOTE com pipelining':>22}: {total / decorrido:10.0f} caminhos/s | "
+                f"{decorrido / total * 1e6:5.2f} µs/caminho"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark do serviço de validação (Xango).")
+    parser.add_argument("--arquivos", type=int, default=2000)
+    parser.add_argument("--repeticoes", type=int, default=5)
+    argumentos = parser.parse_args()
+    executar(argumentos.arquivos, argumentos.repeticoes)
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+bench_validacao.py
+
+Compara a validação legada de Ogum (uma chamada ao disco por etapa) com o motor
+atual baseado em um único ``os.stat`` por caminho.
+
+Uso (a partir de Meu_App_Kivy/):
+    python -m benchmarks.bench_validacao [--quantidade 200] [--repeticoes 5]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+from pathlib import Path
+
+from app.utils.app_tools import Ogum
+from benchmarks.comum import ContadorSyscalls, criar_arvore_sintetica, medir
+
+
+def _eh_vazio_legado(caminho: str) -> bool:
+    """Verificação de vazio anterior: novos stats em is_file/is_dir/stat."""
+    path = Path(caminho)
+    try:
+        if path.is_file():
+            return path.stat().st_size == 0
+        if path.is_dir():
+            with os.scandir(caminho) as entradas:
+                return next(entradas, None) is None
+    except OSError:
+        return True
+    return False
+
+
+def validar_legado(caminho: str) -> dict:
+    """Reproduz a sequência de verificações anterior ao motor de stat único."""
+    resultado = {"caminho": caminho, "valido": False, "legivel": False,
+                 "tipo": "desconhecido", "vazio": False}
+    if not caminho or not caminho.strip():
+        return resultado
+    resultado["valido"] = Path(caminho).exists()
+    if not resultado["valido"]:
+        return resultado
+    resultado["legivel"] = os.access(caminho, os.R_OK)
+    if not resultado["legivel"]:
+        return resultado
+    resultado["tipo"] = ("arquivo" if Path(caminho).is_file() else
+                         "diretorio" if Path(caminho).is_dir() else
+                         "desconhecido")
+    if resultado["tipo"] in ("arquivo", "diretorio"):
+        resultado["vazio"] = _eh_vazio_legado(caminho)
+    return resultado
+
+
+def executar(quantidade: int, repeticoes: int) -> None:
+    """Gera a árvore sintética, mede as duas estratégias e imprime a comparação."""
+    estrategias = {"legado": validar_legado, "stat_unico": Ogum.validar}
+
+    with tempfile.TemporaryDirectory(prefix="apontador_bench_") as raiz:
+        caminhos = criar_arvore_sintetica(raiz, quantidade)
+        linhas = []
+        for nome, funcao in estrategias.items():
+            with contextlib.redirect_stdout(io.StringIO()):
+                with ContadorSyscalls() as contador:
+                    for caminho in caminhos:
+                        funcao(caminho)
+                latencia = medir(funcao, caminhos, repeticoes)
+            syscalls = contador.total / len(caminhos)
+            linhas.append((nome, syscalls, latencia, contador.chamadas))
+
+    print(f"\n⚒️ Validação de {len(caminhos)} caminhos ({repeticoes} repetições)\n" + "-" * 60)
+    for nome, syscalls, latencia, chamadas in linhas:
+        detalhe = ", ".join(f"{k}={v}" for k, v in chamadas.items() if v)
+        print(f"{nome:>12}: {syscalls:5.2f} syscalls/caminho | {latencia:8.2f} µs/caminho")
+        print(f"{'':>12}  ({detalhe})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark da validação de caminhos do Ogum.")
+    parser.add_argument("--quantidade", type=int, default=200)
+    parser.add_argument("--repeticoes", type=int, default=5)
+    argumentos = parser.parse_args()
+    executar(argumentos.quantidade, argumentos.repeticoes)
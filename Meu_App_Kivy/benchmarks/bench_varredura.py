@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+bench_varredura.py
+
+Mede a varredura agregada de uma árvore sintética em um processo
+(``Oxossi.agregar``) e com ``Oxossi.varrer_paralelo`` em 1, 2, 4... processos.
+
+Uso (a partir de Meu_App_Kivy/):
+    python -m benchmarks.bench_varredura [--subarvores 16] [--diretorios 40] [--arquivos 25]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from app.utils.app_varredura import Oxossi
+from benchmarks.comum import criar_arvore_volumosa
+
+
+def executar(subarvores: int, diretorios: int, arquivos: int, processos_max: int) -> None:
+    """Gera a árvore sintética e imprime tempo e vazão de cada modo de varredura."""
+    with tempfile.TemporaryDirectory(prefix="apontador_bench_") as raiz:
+        total = criar_arvore_volumosa(raiz, subarvores, diretorios, arquivos)
+        print(f"\n🏹 Varredura de {total} entradas\n" + "-" * 60)
+
+        inicio = time.perf_counter()
+        referencia = Oxossi.agregar(raiz)
+        base = time.perf_counter() - inicio
+        print(f"{'sequencial':>14}: {base:7.3f} s | {total / base:10.0f} entradas/s")
+
+        processos = 1
+        while processos <= processos_max:
+            inicio = time.perf_counter()
+            resultado = Oxossi.varrer_paralelo(raiz, processos=processos)
+            decorrido = time.perf_counter() - inicio
+            confere = "ok" if resultado.to_dict() == referencia.to_dict() else "DIVERGENTE"
+            print(
+                f"{f'{processos} processo(s)':>14}: {decorrido:7.3f} s | "
+                f"{total / decorrido:10.0f} entradas/s | x{base / decorrido:4.2f} | {confere}"
+            )
+            processos *= 2
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark da varredura paralela do Oxossi.")
+    parser.add_argument("--subarvores", type=int, default=16)
+    parser.add_argument("--diretorios", type=int, default=40)
+    parser.add_argument("--arquivos", type=int, default=25)
+    parser.add_argument("--processos", type=int, default=os.cpu_count() or 1)
+    argumentos = parser.parse_args()
+    executar(argumentos.subarvores, argumentos.diretorios, argumentos.arquivos,
+             argumentos.processos)
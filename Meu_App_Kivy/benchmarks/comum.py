@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+"""
+comum.py
+
+Utilitários compartilhados pelos benchmarks do Apontador.
+
+- ContadorSyscalls: conta as chamadas de sistema de arquivos feitas pelo Python
+  (os.stat, os.lstat, os.access, os.scandir, os.listdir) durante um bloco.
+- criar_arvore_sintetica: gera uma árvore temporária com arquivos vazios,
+  arquivos com conteúdo, diretórios vazios e caminhos inexistentes.
+- medir: executa uma função sobre uma lista de caminhos e devolve a latência média.
+- criar_arvore_profunda / criar_arvore_larga / criar_arquivos_vazios /
+  criar_sem_permissao: cenários específicos usados pela suíte (benchmarks/suite.py).
+- percentis: percentis de uma lista de amostras.
+"""
+
+import os
+import time
+from types import TracebackType
+from typing import Callable, Iterable, Optional
+
+FUNCOES_MONITORADAS: tuple[str, ...] = ("stat", "lstat", "access", "scandir", "listdir")
+
+
+class ContadorSyscalls:
+    """
+    Gerenciador de contexto que substitui temporariamente as funções de ``os``
+    que tocam o sistema de arquivos por versões que contam suas chamadas.
+
+    ``pathlib`` delega para ``os.stat``/``os.listdir``/``os.scandir``, então as
+    chamadas feitas via ``Path`` também são contabilizadas.
+    """
+
+    def __init__(self) -> None:
+        self.chamadas: dict[str, int] = {nome: 0 for nome in FUNCOES_MONITORADAS}
+        self._originais: dict[str, Callable] = {}
+
+    @property
+    def total(self) -> int:
+        return sum(self.chamadas.values())
+
+    def __enter__(self) -> "ContadorSyscalls":
+        for nome in FUNCOES_MONITORADAS:
+            original = getattr(os, nome)
+            self._originais[nome] = original
+            setattr(os, nome, self._envolver(nome, original))
+        return self
+
+    def __exit__(
+        self,
+        tipo: Optional[type],
+        erro: Optional[BaseException],
+        rastro: Optional[TracebackType],
+    ) -> None:
+        for nome, original in self._originais.items():
+            setattr(os, nome, original)
+        self._originais.clear()
+
+    def _envolver(self, nome: str, original: Callable) -> Callable:
+        def contado(*args, **kwargs):  # type: ignore[no-untyped-def]
+            self.chamadas[nome] += 1
+            return original(*args, **kwargs)
+        return contado
+
+
+def criar_arvore_sintetica(raiz: str, quantidade: int = 50) -> list[str]:
+    """
+    Cria uma árvore de teste em ``raiz`` e devolve os caminhos a validar.
+
+    Para cada índice são gerados: um arquivo com conteúdo, um arquivo vazio,
+    um diretório com itens, um diretório vazio e um caminho inexistente.
+    """
+    caminhos: list[str] = []
+    for indice in range(quantidade):
+        cheio = os.path.join(raiz, f"arquivo_{indice}.txt")
+        with open(cheio, "w", encoding="utf-8") as arquivo:
+            arquivo.write("conteudo")
+        vazio = os.path.join(raiz, f"vazio_{indice}.txt")
+        open(vazio, "w", encoding="utf-8").close()
+        pasta = os.path.join(raiz, f"pasta_{indice}")
+        os.mkdir(pasta)
+        open(os.path.join(pasta, "item.txt"), "w", encoding="utf-8").close()
+        pasta_vazia = os.path.join(raiz, f"pasta_vazia_{indice}")
+        os.mkdir(pasta_vazia)
+        inexistente = os.path.join(raiz, f"inexistente_{indice}")
+        caminhos.extend([cheio, vazio, pasta, pasta_vazia, inexistente])
+    return caminhos
+
+
+def medir(funcao: Callable[[str], object], caminhos: Iterable[str], repeticoes: int = 5) -> float:
+    """Retorna a latência média por caminho, em microssegundos."""
+    lista = list(caminhos)
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        for caminho in lista:
+            funcao(caminho)
+    decorrido = time.perf_counter() - inicio
+    return decorrido / (len(lista) * repeticoes) * 1_000_000
+
+
+def criar_arvore_volumosa(
+    raiz: str, subarvores: int = 16, diretorios: int = 40, arquivos: int = 25
+) -> int:
+    """
+    Cria ``subarvores`` diretórios de topo, cada um com ``diretorios``
+    subdiretórios de ``arquivos`` arquivos (um terço deles vazios).
+
+    Returns:
+        Quantidade de entradas criadas (sem contar a raiz).
+    """
+    extensoes = (".txt", ".py", ".log", "")
+    total = 0
+    for indice_topo in range(subarvores):
+        topo = os.path.join(raiz, f"volume_{indice_topo}")
+        os.mkdir(topo)
+        total += 1
+        for indice_dir in range(diretorios):
+            pasta = os.path.join(topo, f"pasta_{indice_dir}")
+            os.mkdir(pasta)
+            total += 1
+            for indice_arq in range(arquivos):
+                extensao = extensoes[indice_arq % len(extensoes)]
+                with open(os.path.join(pasta, f"arq_{indice_arq}{extensao}"), "wb") as arquivo:
+                    if indice_arq % 3:
+                        arquivo.write(b"x" * indice_arq)
+                total += 1
+    return total
+
+
+def criar_arvore_profunda(raiz: str, profundidade: int = 200) -> list[str]:
+    """Cria uma cadeia de ``profundidade`` diretórios aninhados, cada um com um arquivo."""
+    caminhos: list[str] = []
+    atual = raiz
+    for nivel in range(profundidade):
+        atual = os.path.join(atual, f"n{nivel}")
+        os.mkdir(atual)
+        arquivo = os.path.join(atual, "dado.txt")
+        with open(arquivo, "wb") as saida:
+            saida.write(b"x")
+        caminhos.extend([atual, arquivo])
+    return caminhos
+
+
+def criar_arvore_larga(raiz: str, itens: int = 5000) -> list[str]:
+    """Cria um único diretório com ``itens`` arquivos de conteúdo."""
+    pasta = os.path.join(raiz, "larga")
+    os.mkdir(pasta)
+    caminhos = [pasta]
+    for indice in range(itens):
+        arquivo = os.path.join(pasta, f"item_{indice}.dat")
+        with open(arquivo, "wb") as saida:
+            saida.write(b"x" * (indice % 64 + 1))
+        caminhos.append(arquivo)
+    return caminhos
+
+
+def criar_arquivos_vazios(raiz: str, quantidade: int = 5000) -> list[str]:
+    """Cria ``quantidade`` arquivos vazios e alguns diretórios vazios."""
+    pasta = os.path.join(raiz, "vazios")
+    os.mkdir(pasta)
+    caminhos = [pasta]
+    for indice in range(quantidade):
+        if indice % 10 == 0:
+            caminho = os.path.join(pasta, f"pasta_{indice}")
+            os.mkdir(caminho)
+        else:
+            caminho = os.path.join(pasta, f"vazio_{indice}.txt")
+            open(caminho, "wb").close()
+        caminhos.append(caminho)
+    return caminhos
+
+
+def criar_sem_permissao(raiz: str, quantidade: int = 500) -> list[str]:
+    """
+    Cria arquivos e diretórios com permissão 000 (e entradas dentro deles).
+
+    Como root as permissões não bloqueiam a leitura; a suíte registra isso nos
+    metadados do resultado. Use ``liberar_permissoes`` antes de apagar a árvore.
+    """
+    pasta = os.path.join(raiz, "negados")
+    os.mkdir(pasta)
+    caminhos = [pasta]
+    for indice in range(quantidade):
+        if indice % 2:
+            caminho = os.path.join(pasta, f"trancado_{indice}")
+            os.mkdir(caminho)
+            open(os.path.join(caminho, "oculto.txt"), "wb").close()
+            caminhos.append(os.path.join(caminho, "oculto.txt"))
+        else:
+            caminho = os.path.join(pasta, f"trancado_{indice}.txt")
+            with open(caminho, "wb") as saida:
+                saida.write(b"segredo")
+        os.chmod(caminho, 0)
+        caminhos.append(caminho)
+    return caminhos
+
+
+def liberar_permissoes(raiz: str) -> None:
+    """Restaura permissões de leitura/escrita para que a árvore possa ser apagada."""
+    # os.walk desce depois de o laço liberar os subdiretórios (topdown)
+    for atual, diretorios, arquivos in os.walk(raiz):
+        for nome in diretorios + arquivos:
+            try:
+                os.chmod(os.path.join(atual, nome), 0o700)
+            except OSError:
+                pass
+
+
+def percentis(amostras: list[float], pontos: Iterable[float] = (50, 95, 99)) -> dict[str, float]:
+    """Percentis (método do vizinho mais próximo) das amostras, ex.: {'p50': ...}."""
+    ordenadas = sorted(amostras)
+    if not ordenadas:
+        return {f"p{ponto:g}": 0.0 for ponto in pontos}
+    ultimo = len(ordenadas) - 1
+    return {
+        f"p{ponto:g}": ordenadas[min(ultimo, max(0, round(ponto / 100 * len(ordenadas)) - 1))]
+        for ponto in pontos
+    }
@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+"""
+suite.py
+
+Suíte de benchmarks reprodutível das camadas de validação (Ogum/Oxossi),
+modelo (CaminhoSOModel) e mensagens (Exu).
+
+Cada caso roda sobre um cenário gerado num diretório temporário e é medido em
+três passadas separadas, para que uma medição não distorça a outra:
+
+1. Tempo: latência de cada operação (``perf_counter_ns``), da qual saem os
+   percentis p50/p95/p99 e a vazão em operações por segundo;
+2. Syscalls: chamadas de sistema de arquivos por operação (ContadorSyscalls);
+3. Memória: pico alocado durante uma passada (``tracemalloc``).
+
+O resultado é um dicionário pronto para JSON; ``comparar`` aponta regressões
+entre duas execuções (ex.: entre dois commits). Executado por
+``python -m benchmarks`` (ver benchmarks/__main__.py).
+"""
+
+import gc
+import os
+import platform
+import subprocess
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterable, NamedTuple, Optional
+
+from app.mensagens.app_mensageiro import Exu
+from app.models.app_models import CaminhoSOModel
+from app.utils.app_analisador import Ifa
+from app.utils.app_tools import Ogum
+from app.utils.app_varredura import Oxossi
+from benchmarks.bench_analisador import MODELOS
+from benchmarks.comum import (
+    ContadorSyscalls,
+    criar_arquivos_vazios,
+    criar_arvore_larga,
+    criar_arvore_profunda,
+    criar_arvore_sintetica,
+    criar_sem_permissao,
+    percentis,
+)
+
+
+class Caso(NamedTuple):
+    """
+    Um benchmark da suíte.
+
+    Atributos:
+        nome (str): Identificador estável, usado na comparação entre execuções
+        cenario (str): Chave do cenário cujas entradas alimentam ``funcao``
+        funcao (Callable): Operação medida, chamada uma vez por entrada
+        preparar (Callable | None): Executado antes de cada passada (ex.: limpar caches)
+    """
+    nome: str
+    cenario: str
+    funcao: Callable[[Any], object]
+    preparar: Optional[Callable[[], None]] = None
+
+
+def _to_dict_modelo(caminho: str) -> object:
+    return CaminhoSOModel(caminho).to_dict()
+
+
+def _identificar_sistema(caminho: str) -> object:
+    return CaminhoSOModel(caminho)._identificar_sistema()  # pylint: disable=W0212
+
+
+def _formatar(par: tuple[Callable[..., str], tuple]) -> object:
+    formatador, argumentos = par
+    return formatador(*argumentos)
+
+
+def _contar_entradas(raiz: str) -> object:
+    return sum(1 for _ in Oxossi.varrer(raiz))
+
+
+CASOS: tuple[Caso, ...] = (
+    Caso("ogum.validar[profunda]", "profunda", Ogum.validar),
+    Caso("ogum.validar[larga]", "larga", Ogum.validar),
+    Caso("ogum.validar[vazios]", "vazios", Ogum.validar),
+    Caso("ogum.validar[negados]", "negados", Ogum.validar),
+    Caso("ogum.validar[misto]", "misto", Ogum.validar),
+    Caso("modelo.to_dict[misto]", "misto", _to_dict_modelo, CaminhoSOModel._cache.limpar),
+    Caso("modelo.to_dict_cache[misto]", "misto", _to_dict_modelo),
+    Caso(
+        "modelo._identificar_sistema[corpus]", "corpus",
+        _identificar_sistema, Ifa.analisar.cache_clear,
+    ),
+    Caso("exu.formatar[corpus]", "mensagens", _formatar),
+    Caso("oxossi.varrer[arvores]", "arvores", _contar_entradas),
+)
+
+
+def montar_cenarios(raiz: str, escala: float = 1.0) -> dict[str, list]:
+    """
+    Gera os cenários em ``raiz`` e devolve as entradas de cada um.
+
+    ``escala`` multiplica o tamanho de todos os cenários (1.0 ≈ 20 mil entradas).
+    """
+    def tamanho(base: int) -> int:
+        return max(1, int(base * escala))
+
+    cenarios: dict[str, list] = {}
+    for nome, criar, base in (
+        ("profunda", criar_arvore_profunda, 200),
+        ("larga", criar_arvore_larga, 5000),
+        ("vazios", criar_arquivos_vazios, 5000),
+        ("negados", criar_sem_permissao, 500),
+        ("misto", criar_arvore_sintetica, 400),
+    ):
+        pasta = os.path.join(raiz, nome)
+        os.mkdir(pasta)
+        cenarios[nome] = criar(pasta, tamanho(base))
+
+    corpus = [
+        MODELOS[indice % len(MODELOS)].format(n=indice) for indice in range(tamanho(20000))
+    ]
+    cenarios["corpus"] = corpus
+    formatadores = [getattr(Exu, codigo) for codigo in sorted(Exu.CODIGOS)]
+    repetidos = formatadores * (len(corpus) // len(formatadores) + 1)
+    cenarios["mensagens"] = [
+        (Exu.tipo_identificado, (caminho, "arquivo")) if formatador is Exu.tipo_identificado
+        else (formatador, (caminho,))
+        for caminho, formatador in zip(corpus, repetidos)
+    ]
+    cenarios["arvores"] = [
+        os.path.join(raiz, nome) for nome in ("profunda", "larga", "vazios", "misto")
+    ]
+    return cenarios
+
+
+def medir_caso(caso: Caso, entradas: list, repeticoes: int = 5) -> dict[str, Any]:
+    """Executa as três passadas (tempo, syscalls, memória) de um caso."""
+    preparar = caso.preparar or (lambda: None)
+    funcao = caso.funcao
+    relogio = time.perf_counter_ns
+
+    preparar()
+    for entrada in entradas:  # aquecimento (imports, caches de código)
+        funcao(entrada)
+
+    amostras: list[int] = []
+    decorrido = 0
+    for _ in range(repeticoes):
+        preparar()
+        inicio = relogio()
+        for entrada in entradas:
+            antes = relogio()
+            funcao(entrada)
+            amostras.append(relogio() - antes)
+        decorrido += relogio() - inicio
+
+    preparar()
+    with ContadorSyscalls() as contador:
+        for entrada in entradas:
+            funcao(entrada)
+
+    preparar()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        for entrada in entradas:
+            funcao(entrada)
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    latencias = percentis([amostra / 1000 for amostra in amostras])
+    return {
+        "cenario": caso.cenario,
+        "operacoes": len(amostras),
+        "vazao_ops_s": round(len(amostras) / (decorrido / 1e9), 1) if decorrido else 0.0,
+        "latencia_us": {
+            **{chave: round(valor, 3) for chave, valor in latencias.items()},
+            "media": round(sum(amostras) / len(amostras) / 1000, 3) if amostras else 0.0,
+        },
+        "syscalls_por_op": round(contador.total / len(entradas), 3) if entradas else 0.0,
+        "syscalls": {nome: total for nome, total in contador.chamadas.items() if total},
+        "pico_memoria_kb": round(pico / 1024, 1),
+    }
+
+
+def metadados(escala: float, repeticoes: int) -> dict[str, Any]:
+    """Contexto da execução, gravado junto dos resultados."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "data": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "cpus": os.cpu_count(),
+        # Como root as entradas do cenário 'negados' continuam legíveis
+        "root": hasattr(os, "geteuid") and os.geteuid() == 0,
+        "escala": escala,
+        "repeticoes": repeticoes,
+    }
+
+
+def executar(
+    raiz: str,
+    escala: float = 1.0,
+    repeticoes: int = 5,
+    filtro: str = "",
+    progresso: Optional[Callable[[str], None]] = None,
+) -> dict[str, Any]:
+    """Monta os cenários em ``raiz`` e mede os casos cujo nome contém ``filtro``."""
+    cenarios = montar_cenarios(raiz, escala)
+    casos: dict[str, Any] = {}
+    for caso in CASOS:
+        if filtro not in caso.nome:
+            continue
+        if progresso is not None:
+            progresso(caso.nome)
+        casos[caso.nome] = medir_caso(caso, cenarios[caso.cenario], repeticoes)
+    return {"meta": metadados(escala, repeticoes), "casos": casos}
+
+
+def comparar(
+    base: dict[str, Any], atual: dict[str, Any], tolerancia: float = 0.15
+) -> list[str]:
+    """
+    Lista as regressões de ``atual`` em relação a ``base``.
+
+    São regressões: p50 ou p95 maiores que ``1 + tolerancia`` vezes a base,
+    vazão menor que ``1 - tolerancia`` vezes a base, pico de memória acima da
+    tolerância e qualquer aumento de syscalls por operação (que é determinístico).
+    """
+    regressoes: list[str] = []
+    for nome, medida in atual["casos"].items():
+        anterior = base.get("casos", {}).get(nome)
+        if anterior is None:
+            continue
+        for percentil in ("p50", "p95"):
+            antes, depois = anterior["latencia_us"][percentil], medida["latencia_us"][percentil]
+            if antes and depois > antes * (1 + tolerancia):
+                regressoes.append(f"{nome}: {percentil} {antes:.2f} → {depois:.2f} µs")
+        antes, depois = anterior["vazao_ops_s"], medida["vazao_ops_s"]
+        if depois < antes * (1 - tolerancia):
+            regressoes.append(f"{nome}: vazão {antes:.0f} → {depois:.0f} ops/s")
+        antes, depois = anterior["syscalls_por_op"], medida["syscalls_por_op"]
+        if depois > antes + 1e-9:
+            regressoes.append(f"{nome}: syscalls/op {antes:.3f} → {depois:.3f}")
+        antes, depois = anterior["pico_memoria_kb"], medida["pico_memoria_kb"]
+        if antes and depois > antes * (1 + tolerancia):
+            regressoes.append(f"{nome}: memória {antes:.1f} → {depois:.1f} KiB")
+    return regressoes
+
+
+def formatar_tabela(resultado: dict[str, Any]) -> Iterable[str]:
+    """Linhas de texto resumindo cada caso."""
+    yield (
+        f"{'caso':<40} {'ops/s':>12} {'p50 µs':>9} {'p95 µs':>9} {'p99 µs':>9} "
+        f"{'sys/op':>7} {'pico KiB':>9}"
+    )
+    for nome, medida in resultado["casos"].items():
+        latencia = medida["latencia_us"]
+        yield (
+            f"{nome:<40} {medida['vazao_ops_s']:>12,.0f} {latencia['p50']:>9.2f} "
+            f"{latencia['p95']:>9.2f} {latencia['p99']:>9.2f} "
+            f"{medida['syscalls_por_op']:>7.2f} {medida['pico_memoria_kb']:>9.1f}"
+        )
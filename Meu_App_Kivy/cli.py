@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+"""
+cli.py
+
+Ponto de entrada sem interface gráfica do Apontador.
+
+Lê caminhos da entrada padrão (ou de um arquivo), um por linha ou separados
+por NUL, valida-os com o Ogum em paralelo e escreve um resultado por caminho
+na saída padrão, em JSON Lines ou CSV. O consumo de memória é constante: a
+entrada é lida aos poucos e cada resultado é escrito assim que fica pronto.
+
+Exemplos (a partir de Meu_App_Kivy/):
+    find / -print0 | python cli.py -0 --workers 32 > resultados.jsonl
+    python cli.py manifesto.txt --formato csv --progresso 5 > resultados.csv
+"""
+
+import argparse
+import csv
+import json
+import math
+import sys
+import time
+from typing import BinaryIO, Iterator, Optional, TextIO
+
+from app.utils.app_tools import Ogum, ResultadoValidacao
+
+CAMPOS: tuple[str, ...] = ("caminho", "valido", "legivel", "tipo", "vazio", "codigo")
+TAMANHO_BLOCO = 1 << 16
+
+
+def ler_caminhos(fluxo: BinaryIO, separador: bytes) -> Iterator[str]:
+    """
+    Lê caminhos de ``fluxo`` em blocos, sem carregar a entrada inteira.
+
+    Bytes que não são UTF-8 válido são preservados via ``surrogateescape``,
+    então qualquer nome de arquivo pode ser validado e reescrito na saída.
+    """
+    sobra = b""
+    while True:
+        bloco = fluxo.read(TAMANHO_BLOCO)
+        if not bloco:
+            break
+        partes = (sobra + bloco).split(separador)
+        sobra = partes.pop()
+        for parte in partes:
+            if separador == b"\n":
+                parte = parte.rstrip(b"\r")
+            if parte:
+                yield parte.decode("utf-8", "surrogateescape")
+    if sobra.strip(b"\r"):
+        yield sobra.rstrip(b"\r").decode("utf-8", "surrogateescape")
+
+
+class Progresso:
+    """
+    Relata na saída de erro quantos caminhos já foram processados e a vazão.
+
+    Args:
+        intervalo: Segundos entre relatos; None desativa os relatos periódicos
+        destino: Fluxo de texto onde os relatos são escritos
+    """
+
+    def __init__(self, intervalo: Optional[float], destino: TextIO = sys.stderr):
+        self._intervalo = intervalo
+        self._destino = destino
+        self._inicio = time.monotonic()
+        self._proximo = self._inicio + (intervalo or 0)
+        self.total = 0
+        self.validos = 0
+
+    def registrar(self, resultado: ResultadoValidacao) -> None:
+        self.total += 1
+        self.validos += resultado["valido"]
+        if self._intervalo is not None:
+            # Consultar o relógio a cada resultado custa pouco perto da validação,
+            # e mantém os relatos em dia mesmo quando cada caminho demora
+            agora = time.monotonic()
+            if agora >= self._proximo:
+                self._proximo = agora + self._intervalo
+                self._relatar(agora)
+
+    def finalizar(self) -> None:
+        self._relatar(time.monotonic(), final=True)
+
+    def _relatar(self, agora: float, final: bool = False) -> None:
+        decorrido = max(agora - self._inicio, 1e-9)
+        prefixo = "✔️ Concluído" if final else "⏳ Progresso"
+        self._destino.write(
+            f"{prefixo}: {self.total} caminhos ({self.validos} válidos) "
+            f"em {decorrido:.1f}s - {self.total / decorrido:,.0f} caminhos/s\n"
+        )
+        self._destino.flush()
+
+
+def linha_saida(resultado: ResultadoValidacao, com_texto: bool) -> dict:
+    """Converte o resultado para os campos escritos pela CLI."""
+    linha = {
+        "caminho": resultado["caminho"],
+        "valido": resultado["valido"],
+        "legivel": resultado["legivel"],
+        "tipo": resultado["tipo"],
+        "vazio": resultado["vazio"],
+        "codigo": resultado["mensagem"].codigo,
+    }
+    if com_texto:
+        linha["mensagem"] = str(resultado["mensagem"])
+    return linha
+
+
+def inteiro_positivo(texto: str) -> int:
+    """Tipo do argparse para contagens que precisam ser maiores que zero."""
+    try:
+        valor = int(texto)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"inteiro inválido: {texto!r}") from None
+    if valor < 1:
+        raise argparse.ArgumentTypeError(f"deve ser maior ou igual a 1: {valor}")
+    return valor
+
+
+def real_positivo(texto: str) -> float:
+    """Tipo do argparse para durações em segundos, finitas e maiores que zero."""
+    try:
+        valor = float(texto)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"número inválido: {texto!r}") from None
+    if not 0 < valor < math.inf:
+        raise argparse.ArgumentTypeError(f"deve ser maior que zero: {valor}")
+    return valor
+
+
+def criar_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Valida caminhos em fluxo e escreve os resultados em JSON Lines ou CSV."
+    )
+    parser.add_argument("entrada", nargs="?", default="-",
+                        help="Arquivo com os caminhos ('-' ou omitido lê a entrada padrão)")
+    parser.add_argument("-0", "--nul", action="store_true",
+                        help="Caminhos separados por NUL em vez de quebra de linha")
+    parser.add_argument("--formato", choices=("jsonl", "csv"), default="jsonl")
+    parser.add_argument("--workers", type=inteiro_positivo, default=16,
+                        help="Threads de validação simultâneas (padrão: 16)")
+    parser.add_argument("--timeout", type=real_positivo, default=None,
+                        help="Tempo máximo em segundos por caminho")
+    parser.add_argument("--fora-de-ordem", action="store_true",
+                        help="Escreve os resultados conforme terminam, sem manter a ordem")
+    parser.add_argument("--texto", action="store_true",
+                        help="Inclui a mensagem do Exu por extenso em cada resultado")
+    parser.add_argument("--progresso", type=float, default=None, metavar="SEGUNDOS",
+                        help="Relata progresso e vazão na saída de erro a cada N segundos")
+    return parser
+
+
+def executar(argumentos: argparse.Namespace, entrada: BinaryIO, saida: TextIO) -> int:
+    """Executa a validação em fluxo; retorna o código de saída do processo."""
+    caminhos = ler_caminhos(entrada, b"\0" if argumentos.nul else b"\n")
+    resultados = Ogum.validar_lote(
+        caminhos,
+        workers=argumentos.workers,
+        ordenado=not argumentos.fora_de_ordem,
+        timeout=argumentos.timeout,
+    )
+    progresso = Progresso(argumentos.progresso)
+
+    if argumentos.formato == "csv":
+        escritor = csv.writer(saida)
+        escritor.writerow(CAMPOS + (("mensagem",) if argumentos.texto else ()))
+        for resultado in resultados:
+            escritor.writerow(linha_saida(resultado, argumentos.texto).values())
+            progresso.registrar(resultado)
+    else:
+        for resultado in resultados:
+            linha = linha_saida(resultado, argumentos.texto)
+            saida.write(json.dumps(linha, ensure_ascii=False) + "\n")
+            progresso.registrar(resultado)
+
+    if argumentos.progresso is not None:
+        progresso.finalizar()
+    return 0
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    argumentos = criar_parser().parse_args(argv)
+    sys.stdout.reconfigure(errors="surrogateescape", newline="")  # type: ignore[union-attr]
+    try:
+        if argumentos.entrada == "-":
+            return executar(argumentos, sys.stdin.buffer, sys.stdout)
+        with open(argumentos.entrada, "rb") as entrada:
+            return executar(argumentos, entrada, sys.stdout)
+    except BrokenPipeError:
+        # Consumidor da saída (ex.: head) encerrou o pipe: termina em silêncio
+        sys.stderr.close()
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,25 +6,25 @@ main.py
 
 Módulo principal da aplicação Kivy/KivyMD.
 
-Este módulo é responsável por iniciar o aplicativo, carregando os arquivos de layout (.kv),
-instanciando os modelos e utilitários necessários, e exibindo a tela inicial por meio
-do gerenciador de telas.
+Este módulo é responsável por iniciar o aplicativo, instanciando os modelos e
+utilitários necessários e exibindo a tela inicial por meio do gerenciador de telas.
+
+Para abrir rápido, só o KivyMD é importado no carregamento do módulo: a janela,
+o gerenciador de telas e os arquivos de layout (.kv) são carregados em `build`,
+e a validação inicial do caminho roda em segundo plano depois do primeiro quadro.
 
 A arquitetura segue o padrão MVC, e este ponto de entrada conecta a interface gráfica
 à lógica de controle e dados.
 """
 
-from kivy.core.window import Window  # type: ignore
-from kivy.lang import Builder
+import logging
+import threading
+
 from kivymd.app import MDApp  # type: ignore
 
-from app.views.app_gerenciador_telas import GerenciadorTelas
 from app.models.app_models import CaminhoSOModel
-from app.utils.app_tools import Ogum
 
-# Carregamento das interfaces gráficas (.kv)
-Builder.load_file("app/views/telas/tela_inicial.kv")
-Builder.load_file("app/views/telas/tela_principal.kv")
+logger = logging.getLogger(__name__)
 
 
 class MeuApp(MDApp):
@@ -36,27 +36,22 @@ class MeuApp(MDApp):
 
     Attributes:
         model (CaminhoSOModel): Instância inicial da Model com dados do caminho.
-        caminho (dict): Representação do estado inicial do caminho.
+        caminho (dict): Estado inicial do caminho, preenchido após a validação em segundo plano.
     """
 
     def __init__(self, **kwargs):
         """
         Inicializa a aplicação.
 
-        Define o modelo de caminho inicial, prepara variáveis de estado
-        e executa uma validação de teste com o utilitário Ogum.
+        Define o modelo de caminho inicial e prepara variáveis de estado.
         """
         super().__init__(**kwargs)
 
-        # Instância da Model com caminho nulo
+        # Instância da Model com caminho nulo (a construção não toca o disco)
         self.model = CaminhoSOModel(caminho="/home/")
-        self.caminho = self.model.to_dict()
+        self.caminho: dict = {}
 
-        # Execução de validação inicial (pode ser substituído por logging)
-        saudador = Ogum()
-        print(saudador.validar(caminho='/home/'))  # Debug temporário
-
-    def build(self) -> GerenciadorTelas:
+    def build(self):
         """
         Constrói e retorna a interface principal da aplicação.
 
@@ -66,11 +61,39 @@ class MeuApp(MDApp):
         Returns:
             GerenciadorTelas: ScreenManager com a tela inicial carregada.
         """
+        # Importados aqui: criar a janela e as telas só faz sentido ao rodar o app
+        from kivy.core.window import Window  # type: ignore
+        from app.views.app_gerenciador_telas import GerenciadorTelas
+
         self.theme_cls.primary_palette = "Green"
         Window.size = (600, 800)
 
         return GerenciadorTelas()
 
+    def on_start(self):
+        """
+        Dispara a validação inicial fora da thread da interface.
+
+        Um ponto de montagem lento não deve atrasar o primeiro quadro.
+        """
+        threading.Thread(target=self._validacao_inicial, daemon=True).start()
+
+    def _validacao_inicial(self):
+        """
+        Valida o caminho inicial e entrega o resultado na thread da interface.
+        """
+        from kivy.clock import Clock  # type: ignore
+
+        caminho = self.model.to_dict()
+        Clock.schedule_once(lambda _dt: self._aplicar_validacao(caminho))
+
+    def _aplicar_validacao(self, caminho: dict):
+        """
+        Guarda o estado inicial do caminho validado.
+        """
+        self.caminho = caminho
+        logger.debug("Validação inicial: %s", self.caminho)
+
 
 if __name__ == "__main__":
     MeuApp().run()
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""Testes da análise sintática de caminhos do Ifa."""
+
+from pathlib import PurePosixPath, PureWindowsPath
+
+import pytest
+
+from app.utils.app_analisador import Ifa
+
+
+@pytest.mark.parametrize(
+    ("caminho", "sistema", "forma", "drive", "raiz", "partes", "absoluto"),
+    [
+        ("/etc/hosts", "posix", "absoluto", "", "/", ("etc", "hosts"), True),
+        ("/Users/ana/./foto.jpg", "mac", "absoluto", "", "/", ("Users", "ana", "foto.jpg"), True),
+        ("C:\\Dados/relatorio.pdf", "windows", "absoluto", "C:", "\\",
+         ("Dados", "relatorio.pdf"), True),
+        ("c:pasta\\x", "windows", "drive_relativo", "c:", "", ("pasta", "x"), False),
+        ("\\pasta\\x", "windows", "raiz_relativo", "", "\\", ("pasta", "x"), False),
+        ("\\\\srv\\share\\a\\b.txt", "windows", "unc", "\\\\srv\\share", "\\",
+         ("a", "b.txt"), True),
+        ("\\\\?\\C:\\muito\\longo", "windows", "longo", "\\\\?\\C:", "\\",
+         ("muito", "longo"), True),
+        ("\\\\?\\UNC\\srv\\share\\a", "windows", "longo", "\\\\?\\UNC\\srv\\share", "\\",
+         ("a",), True),
+        ("\\\\.\\COM1", "windows", "dispositivo", "\\\\.\\COM1", "", (), True),
+        ("~/docs/a.md", "posix", "home", "", "", ("~", "docs", "a.md"), False),
+        ("~ana\\docs", "windows", "home", "", "", ("~ana", "docs"), False),
+        ("docs/a.md", "posix", "relativo", "", "", ("docs", "a.md"), False),
+        ("docs\\a.md", "windows", "relativo", "", "", ("docs", "a.md"), False),
+        ("leia-me", "desconhecido", "relativo", "", "", ("leia-me",), False),
+        ("   ", "desconhecido", "vazio", "", "", (), False),
+    ],
+)
+def test_analisar_prefixos(caminho, sistema, forma, drive, raiz, partes, absoluto):
+    analise = Ifa.analisar(caminho)
+    assert analise.original == caminho
+    assert (analise.sistema, analise.forma) == (sistema, forma)
+    assert (analise.drive, analise.raiz) == (drive, raiz)
+    assert analise.partes == partes
+    assert analise.absoluto is absoluto
+
+
+@pytest.mark.parametrize(
+    ("url", "sistema", "drive", "partes"),
+    [
+        ("file:///home/ana/a%20b.txt", "posix", "", ("home", "ana", "a b.txt")),
+        ("file:///C:/Dados/x.txt", "windows", "C:", ("Dados", "x.txt")),
+        ("file://localhost/etc", "posix", "", ("etc",)),
+        ("file://srv/share/a.txt", "windows", "\\\\srv\\share", ("a.txt",)),
+    ],
+)
+def test_analisar_url(url, sistema, drive, partes):
+    analise = Ifa.analisar(url)
+    assert analise.forma == "url"
+    assert analise.original == url
+    assert (analise.sistema, analise.drive, analise.partes) == (sistema, drive, partes)
+    assert analise.absoluto is True
+
+
+@pytest.mark.parametrize(
+    "caminho", ["/a/b.tar.gz", "/a/.bashrc", "/a/ponto.", "/", "rel/x.py", "/a/b/"]
+)
+def test_nome_stem_sufixo_como_purepath(caminho):
+    analise = Ifa.analisar(caminho)
+    referencia = PurePosixPath(caminho)
+    assert (analise.nome, analise.stem, analise.sufixo) == (
+        referencia.name, referencia.stem, referencia.suffix
+    )
+
+
+@pytest.mark.parametrize("caminho", ["C:\\a\\b.txt", "C:\\", "\\\\srv\\share\\x\\y"])
+def test_pai_como_purewindowspath(caminho):
+    assert Ifa.analisar(caminho).pai == str(PureWindowsPath(caminho).parent)
+
+
+def test_pai_e_profundidade():
+    analise = Ifa.analisar("/var/log/syslog")
+    assert analise.pai == "/var/log"
+    assert analise.profundidade == 3
+    assert analise.separador == "/"
+    assert Ifa.analisar("arquivo").pai == "."
+
+
+def test_resultados_ficam_em_cache():
+    assert Ifa.analisar("/cache/teste") is Ifa.analisar("/cache/teste")
+
+
+def test_identificar_sistema():
+    assert Ifa.identificar_sistema("D:\\x") == "windows"
+    assert Ifa.identificar_sistema("/Volumes/Backup") == "mac"
+    assert Ifa.identificar_sistema("") == "desconhecido"
+
+
+def test_classificar_lote_igual_a_analise_individual():
+    caminhos = [
+        "/etc/hosts", "C:\\a\\b.TXT", b"/Users/ana/foto.jpg", "rel/x.py", "", "/etc/hosts"
+    ]
+    lote = Ifa.classificar_lote(caminhos)
+    assert len(lote) == len(caminhos)
+    for indice, caminho in enumerate(caminhos):
+        texto = caminho.decode() if isinstance(caminho, bytes) else caminho
+        analise = Ifa.analisar(texto)
+        assert lote[indice] == {
+            "sistema": analise.sistema,
+            "extensao": analise.sufixo,
+            "profundidade": len(analise.partes),
+            "absoluto": analise.absoluto,
+        }
+
+
+def test_classificar_lote_com_memoria_pequena():
+    caminhos = [f"/pasta/{indice % 7}.txt" for indice in range(100)]
+    lote = Ifa.classificar_lote(caminhos, memoria=3)
+    assert list(lote.extensoes) == [".txt"] * 100
+    assert set(lote.profundidades) == {2}
+    assert lote.extensoes[0] is lote.extensoes[99]
+
+
+def test_classificar_lote_bytes_invalidos():
+    lote = Ifa.classificar_lote([b"/a/\xff.bin"])
+    assert lote[0]["sistema"] == "posix"
+    assert lote[0]["extensao"] == ".bin"
+
+
+def test_para_numpy():
+    numpy = pytest.importorskip("numpy")
+    colunas = Ifa.classificar_lote(["/a/b.txt", "C:\\x"]).para_numpy()
+    assert list(colunas["sistema"]) == ["posix", "windows"]
+    assert colunas["profundidade"].dtype == numpy.uint32
+    assert list(colunas["absoluto"]) == [True, True]
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""Testes da suíte de benchmarks (medição e comparação entre execuções)."""
+
+import json
+import os
+
+import pytest
+
+from benchmarks import __main__ as principal
+from benchmarks.comum import ContadorSyscalls, liberar_permissoes, percentis
+from benchmarks.suite import Caso, comparar, executar, formatar_tabela, medir_caso
+
+
+def _medida(p50=10.0, p95=20.0, vazao=1000.0, syscalls=1.0, memoria=100.0):
+    return {
+        "latencia_us": {"p50": p50, "p95": p95, "p99": p95},
+        "vazao_ops_s": vazao,
+        "syscalls_por_op": syscalls,
+        "pico_memoria_kb": memoria,
+    }
+
+
+def test_percentis():
+    assert percentis(list(range(1, 101))) == {"p50": 50, "p95": 95, "p99": 99}
+    assert percentis([]) == {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+    assert percentis([7.0], (50,)) == {"p50": 7.0}
+
+
+def test_contador_syscalls_restaura_o_modulo_os(tmp_path):
+    original = os.stat
+    with ContadorSyscalls() as contador:
+        os.stat(tmp_path)
+        os.listdir(tmp_path)
+    assert os.stat is original
+    assert contador.chamadas["stat"] == 1 and contador.chamadas["listdir"] == 1
+    assert contador.total == 2
+
+
+def test_comparar_aponta_cada_regressao():
+    base = {"casos": {"a": _medida(), "b": _medida()}}
+    atual = {"casos": {
+        "a": _medida(p50=11.0, p95=30.0, vazao=700.0, syscalls=1.5, memoria=200.0),
+        "b": _medida(p50=11.4, vazao=900.0),
+        "novo": _medida(),
+    }}
+    regressoes = comparar(base, atual, tolerancia=0.15)
+    assert [regressao.split(":")[0] for regressao in regressoes] == ["a"] * 4
+    assert any("p95" in regressao for regressao in regressoes)
+    assert not any("p50" in regressao for regressao in regressoes)
+
+
+def test_comparar_syscalls_sem_tolerancia():
+    base = {"casos": {"a": _medida(syscalls=2.0)}}
+    atual = {"casos": {"a": _medida(syscalls=2.001)}}
+    assert comparar(base, atual, tolerancia=0.5) == ["a: syscalls/op 2.000 → 2.001"]
+
+
+def test_medir_caso(tmp_path):
+    chamadas = []
+    # os.stat é resolvido a cada chamada para que o ContadorSyscalls o enxergue
+    caso = Caso(
+        "teste", "cenario", lambda caminho: os.stat(caminho), preparar=lambda: chamadas.append(1)
+    )
+    medida = medir_caso(caso, [str(tmp_path)] * 10, repeticoes=3)
+    assert medida["operacoes"] == 30
+    assert medida["syscalls_por_op"] == 1.0
+    assert medida["syscalls"] == {"stat": 10}
+    assert medida["latencia_us"]["p50"] <= medida["latencia_us"]["p99"]
+    assert len(chamadas) == 1 + 3 + 1 + 1
+
+
+@pytest.fixture
+def raiz_suite(tmp_path):
+    raiz = tmp_path / "suite"
+    raiz.mkdir()
+    yield str(raiz)
+    liberar_permissoes(str(raiz))
+
+
+def test_executar_filtra_os_casos(raiz_suite):
+    resultado = executar(raiz_suite, escala=0.01, repeticoes=1, filtro="ogum.validar[")
+    assert set(resultado["meta"]) >= {"commit", "python", "escala", "repeticoes"}
+    assert resultado["casos"]
+    assert all(nome.startswith("ogum.validar[") for nome in resultado["casos"])
+    linhas = list(formatar_tabela(resultado))
+    assert len(linhas) == len(resultado["casos"]) + 1
+    json.dumps(resultado)
+
+
+def test_main_sai_com_1_quando_ha_regressao(tmp_path, capsys):
+    saida = tmp_path / "atual.json"
+    argumentos = ["--escala", "0.01", "--repeticoes", "1", "--filtro", "exu."]
+    assert principal.main([*argumentos, "--saida", str(saida)]) == 0
+    resultado = json.loads(saida.read_text(encoding="utf-8"))
+
+    rapida = {"casos": {nome: _medida(0.0001, 0.0001, 1e12, 0, 0)
+                        for nome in resultado["casos"]}}
+    (tmp_path / "rapida.json").write_text(json.dumps(rapida), encoding="utf-8")
+    assert principal.main([*argumentos, "--comparar", str(tmp_path / "rapida.json")]) == 1
+
+    lenta = {"casos": {nome: _medida(1e9, 1e9, 0.0, 1e9, 1e9) for nome in resultado["casos"]}}
+    (tmp_path / "lenta.json").write_text(json.dumps(lenta), encoding="utf-8")
+    assert principal.main([*argumentos, "--comparar", str(tmp_path / "lenta.json")]) == 0
+    assert "Sem regressões" in capsys.readouterr().out
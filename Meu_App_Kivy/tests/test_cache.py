@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""Testes do CacheValidacao (LRU, TTL e revalidação por stat)."""
+
+import os
+
+import pytest
+
+from app.utils.app_cache import CacheValidacao
+from app.utils.app_tools import Ogum
+
+
+class Relogio:
+    """Relógio manual para controlar o TTL."""
+
+    def __init__(self):
+        self.agora = 0.0
+
+    def __call__(self):
+        return self.agora
+
+
+@pytest.fixture
+def contador_validacoes(monkeypatch):
+    chamadas = []
+    original = Ogum.validar_com_stat
+
+    def contar(caminho):
+        chamadas.append(caminho)
+        return original(caminho)
+
+    monkeypatch.setattr(Ogum, "validar_com_stat", staticmethod(contar))
+    return chamadas
+
+
+@pytest.fixture
+def arquivos(tmp_path):
+    caminhos = []
+    for indice in range(4):
+        arquivo = tmp_path / f"{indice}.txt"
+        arquivo.write_text("x" * indice)
+        caminhos.append(str(arquivo))
+    return caminhos
+
+
+def test_acerto_nao_volta_ao_disco(arquivos, contador_validacoes):
+    cache = CacheValidacao()
+    primeiro = cache.validar(arquivos[1])
+    assert cache.validar(arquivos[1]) is primeiro
+    assert contador_validacoes == [arquivos[1]]
+    assert cache.estatisticas["acertos"] == 1
+    assert cache.estatisticas["falhas"] == 1
+    assert primeiro["valido"] and primeiro["mensagem"].codigo == "caminho_valido"
+
+
+def test_lru_despeja_o_menos_usado(arquivos):
+    cache = CacheValidacao(capacidade=2)
+    cache.validar(arquivos[0])
+    cache.validar(arquivos[1])
+    cache.validar(arquivos[0])  # 0 passa a ser o mais recente
+    cache.validar(arquivos[2])
+    assert arquivos[0] in cache
+    assert arquivos[1] not in cache
+    assert len(cache) == 2
+    assert cache.estatisticas["despejos"] == 1
+
+
+def test_ttl_vencido_e_confirmado_por_stat(arquivos, contador_validacoes):
+    relogio = Relogio()
+    cache = CacheValidacao(ttl=10, relogio=relogio)
+    resultado = cache.validar(arquivos[2])
+    relogio.agora = 11
+    assert cache.obter(arquivos[2]) is None
+    assert cache.validar(arquivos[2]) is resultado
+    assert contador_validacoes == [arquivos[2]]
+    assert cache.estatisticas["expiracoes"] == 1
+    assert cache.estatisticas["revalidacoes"] == 1
+
+
+def test_ttl_vencido_com_arquivo_alterado_valida_de_novo(arquivos, contador_validacoes):
+    relogio = Relogio()
+    cache = CacheValidacao(ttl=10, relogio=relogio)
+    assert cache.validar(arquivos[0])["vazio"] is True
+    with open(arquivos[0], "w", encoding="utf-8") as arquivo:
+        arquivo.write("agora tem conteúdo")
+    assert cache.validar(arquivos[0])["vazio"] is True  # Dentro do TTL
+    relogio.agora = 10
+    assert cache.validar(arquivos[0])["vazio"] is False
+    assert len(contador_validacoes) == 2
+
+
+def test_revalidar_detecta_remocao(arquivos):
+    cache = CacheValidacao()
+    assert cache.validar(arquivos[3])["valido"] is True
+    os.unlink(arquivos[3])
+    assert cache.validar(arquivos[3])["valido"] is True  # Sem TTL, vale o cache
+    assert cache.revalidar(arquivos[3])["valido"] is False
+
+
+def test_invalidar_e_limpar(arquivos):
+    cache = CacheValidacao()
+    cache.validar(arquivos[0])
+    cache.validar(arquivos[1])
+    assert cache.invalidar(arquivos[0]) is True
+    assert cache.invalidar(arquivos[0]) is False
+    cache.limpar()
+    assert len(cache) == 0
+    assert cache.estatisticas["falhas"] == 2
+
+
+def test_obter_nunca_toca_o_disco(arquivos, contador_validacoes):
+    cache = CacheValidacao()
+    assert cache.obter(arquivos[0]) is None
+    assert contador_validacoes == []
+
+
+def test_normalizar_compartilha_entradas_equivalentes(tmp_path, contador_validacoes):
+    (tmp_path / "a").mkdir()
+    cache = CacheValidacao(normalizar=True)
+    resultado = cache.validar(f"{tmp_path}//a/./")
+    assert resultado["caminho"] == f"{tmp_path}/a"
+    assert cache.validar(f"{tmp_path}/a") is resultado
+    assert f"{tmp_path}/x/../a" in cache
+    assert len(contador_validacoes) == 1
+
+
+def test_capacidade_invalida():
+    with pytest.raises(ValueError):
+        CacheValidacao(capacidade=0)
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""Testes da CLI de validação em fluxo."""
+
+import csv
+import io
+import json
+
+import pytest
+
+import cli
+
+
+def _executar(argv, entrada: bytes) -> str:
+    argumentos = cli.criar_parser().parse_args(argv)
+    saida = io.StringIO()
+    assert cli.executar(argumentos, io.BytesIO(entrada), saida) == 0
+    return saida.getvalue()
+
+
+def test_ler_caminhos_em_blocos(monkeypatch):
+    monkeypatch.setattr(cli, "TAMANHO_BLOCO", 3)
+    dados = b"/a/um\r\n\n/b/dois\n/c/tr\xeas"
+    assert list(cli.ler_caminhos(io.BytesIO(dados), b"\n")) == [
+        "/a/um", "/b/dois", "/c/tr\udceas"
+    ]
+    assert list(cli.ler_caminhos(io.BytesIO(b"x\ny\0z\0"), b"\0")) == ["x\ny", "z"]
+
+
+def test_jsonl_na_ordem_da_entrada(tmp_path):
+    (tmp_path / "vazio.txt").touch()
+    caminhos = [str(tmp_path / "vazio.txt"), str(tmp_path / "nada"), str(tmp_path)] * 20
+    saida = _executar(["--workers", "4"], "\n".join(caminhos).encode())
+    linhas = [json.loads(linha) for linha in saida.splitlines()]
+    assert [linha["caminho"] for linha in linhas] == caminhos
+    assert linhas[0]["codigo"] == "arquivo_vazio"
+    assert linhas[1]["valido"] is False
+    assert linhas[2]["tipo"] == "diretorio"
+
+
+def test_csv_com_texto(tmp_path):
+    saida = _executar(["--formato", "csv", "--texto", "-0"], str(tmp_path).encode() + b"\0")
+    cabecalho, linha = list(csv.reader(io.StringIO(saida)))
+    assert cabecalho == [*cli.CAMPOS, "mensagem"]
+    assert linha[0] == str(tmp_path)
+    assert linha[5] == "diretorio_vazio"
+
+
+@pytest.mark.parametrize("valor", ["0", "-3", "dois"])
+def test_workers_invalido_e_erro_de_uso(valor, capsys):
+    with pytest.raises(SystemExit) as saida:
+        cli.criar_parser().parse_args(["--workers", valor])
+    assert saida.value.code == 2
+    assert "--workers" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("valor", ["0", "-1.5", "nan", "inf", "meio"])
+def test_timeout_invalido_e_erro_de_uso(valor, capsys):
+    with pytest.raises(SystemExit) as saida:
+        cli.criar_parser().parse_args(["--timeout", valor])
+    assert saida.value.code == 2
+    assert "--timeout" in capsys.readouterr().err
+
+
+def test_timeout_valido():
+    assert cli.criar_parser().parse_args(["--timeout", "0.5"]).timeout == 0.5
+    assert cli.criar_parser().parse_args([]).timeout is None
+
+
+def test_progresso_relata_pelo_relogio(monkeypatch):
+    relogio = iter([0.0, 0.5, 2.0, 2.1])
+    monkeypatch.setattr(cli.time, "monotonic", lambda: next(relogio))
+    destino = io.StringIO()
+    progresso = cli.Progresso(1.0, destino)
+    for _ in range(3):
+        progresso.registrar({"valido": True})
+    # Só 3 resultados, mas o intervalo venceu no segundo
+    assert destino.getvalue().count("Progresso: 2 caminhos") == 1
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""Testes das representações compactas de resultados."""
+
+import pytest
+
+from app.mensagens.app_mensageiro import Mensagem
+from app.utils.app_compacto import (
+    BIT_LEGIVEL, BIT_VALIDO, BIT_VAZIO, LoteResultados, ResultadoCompacto, TipoCaminho
+)
+from app.utils.app_tools import Ogum
+
+
+def _resultado(caminho, tipo="arquivo", vazio=False, codigo="caminho_valido", valido=True):
+    return {
+        "caminho": caminho, "valido": valido, "legivel": valido, "tipo": tipo,
+        "vazio": vazio, "mensagem": Mensagem(codigo, caminho),
+    }
+
+
+@pytest.fixture
+def lote():
+    return LoteResultados([
+        _resultado("/dados/b.TXT"),
+        _resultado("/dados/sub", tipo="diretorio", vazio=True, codigo="diretorio_vazio"),
+        _resultado("/dados/a.txt", vazio=True, codigo="arquivo_vazio"),
+        _resultado("C:\\win\\leia-me", codigo="caminho_valido"),
+        _resultado("/nada", tipo="desconhecido", codigo="caminho_nao_encontrado", valido=False),
+    ])
+
+
+def test_compacto_equivale_ao_dicionario(tmp_path):
+    original = Ogum.validar(str(tmp_path))
+    compacto = ResultadoCompacto.de_resultado(original)
+    assert dict(compacto) == original
+    assert compacto.to_dict() == original
+    assert compacto["tipo"] == "diretorio" and compacto.get("vazio") is True
+    assert ResultadoCompacto.de_resultado(compacto) is compacto
+    with pytest.raises(KeyError):
+        compacto["inexistente"]
+
+
+def test_compacto_recusa_mensagem_com_dados():
+    resultado = _resultado("/a")
+    resultado["mensagem"] = Mensagem("tipo_identificado", "/a", "arquivo")
+    with pytest.raises(ValueError):
+        ResultadoCompacto.de_resultado(resultado)
+
+
+def test_tipo_caminho():
+    assert TipoCaminho.de_rotulo("diretorio") is TipoCaminho.DIRETORIO
+    assert TipoCaminho.de_rotulo("socket") is TipoCaminho.DESCONHECIDO
+    assert TipoCaminho.ARQUIVO.rotulo == "arquivo"
+
+
+def test_lote_reconstroi_os_resultados(lote):
+    assert len(lote) == 5
+    assert [r.caminho for r in lote] == [
+        "/dados/b.TXT", "/dados/sub", "/dados/a.txt", "C:\\win\\leia-me", "/nada"
+    ]
+    assert lote.flags(1) == BIT_VALIDO | BIT_LEGIVEL | BIT_VAZIO
+    assert lote.flags(4) == 0
+    assert lote.tipo(1) is TipoCaminho.DIRETORIO
+    assert lote.extensao(0) == ".txt"
+    assert lote[2]["mensagem"] == Mensagem("arquivo_vazio", "/dados/a.txt")
+    assert len(lote._pastas) == 3  # Diretórios internados
+
+
+def test_selecionar_filtros(lote):
+    assert list(lote.selecionar()) == [0, 1, 2, 3, 4]
+    assert list(lote.selecionar(tipo="arquivo")) == [0, 2, 3]
+    assert list(lote.selecionar(vazio=True)) == [1, 2]
+    assert list(lote.selecionar(extensao="TXT")) == [0, 2]
+    assert list(lote.selecionar(extensao=".txt", vazio=False)) == [0]
+    assert list(lote.selecionar(extensao="")) == [1, 3, 4]
+    assert list(lote.selecionar(ate=2)) == [0, 1]
+
+
+def test_selecionar_ordem(lote):
+    assert list(lote.selecionar(tipo="arquivo", ordem="nome")) == [2, 0, 3]
+    assert list(lote.selecionar(ordem="caminho", decrescente=True)) == [3, 4, 1, 0, 2]
+    assert list(lote.selecionar(decrescente=True)) == [4, 3, 2, 1, 0]
+    assert list(lote.selecionar(ordem="tipo"))[-1] == 1
+
+
+def test_selecionar_cancelado(lote):
+    assert list(lote.selecionar(tipo="arquivo", cancelado=lambda: True)) == []
+    assert list(lote.selecionar(ordem="nome", cancelado=lambda: True)) == []
+
+
+def test_selecionar_faixa_enquanto_o_lote_cresce(lote):
+    # Como a tela de resultados: seleciona o que já existe e depois só a faixa nova
+    primeira = lote.selecionar(vazio=True, ate=2)
+    assert list(primeira) == [1]
+    lote.adicionar(_resultado("/dados/c.txt", vazio=True, codigo="arquivo_vazio"))
+    primeira.extend(lote.selecionar(vazio=True, desde=2, ate=len(lote)))
+    assert list(primeira) == list(lote.selecionar(vazio=True)) == [1, 2, 5]
+    assert list(lote.selecionar(desde=3, ate=5)) == [3, 4]
+    assert list(lote.selecionar(desde=5, ate=5)) == []
+
+
+def test_selecionar_cancelado_no_meio(lote, monkeypatch):
+    monkeypatch.setattr("app.utils.app_compacto._BLOCO_SELECAO", 2)
+    consultas = []
+
+    def cancelado():
+        consultas.append(None)
+        return len(consultas) > 1  # A seleção fica obsoleta depois do 1º bloco
+
+    assert list(lote.selecionar(tipo="arquivo", ate=4, cancelado=cancelado)) == []
+    assert len(consultas) == 2
+    assert list(lote.selecionar(tipo="arquivo", ate=4, cancelado=lambda: False)) == [0, 2, 3]
+
+
+def test_adicionar_compacto(lote):
+    copia = LoteResultados(lote)
+    assert [dict(r) for r in copia] == [dict(r) for r in lote]
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""Testes do AppController (análise em segundo plano, em lotes)."""
+
+import threading
+import time
+
+import pytest
+
+from app.controller import app_controler
+from app.controller.app_controler import AppController
+
+
+def _drenar_ate_concluir(controller, prazo=5.0):
+    lotes = []
+    limite = time.monotonic() + prazo
+    while time.monotonic() < limite:
+        lotes.extend(controller.drenar(orcamento=0.05))
+        if lotes and lotes[-1].concluida:
+            return lotes
+        time.sleep(0.005)
+    raise AssertionError("a análise não terminou a tempo")
+
+
+@pytest.fixture
+def arvore(tmp_path):
+    for indice in range(40):
+        (tmp_path / f"{indice:02}.txt").write_text("x" * indice)
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "fundo.txt").touch()
+    return tmp_path
+
+
+@pytest.fixture
+def controller():
+    controlador = AppController(tamanho_lote=8, observar=False)
+    yield controlador
+    controlador.encerrar()
+
+
+def test_entrega_todos_os_registros_em_lotes(arvore, controller):
+    geracao = controller.analisar(str(arvore))
+    lotes = _drenar_ate_concluir(controller)
+    assert {lote.geracao for lote in lotes} == {geracao}
+    assert all(len(lote.registros) <= 8 for lote in lotes)
+    assert sum(len(lote.registros) for lote in lotes) == 43
+    assert lotes[-1].erro is None
+    assert controller.ocioso
+
+
+def test_resultados_acumulados(arvore, controller):
+    controller.analisar(str(arvore))
+    _drenar_ate_concluir(controller)
+    resultados, publicados = controller.resultados()
+    assert publicados == len(resultados) == 43
+    assert resultados[0].caminho == str(arvore)
+    assert len(resultados.selecionar(tipo="diretorio")) == 2
+
+
+def test_limite_de_resultados(arvore):
+    controller = AppController(tamanho_lote=8, limite_resultados=10, observar=False)
+    try:
+        controller.analisar(str(arvore))
+        _drenar_ate_concluir(controller)
+        resultados, publicados = controller.resultados()
+        assert publicados == len(resultados) == 10
+        assert controller.descartados == 33
+    finally:
+        controller.encerrar()
+
+
+@pytest.fixture
+def varredura_lenta(monkeypatch):
+    """Faz cada registro da varredura esperar a liberação do teste."""
+    liberar = threading.Event()
+    original = app_controler.Oxossi.varrer
+
+    def varrer(caminho, **opcoes):
+        for registro in original(caminho, **opcoes):
+            liberar.wait(5)
+            yield registro
+
+    monkeypatch.setattr(app_controler.Oxossi, "varrer", staticmethod(varrer))
+    yield liberar
+    liberar.set()
+
+
+def test_mesmo_caminho_agrupa_o_pedido(arvore, controller, varredura_lenta):
+    primeira = controller.analisar(str(arvore))
+    assert controller.analisar(str(arvore) + "/") == primeira
+    assert controller.analisar(str(arvore / "sub")) == primeira + 1
+
+
+def test_pedido_novo_descarta_lotes_antigos(arvore, controller, varredura_lenta):
+    controller.analisar(str(arvore))
+    geracao = controller.analisar(str(arvore / "sub"))
+    varredura_lenta.set()
+    lotes = _drenar_ate_concluir(controller)
+    assert {lote.geracao for lote in lotes} == {geracao}
+    assert [r["caminho"] for lote in lotes for r in lote.registros] == [
+        str(arvore / "sub"), str(arvore / "sub" / "fundo.txt")
+    ]
+
+
+def test_cancelar(arvore, controller, varredura_lenta):
+    geracao = controller.analisar(str(arvore))
+    controller.cancelar()
+    assert controller.geracao == geracao + 1
+    varredura_lenta.set()
+    time.sleep(0.1)
+    assert controller.drenar() == []
+
+
+def test_erro_na_varredura_chega_a_view(arvore, controller, monkeypatch):
+    def quebrar(_caminho, **_opcoes):
+        raise OSError("disco sumiu")
+        yield  # pylint: disable=unreachable
+
+    monkeypatch.setattr(app_controler.Oxossi, "varrer", staticmethod(quebrar))
+    controller.analisar(str(arvore))
+    (lote,) = _drenar_ate_concluir(controller)
+    assert lote.concluida
+    assert isinstance(lote.erro, OSError)
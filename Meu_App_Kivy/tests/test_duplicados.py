@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""Testes do Ibeji (busca de arquivos duplicados)."""
+
+import os
+
+import pytest
+
+from app.utils import app_duplicados
+from app.utils.app_duplicados import Ibeji
+
+
+@pytest.fixture
+def arvore(tmp_path):
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    (tmp_path / "a" / "foto.jpg").write_bytes(b"X" * 10000)
+    (tmp_path / "b" / "copia.jpg").write_bytes(b"X" * 10000)
+    # Mesmo tamanho e mesmas pontas, miolo diferente
+    (tmp_path / "b" / "quase.jpg").write_bytes(b"X" * 4500 + b"Y" + b"X" * 5499)
+    (tmp_path / "a" / "unico.txt").write_bytes(b"sem par")
+    (tmp_path / "a" / "vazio.txt").touch()
+    (tmp_path / "b" / "vazio.txt").touch()
+    return tmp_path
+
+
+def test_agrupa_copias_identicas(arvore):
+    relatorio = Ibeji.encontrar(str(arvore), amostra=1024)
+    assert len(relatorio.grupos) == 1
+    grupo = relatorio.grupos[0]
+    assert grupo.caminhos == (
+        str(arvore / "a" / "foto.jpg"), str(arvore / "b" / "copia.jpg")
+    )
+    assert grupo.tamanho == 10000
+    assert relatorio.desperdicio == grupo.desperdicio == 10000
+    assert relatorio.candidatos == 3
+    assert relatorio.resumos_completos == 3
+    assert relatorio.erros == ()
+
+
+def test_tamanhos_unicos_nunca_sao_abertos(arvore, monkeypatch):
+    abertos = []
+
+    def registrar(caminho, *args, **kwargs):
+        abertos.append(str(caminho))
+        return open(caminho, *args, **kwargs)
+
+    monkeypatch.setattr(app_duplicados, "open", registrar, raising=False)
+    Ibeji.encontrar(str(arvore))
+    assert str(arvore / "a" / "unico.txt") not in abertos
+    assert abertos
+
+
+def test_vazios_entram_com_tamanho_minimo_zero(arvore):
+    relatorio = Ibeji.encontrar(str(arvore), tamanho_minimo=0)
+    tamanhos = sorted(grupo.tamanho for grupo in relatorio.grupos)
+    assert tamanhos == [0, 10000]
+
+
+def test_links_fisicos_nao_sao_copias(tmp_path):
+    original = tmp_path / "original.bin"
+    original.write_bytes(b"conteudo" * 100)
+    os.link(original, tmp_path / "link.bin")
+    assert Ibeji.encontrar(str(tmp_path)).grupos == []
+
+
+def test_mesmo_inode_em_dispositivos_diferentes(tmp_path, monkeypatch):
+    # Raízes em sistemas de arquivos distintos podem repetir números de inode
+    for nome in ("disco1.bin", "disco2.bin", "disco2_copia.bin"):
+        (tmp_path / nome).write_bytes(b"igual" * 100)
+    registros = [
+        {"caminho": str(tmp_path / "disco1.bin"), "dispositivo": 1},
+        {"caminho": str(tmp_path / "disco2.bin"), "dispositivo": 2},
+        {"caminho": str(tmp_path / "disco2_copia.bin"), "dispositivo": 2, "inode": 8},
+    ]
+
+    def varrer(_raiz, **_opcoes):
+        for registro in registros:
+            yield {
+                "tipo": "arquivo", "legivel": True, "tamanho": 500, "mtime_ns": 1,
+                "inode": 7, **registro,
+            }
+
+    monkeypatch.setattr(app_duplicados.Oxossi, "varrer", staticmethod(varrer))
+    relatorio = Ibeji.encontrar(str(tmp_path))
+    assert relatorio.arquivos == 3
+    assert len(relatorio.grupos) == 1
+    assert len(relatorio.grupos[0].caminhos) == 3
+
+
+def test_cancelado_antes_das_leituras(arvore):
+    relatorio = Ibeji.encontrar(str(arvore), cancelado=lambda: True)
+    assert relatorio.grupos == []
+    assert relatorio.bytes_lidos == 0
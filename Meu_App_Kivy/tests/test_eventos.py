@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""Testes do canal de eventos estruturados."""
+
+import logging
+
+from app.utils.app_eventos import CanalEventos, ColetorMemoria, Evento, OuvinteLogging
+from app.utils.app_tools import Ogum
+
+
+def test_canal_sem_ouvintes_fica_inativo():
+    canal = CanalEventos()
+    assert canal.ativo is False
+    canal.emitir("caminho_valido", "/x")  # Não falha sem ouvintes
+
+
+def test_inscrever_e_cancelar():
+    canal = CanalEventos()
+    coletor = canal.inscrever(ColetorMemoria())
+    assert canal.ativo is True
+    canal.emitir("tipo_identificado", "/x", "arquivo")
+    canal.cancelar(coletor)
+    canal.emitir("caminho_valido", "/y")
+    assert canal.ativo is False
+    assert coletor.eventos == [Evento("tipo_identificado", "/x", ("arquivo",))]
+
+
+def test_coletor_respeita_o_limite():
+    coletor = ColetorMemoria(limite=2)
+    for indice in range(5):
+        coletor(Evento("caminho_valido", str(indice)))
+    assert [evento.caminho for evento in coletor.eventos] == ["3", "4"]
+    coletor.limpar()
+    assert coletor.eventos == []
+
+
+def test_validar_nao_imprime_e_emite_eventos(tmp_path, capsys):
+    coletor = ColetorMemoria()
+    Ogum.eventos.inscrever(coletor)
+    try:
+        Ogum.validar(str(tmp_path))
+        Ogum.validar(str(tmp_path / "nada"))
+    finally:
+        Ogum.eventos.cancelar(coletor)
+    assert capsys.readouterr().out == ""
+    assert [evento.codigo for evento in coletor.eventos] == [
+        "caminho_encontrado", "caminho_nao_encontrado"
+    ]
+
+
+def test_ouvinte_logging_so_formata_com_nivel_habilitado(monkeypatch, caplog):
+    renderizados = []
+    original = Evento.renderizar
+
+    def contar(evento):
+        renderizados.append(evento)
+        return original(evento)
+
+    monkeypatch.setattr(Evento, "renderizar", contar)
+    ouvinte = OuvinteLogging(logging.getLogger("teste.eventos"), nivel=logging.DEBUG)
+    with caplog.at_level(logging.INFO, logger="teste.eventos"):
+        ouvinte(Evento("caminho_valido", "/a"))
+    assert renderizados == []
+    with caplog.at_level(logging.DEBUG, logger="teste.eventos"):
+        ouvinte(Evento("caminho_valido", "/a"))
+    assert renderizados
+    assert "/a" in caplog.text
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""Testes do índice incremental da Nanã."""
+
+import os
+import shutil
+
+import pytest
+
+from app.utils.app_indice import Nana
+from app.utils.app_varredura import Oxossi
+
+
+def _adiantar(caminho):
+    """Garante mtime diferente mesmo em sistemas de arquivos com relógio grosseiro."""
+    estado = os.stat(caminho)
+    os.utime(caminho, ns=(estado.st_atime_ns, estado.st_mtime_ns + 10**9))
+
+
+@pytest.fixture
+def arvore(tmp_path):
+    raiz = tmp_path / "raiz"
+    for pasta in ("a", "b", "c"):
+        (raiz / pasta / "sub").mkdir(parents=True)
+        (raiz / pasta / "sub" / "dados.txt").write_text(pasta)
+        (raiz / pasta / "leia.MD").write_text("x")
+    (raiz / "vazia").mkdir()
+    (raiz / "vazio.txt").touch()
+    return raiz
+
+
+@pytest.fixture
+def indice():
+    with Nana() as nana:
+        yield nana
+
+
+def test_primeira_atualizacao_indexa_tudo(arvore, indice):
+    totais = indice.atualizar(str(arvore))
+    assert len(indice) == 15
+    assert totais["inseridos"] == 15
+    assert totais["diretorios_listados"] == 8
+    assert totais["diretorios_reaproveitados"] == 0
+
+
+def test_registros_iguais_aos_da_varredura(arvore, indice):
+    indice.atualizar(str(arvore))
+    for registro in Oxossi.varrer(str(arvore)):
+        indexado = indice.obter(registro["caminho"])
+        assert indexado is not None
+        for campo in ("valido", "legivel", "tipo", "vazio", "mensagem", "tamanho", "inode"):
+            assert indexado[campo] == registro[campo], (registro["caminho"], campo)
+
+
+def test_arvore_inalterada_nao_e_listada(arvore, indice):
+    indice.atualizar(str(arvore))
+    totais = indice.atualizar(str(arvore))
+    assert totais["diretorios_listados"] == 0
+    assert totais["diretorios_reaproveitados"] == 8
+    assert totais["stats"] == 1 + 7  # Raiz e subdiretórios conhecidos
+    assert totais["inseridos"] == totais["atualizados"] == totais["removidos"] == 0
+
+
+def test_somente_o_diretorio_alterado_e_listado(arvore, indice):
+    indice.atualizar(str(arvore))
+    (arvore / "b" / "sub" / "novo.txt").write_text("novo")
+    _adiantar(arvore / "b" / "sub")
+    totais = indice.atualizar(str(arvore))
+    assert totais["diretorios_listados"] == 1
+    assert totais["inseridos"] == 1
+    assert indice.obter(str(arvore / "b" / "sub" / "novo.txt"))["tamanho"] == 4
+
+
+def test_subarvore_removida_sai_do_indice(arvore, indice):
+    indice.atualizar(str(arvore))
+    shutil.rmtree(arvore / "c")
+    _adiantar(arvore)
+    totais = indice.atualizar(str(arvore))
+    assert totais["removidos"] == 4
+    assert indice.obter(str(arvore / "c" / "sub" / "dados.txt")) is None
+    assert len(indice) == 11
+
+
+def test_conteudo_alterado_exige_verificar_arquivos(arvore, indice):
+    indice.atualizar(str(arvore))
+    arquivo = arvore / "vazio.txt"
+    arquivo.write_text("agora tem")
+    _adiantar(arquivo)
+    assert indice.atualizar(str(arvore))["atualizados"] == 0
+    assert indice.obter(str(arquivo))["vazio"] is True
+    assert indice.atualizar(str(arvore), verificar_arquivos=True)["atualizados"] == 1
+    registro = indice.obter(str(arquivo))
+    assert registro["vazio"] is False
+    assert registro["mensagem"].codigo == "caminho_valido"
+
+
+def test_diretorio_trocado_por_arquivo(arvore, indice):
+    indice.atualizar(str(arvore))
+    shutil.rmtree(arvore / "a")
+    (arvore / "a").write_text("agora é arquivo")
+    _adiantar(arvore)
+    indice.atualizar(str(arvore))
+    assert indice.obter(str(arvore / "a"))["tipo"] == "arquivo"
+    assert list(indice.filhos(str(arvore / "a"))) == []
+    assert indice.obter(str(arvore / "a" / "sub")) is None
+
+
+def test_consultas(arvore, indice):
+    indice.atualizar(str(arvore))
+    assert [r["caminho"] for r in indice.diretorios_vazios()] == [str(arvore / "vazia")]
+    assert sorted(r["caminho"] for r in indice.por_extensao("md")) == [
+        str(arvore / pasta / "leia.MD") for pasta in ("a", "b", "c")
+    ]
+    assert list(indice.ilegiveis()) == []
+    assert indice.bytes_por_extensao() == {".txt": 3, ".md": 3}
+    assert len(list(indice.filhos(str(arvore)))) == 5
+
+
+def test_indice_persistente(arvore, tmp_path):
+    banco = str(tmp_path / "indice.db")
+    with Nana(banco) as nana:
+        nana.atualizar(str(arvore))
+    with Nana(banco) as nana:
+        assert nana.atualizar(str(arvore))["diretorios_listados"] == 0
+        assert len(nana) == 15
+
+
+def test_raiz_removida(arvore, indice):
+    indice.atualizar(str(arvore))
+    shutil.rmtree(arvore)
+    assert indice.atualizar(str(arvore))["removidos"] == 15
+    assert len(indice) == 0
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""Testes da inicialização sem dependências pesadas."""
+
+import importlib.util
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+RAIZ = Path(__file__).resolve().parents[1]
+
+
+def _modulos_carregados(codigo: str) -> set[str]:
+    saida = subprocess.run(
+        [sys.executable, "-c", f"{codigo}\nimport sys\nprint(' '.join(sys.modules))"],
+        cwd=RAIZ, capture_output=True, text=True, check=True,
+    ).stdout
+    return set(saida.split())
+
+
+@pytest.mark.parametrize(
+    "modulo", ["app.models.app_models", "app.utils.app_tools", "app.views.telas", "cli"]
+)
+def test_importar_nao_carrega_asyncio_nem_kivy(modulo):
+    carregados = _modulos_carregados(f"import {modulo}")
+    assert modulo in carregados
+    assert not {"asyncio", "kivy", "kivymd"} & carregados
+
+
+_ACESSAR_TELA = """
+import json, sys
+import app.views.telas as telas
+antes = sorted({"kivy", "app.views.telas.tela_principal"} & set(sys.modules))
+try:
+    modulo = telas.TelaPrincipal.__module__
+except ModuleNotFoundError as erro:
+    modulo = f"ausente: {erro.name}"
+print(json.dumps([antes, modulo, "kivy" in sys.modules]))
+"""
+
+
+def test_tela_principal_resolvida_so_no_acesso():
+    saida = subprocess.run(
+        [sys.executable, "-c", _ACESSAR_TELA],
+        cwd=RAIZ, capture_output=True, text=True, check=True,
+    ).stdout
+    antes, modulo, kivy_depois = json.loads(saida)
+    assert antes == []
+    if importlib.util.find_spec("kivy") is None:
+        # Sem Kivy, a falha só aparece quando a tela é pedida
+        assert modulo == "ausente: kivy"
+    else:
+        assert modulo == "app.views.telas.tela_principal"
+        assert kivy_depois
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""Testes dos instantâneos ordenados do Olokun e de sua comparação."""
+
+import json
+import os
+import random
+
+import pytest
+
+from app.mensagens.app_mensageiro import Mensagem
+from app.utils import app_instantaneo
+from app.utils.app_instantaneo import MAGICO, Olokun
+
+
+def _registro(caminho, tipo="arquivo", vazio=False, legivel=True, tamanho=1, mtime_ns=1):
+    codigo = "arquivo_vazio" if vazio else "caminho_valido"
+    return {
+        "caminho": caminho, "valido": True, "legivel": legivel, "tipo": tipo,
+        "vazio": vazio, "mensagem": Mensagem(codigo, caminho),
+        "tamanho": tamanho, "mtime_ns": mtime_ns,
+    }
+
+
+def _caminho(*partes):
+    return os.sep + os.sep.join(partes)
+
+
+def test_ordem_de_componentes(tmp_path):
+    caminhos = [_caminho("a.b"), _caminho("a", "b"), _caminho("a"), _caminho("a", "b", "c")]
+    arquivo = str(tmp_path / "inst")
+    assert Olokun.gravar([_registro(c) for c in caminhos], arquivo) == 4
+    assert [e["caminho"] for e in Olokun.ler(arquivo)] == [
+        _caminho("a"), _caminho("a", "b"), _caminho("a", "b", "c"), _caminho("a.b")
+    ]
+
+
+def test_ordenacao_externa_com_pouca_memoria(tmp_path):
+    caminhos = [_caminho("d", f"{indice:04}") for indice in range(500)]
+    embaralhados = caminhos + caminhos[:50]
+    random.Random(7).shuffle(embaralhados)
+    arquivo = str(tmp_path / "inst")
+    total = Olokun.gravar(
+        (_registro(c) for c in embaralhados), arquivo, memoria=37, pasta_temporaria=str(tmp_path)
+    )
+    assert total == 500
+    assert [e["caminho"] for e in Olokun.ler(arquivo)] == caminhos
+    assert sorted(os.listdir(tmp_path)) == ["inst"]
+
+
+def test_entradas_preservam_os_campos(tmp_path):
+    arquivo = str(tmp_path / "inst")
+    original = _registro(_caminho("x"), vazio=True, legivel=False, tamanho=2**40, mtime_ns=-5)
+    Olokun.gravar([original], arquivo)
+    (lido,) = Olokun.ler(arquivo)
+    assert lido == original
+
+
+def test_comparar(tmp_path):
+    antigo, novo = str(tmp_path / "antigo"), str(tmp_path / "novo")
+    Olokun.gravar([
+        _registro(_caminho("igual")),
+        _registro(_caminho("sumiu")),
+        _registro(_caminho("esvaziou"), tamanho=10),
+        _registro(_caminho("trancou")),
+        _registro(_caminho("tocado"), mtime_ns=1),
+    ], antigo)
+    Olokun.gravar([
+        _registro(_caminho("igual")),
+        _registro(_caminho("esvaziou"), vazio=True, tamanho=0),
+        _registro(_caminho("trancou"), legivel=False),
+        _registro(_caminho("tocado"), mtime_ns=2),
+        _registro(_caminho("novo")),
+    ], novo)
+    diferencas = {d.caminho: d for d in Olokun.comparar(antigo, novo)}
+    assert {caminho: d.situacao for caminho, d in diferencas.items()} == {
+        _caminho("sumiu"): "removido",
+        _caminho("esvaziou"): "alterado",
+        _caminho("trancou"): "alterado",
+        _caminho("tocado"): "alterado",
+        _caminho("novo"): "adicionado",
+    }
+    esvaziou = diferencas[_caminho("esvaziou")]
+    assert esvaziou.campos == ("vazio", "tamanho")
+    assert esvaziou.ficou_vazio and not esvaziou.perdeu_leitura
+    assert diferencas[_caminho("trancou")].perdeu_leitura
+    assert diferencas[_caminho("sumiu")].depois is None
+    assert diferencas[_caminho("novo")].antes is None
+
+    assert [d.caminho for d in Olokun.comparar(antigo, novo, campos=["mensagem"])] == [
+        _caminho("esvaziou"), _caminho("novo"), _caminho("sumiu")
+    ]
+    with pytest.raises(ValueError):
+        list(Olokun.comparar(antigo, novo, campos=["cor"]))
+
+
+def test_capturar_e_comparar_arvore(tmp_path):
+    raiz = tmp_path / "raiz"
+    (raiz / "sub").mkdir(parents=True)
+    (raiz / "sub" / "a.txt").write_text("conteúdo")
+    (raiz / "b.txt").write_text("x")
+    antes, depois = str(tmp_path / "antes"), str(tmp_path / "depois")
+    assert Olokun.capturar(str(raiz), antes) == 4
+    (raiz / "sub" / "a.txt").write_text("")
+    (raiz / "b.txt").unlink()
+    Olokun.capturar(str(raiz), depois)
+    diferencas = {d.caminho: d for d in Olokun.comparar(antes, depois)}
+    assert diferencas[str(raiz / "b.txt")].situacao == "removido"
+    assert diferencas[str(raiz / "sub" / "a.txt")].ficou_vazio
+
+
+def test_rejeita_arquivo_estranho(tmp_path):
+    arquivo = tmp_path / "outro"
+    arquivo.write_bytes(b"qualquer coisa")
+    with pytest.raises(ValueError, match="não é um instantâneo"):
+        list(Olokun.ler(str(arquivo)))
+
+
+def test_rejeita_arquivo_truncado(tmp_path):
+    arquivo = tmp_path / "inst"
+    Olokun.gravar([_registro(_caminho("a")), _registro(_caminho("b"))], str(arquivo))
+    arquivo.write_bytes(arquivo.read_bytes()[:-1])
+    with pytest.raises(ValueError, match="truncado"):
+        list(Olokun.ler(str(arquivo)))
+
+
+def _gravar_bruto(arquivo, tabela, linhas):
+    cabecalho = json.dumps(tabela).encode()
+    with open(arquivo, "wb") as destino:
+        destino.write(MAGICO + app_instantaneo._VERSAO.pack(1, len(cabecalho)) + cabecalho)
+        app_instantaneo._escrever_linhas(destino, linhas)
+
+
+def test_rejeita_arquivo_fora_de_ordem(tmp_path):
+    arquivo = str(tmp_path / "inst")
+    _gravar_bruto(arquivo, ["caminho_valido"], [(b"\0b", 1, 1, 0, 0, 0), (b"\0a", 1, 1, 0, 0, 0)])
+    with pytest.raises(ValueError, match="fora de ordem"):
+        list(Olokun.ler(arquivo))
+
+
+@pytest.mark.parametrize("corte", [len(MAGICO) + 3, len(MAGICO) + 8])
+def test_rejeita_cabecalho_truncado(tmp_path, corte):
+    arquivo = tmp_path / "inst"
+    Olokun.gravar([_registro(_caminho("a"))], str(arquivo))
+    arquivo.write_bytes(arquivo.read_bytes()[:corte])  # No meio da versão / da tabela
+    with pytest.raises(ValueError, match="truncado"):
+        list(Olokun.ler(str(arquivo)))
+
+
+def test_rejeita_codigo_fora_da_tabela(tmp_path):
+    arquivo = str(tmp_path / "inst")
+    _gravar_bruto(arquivo, ["caminho_valido"], [(b"\0a", 1, 1, 0, 0, 0), (b"\0b", 1, 1, 1, 0, 0)])
+    with pytest.raises(ValueError, match="código fora da tabela"):
+        list(Olokun.ler(arquivo))
+
+
+def test_tabela_de_codigos_do_cabecalho(tmp_path):
+    arquivo = str(tmp_path / "inst")
+    tabela = ["codigo_de_uma_versao_futura", "arquivo_vazio"]
+    _gravar_bruto(arquivo, tabela, [(b"\0a", 1, 1, 1, 0, 0), (b"\0b", 1, 1, 0, 0, 0)])
+    codigos = [e["mensagem"].codigo for e in Olokun.ler(arquivo)]
+    assert codigos == ["arquivo_vazio", "caminho_invalido"]
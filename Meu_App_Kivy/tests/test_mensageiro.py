@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""Testes das mensagens adiadas do Exu."""
+
+import pickle
+
+import pytest
+
+from app.mensagens.app_mensageiro import Exu, Mensagem
+
+
+def test_adiar_nao_formata_ate_str(monkeypatch):
+    chamadas = []
+
+    def contar(caminho):
+        chamadas.append(caminho)
+        return f"ok {caminho}"
+
+    monkeypatch.setattr(Exu, "caminho_valido", staticmethod(contar))
+    mensagem = Exu.adiar("caminho_valido", "/a")
+    assert chamadas == []
+    assert str(mensagem) == "ok /a"
+    assert chamadas == ["/a"]
+
+
+def test_texto_igual_ao_metodo_do_exu():
+    mensagem = Exu.adiar("tipo_identificado", "/a", "arquivo")
+    assert str(mensagem) == Exu.tipo_identificado("/a", "arquivo")
+
+
+@pytest.mark.parametrize("codigo", sorted(Exu.CODIGOS))
+def test_todos_os_codigos_renderizam(codigo):
+    dados = ("arquivo",) if codigo == "tipo_identificado" else ()
+    assert "'/x'" in str(Exu.adiar(codigo, "/x", *dados))
+
+
+def test_codigo_desconhecido():
+    with pytest.raises(ValueError):
+        Exu.adiar("nao_existe", "/x")
+
+
+def test_igualdade_hash_e_tupla():
+    mensagem = Mensagem("tipo_identificado", "/a", "arquivo")
+    assert mensagem == Exu.adiar("tipo_identificado", "/a", "arquivo")
+    assert mensagem != Mensagem("tipo_identificado", "/b", "arquivo")
+    assert len({mensagem, Mensagem("tipo_identificado", "/a", "arquivo")}) == 1
+    assert mensagem.para_tupla() == ("tipo_identificado", "/a", "arquivo")
+    assert Mensagem(*mensagem.para_tupla()) == mensagem
+    assert repr(mensagem) == "Mensagem('tipo_identificado', '/a', 'arquivo')"
+
+
+def test_mensagem_serializavel():
+    mensagem = Exu.adiar("arquivo_vazio", "/a")
+    assert pickle.loads(pickle.dumps(mensagem)) == mensagem
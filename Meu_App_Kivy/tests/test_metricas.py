@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""Testes da instrumentação Oxum e de sua ligação com o Ogum."""
+
+import json
+import urllib.request
+
+import pytest
+
+from app.utils.app_cache import CacheValidacao
+from app.utils.app_metricas import Oxum
+from app.utils.app_tools import Ogum
+
+
+@pytest.fixture
+def metricas():
+    Ogum.metricas.zerar()
+    Ogum.metricas.ligar()
+    yield Ogum.metricas
+    Ogum.metricas.desligar()
+    Ogum.metricas.zerar()
+
+
+def test_desligada_nao_registra(tmp_path):
+    Ogum.metricas.zerar()
+    Ogum.validar(str(tmp_path))
+    assert Ogum.metricas.instantaneo() == {}
+
+
+def test_etapas_da_validacao(tmp_path, metricas):
+    (tmp_path / "a.txt").write_text("x")
+    Ogum.validar(str(tmp_path / "a.txt"))
+    Ogum.validar(str(tmp_path / "nada"))
+    etapas = metricas.instantaneo()
+    assert {"stat", "legivel", "tipo", "vazio", "mensagem", "validar"} <= set(etapas)
+    assert etapas["validar"]["contadores"]["chamadas"] == 2
+    assert etapas["stat"]["contadores"] == {"chamadas": 2, "erros": 0, "syscalls": 2}
+    assert etapas["legivel"]["contadores"]["chamadas"] == 1
+    assert etapas["validar"]["segundos"]["contagem"] == 2
+    assert etapas["validar"]["segundos"]["baldes"]["+Inf"] == 2
+
+
+def test_contadores_do_cache(tmp_path, metricas):
+    cache = CacheValidacao(nome="teste")
+    cache.validar(str(tmp_path))
+    cache.validar(str(tmp_path))
+    contadores = metricas.instantaneo()["cache.teste"]["contadores"]
+    assert (contadores["acertos"], contadores["falhas"]) == (1, 1)
+
+
+def test_histograma_acumulado():
+    oxum = Oxum(limites=(1e-6, 1e-3))
+    oxum.registrar("etapa", 500)
+    oxum.registrar("etapa", 2_000)
+    oxum.registrar("etapa", 5_000_000, erro=True)
+    medida = oxum.instantaneo()["etapa"]
+    assert medida["segundos"]["baldes"] == {"1e-06": 1, "0.001": 2, "+Inf": 3}
+    assert medida["segundos"]["soma"] == pytest.approx(0.0050025)
+    assert medida["contadores"]["erros"] == 1
+
+
+def test_medir_conta_excecoes():
+    oxum = Oxum()
+    with oxum.medir("ignorada"):
+        pass
+    oxum.ligar()
+    with pytest.raises(KeyError):
+        with oxum.medir("falha"):
+            raise KeyError("x")
+    assert list(oxum.instantaneo()) == ["falha"]
+    assert oxum.instantaneo()["falha"]["contadores"]["erros"] == 1
+
+
+def test_prometheus(tmp_path):
+    oxum = Oxum(limites=(1e-3,), prefixo="teste")
+    oxum.registrar('stat "x"', 10)
+    oxum.contar("cache", "acertos", 3)
+    texto = oxum.prometheus()
+    assert 'teste_etapa_acertos_total{etapa="cache"} 3' in texto
+    assert 'teste_etapa_segundos_bucket{etapa="stat \\"x\\"",le="+Inf"} 1' in texto
+    assert 'teste_etapa_segundos_count{etapa="cache"}' not in texto
+    arquivo = tmp_path / "metricas.prom"
+    oxum.gravar_prometheus(str(arquivo))
+    assert arquivo.read_text(encoding="utf-8") == texto
+
+
+def test_servir():
+    oxum = Oxum()
+    oxum.registrar("stat", 100)
+    servidor = oxum.servir()
+    try:
+        endereco = f"http://127.0.0.1:{servidor.server_address[1]}"
+        with urllib.request.urlopen(f"{endereco}/metrics.json", timeout=5) as resposta:
+            assert json.load(resposta)["stat"]["contadores"]["chamadas"] == 1
+        with urllib.request.urlopen(f"{endereco}/metrics", timeout=5) as resposta:
+            assert b"apontador_etapa_chamadas_total" in resposta.read()
+    finally:
+        servidor.shutdown()
+        servidor.server_close()
+
+
+def test_capturar(tmp_path):
+    with Oxum().capturar(memoria=True, arquivo_perfil=str(tmp_path / "perfil")) as captura:
+        Ogum.validar(str(tmp_path))
+    assert "validar" in captura.perfil
+    assert captura.pico_memoria > 0
+    assert (tmp_path / "perfil").exists()
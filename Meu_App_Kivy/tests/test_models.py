@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""Testes do CaminhoSOModel (campos preguiçosos e mensagem do Ogum)."""
+
+import pytest
+
+from app.models.app_models import CaminhoSOModel
+
+
+@pytest.fixture
+def arvore(tmp_path):
+    (tmp_path / "cheio.txt").write_text("conteúdo")
+    (tmp_path / "vazio.txt").touch()
+    (tmp_path / "pasta").mkdir()
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    ("nome", "valido", "codigo"),
+    [
+        ("cheio.txt", True, "caminho_valido"),
+        ("vazio.txt", True, "arquivo_vazio"),
+        ("pasta", True, "diretorio_vazio"),
+        ("inexistente.txt", False, "caminho_nao_encontrado"),
+    ],
+)
+def test_mensagem_vem_do_resultado_da_validacao(arvore, nome, valido, codigo):
+    modelo = CaminhoSOModel(str(arvore / nome))
+    assert modelo.valido is valido
+    assert modelo.mensagem.codigo == codigo
+
+
+def test_caminho_vazio_e_invalido():
+    modelo = CaminhoSOModel("")
+    assert modelo.valido is False
+    assert modelo.mensagem.codigo == "caminho_invalido"
+
+
+def test_campos_sao_memorizados_ate_atualizar(arvore):
+    arquivo = arvore / "novo.txt"
+    modelo = CaminhoSOModel(str(arquivo))
+    assert modelo.mensagem.codigo == "caminho_nao_encontrado"
+
+    arquivo.write_text("x")
+    assert modelo.mensagem.codigo == "caminho_nao_encontrado"
+
+    modelo.atualizar()
+    assert modelo.valido is True
+    assert modelo.mensagem.codigo == "caminho_valido"
+
+
+def test_to_dict_sem_disco_para_campos_textuais(arvore):
+    caminho = str(arvore / "cheio.txt")
+    dados = CaminhoSOModel(caminho).to_dict()
+    assert dados["caminho_original"] == caminho
+    assert dados["caminho_normalizado"] == caminho
+    assert dados["sistema"] == "posix"
+    assert dados["extensao"] == ".txt"
+    assert dados["diretorio_pai"] == str(arvore)
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""Testes da normalização de caminhos do Oxalá."""
+
+import os
+import unicodedata
+
+import pytest
+
+from app.models.app_models import CaminhoSOModel
+from app.utils.app_normalizador import Oxala
+
+
+@pytest.fixture
+def pasta_pessoal(monkeypatch):
+    Oxala._normalizar.cache_clear()
+    Oxala.chave.cache_clear()
+    monkeypatch.setattr(Oxala, "pasta_pessoal", "/home/ana")
+    yield "/home/ana"
+    Oxala._normalizar.cache_clear()
+    Oxala.chave.cache_clear()
+
+
+@pytest.mark.parametrize(
+    ("caminho", "esperado"),
+    [
+        ("/usr//local/./bin/", "/usr/local/bin"),
+        ("/a/b/../../..", "/"),
+        ("/a/b/../c", "/a/c"),
+        ("a/../../b", "../b"),
+        ("./", "."),
+        ("c:\\Dados\\\\Fotos.\\ ano \\..\\x.txt", "C:\\Dados\\Fotos\\x.txt"),
+        ("c:/Dados/pasta. /x", "C:\\Dados\\pasta\\x"),
+        ("C:\\..\\Windows", "C:\\Windows"),
+        ("c:rel\\..\\..\\x", "C:..\\x"),
+        ("\\\\srv\\share\\a\\.\\b", "\\\\srv\\share\\a\\b"),
+        ("\\\\?\\C:\\a\\..\\b. ", "\\\\?\\C:\\a\\..\\b. "),
+        ("\\\\.\\COM1", "\\\\.\\COM1"),
+        ("file:///tmp/a%20b/./c", "/tmp/a b/c"),
+        ("file:///C:/x/y", "C:\\x\\y"),
+        ("", ""),
+    ],
+)
+def test_normalizar(caminho, esperado):
+    assert Oxala.normalizar(caminho) == esperado
+
+
+def test_forma_canonica_devolve_o_mesmo_objeto():
+    caminho = "".join(["/usr/", "share"])
+    assert Oxala.normalizar(caminho) is caminho
+
+
+@pytest.mark.parametrize(
+    "caminho", ["/a//b/", "/a/./b", "/x/y/../z", "a/b/../../..", "/", "//", "/..", "rel"]
+)
+def test_posix_igual_ao_normpath(caminho):
+    esperado = os.path.normpath(caminho)
+    if esperado.startswith("//"):
+        esperado = esperado[1:]  # O normpath preserva '//' inicial (POSIX)
+    assert Oxala.normalizar(caminho) == esperado
+
+
+def test_home_expandido(pasta_pessoal):
+    assert Oxala.normalizar("~/docs/../fotos") == "/home/ana/fotos"
+    assert Oxala.normalizar("~outro/docs") == "~outro/docs"
+
+
+def test_mac_em_nfc():
+    decomposto = unicodedata.normalize("NFD", "/Users/joão/Ação.txt")
+    normalizado = Oxala.normalizar(decomposto)
+    assert normalizado == unicodedata.normalize("NFC", decomposto)
+    assert Oxala.normalizar("/home/joão") == "/home/joão"
+
+
+def test_chave_ignora_caixa_so_onde_o_sistema_ignora():
+    assert Oxala.chave("C:\\Dados\\A.TXT") == Oxala.chave("c:/dados/a.txt")
+    assert Oxala.chave("/Users/Ana/X") == Oxala.chave("/Users/ana/x")
+    assert Oxala.chave("/home/Ana") != Oxala.chave("/home/ana")
+
+
+def test_normalizar_lote_e_deduplicar():
+    caminhos = ["C:\\A\\", "c:/a", "/etc//hosts", "/etc/hosts", "C:\\A\\"]
+    assert Oxala.normalizar_lote(caminhos, memoria=1) == [
+        "C:\\A", "C:\\a", "/etc/hosts", "/etc/hosts", "C:\\A"
+    ]
+    assert Oxala.normalizar_lote(caminhos, chaves=True)[:2] == ["c:\\a", "c:\\a"]
+    assert Oxala.deduplicar(caminhos) == ["C:\\A\\", "/etc//hosts"]
+
+
+def test_modelo_usa_a_forma_canonica():
+    assert CaminhoSOModel("c:/Dados/./x. ").caminho_normalizado == "C:\\Dados\\x"
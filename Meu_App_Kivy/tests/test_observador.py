@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""Testes do Oxumare (observação de caminhos) e de sua ligação com o controller."""
+
+import queue
+import time
+
+import pytest
+
+from app.controller.app_controler import AppController
+from app.models.app_models import CaminhoSOModel
+from app.utils.app_observador import Oxumare, _carregar_inotify
+
+BACKENDS = ["sondagem"] + (["inotify"] if _carregar_inotify() is not None else [])
+
+
+def _esperar(fila, prazo=5.0):
+    return fila.get(timeout=prazo)
+
+
+@pytest.fixture(params=BACKENDS)
+def observador(request):
+    alteracoes = queue.Queue()
+    oxumare = Oxumare(
+        ao_mudar=lambda caminho, resultado: alteracoes.put((caminho, resultado)),
+        intervalo=0.05,
+        backend=request.param,
+    )
+    oxumare.alteracoes = alteracoes
+    with oxumare:
+        yield oxumare
+
+
+def test_arquivo_que_ganha_conteudo(observador, tmp_path):
+    arquivo = tmp_path / "relatorio.txt"
+    arquivo.touch()
+    assert observador.observar(str(arquivo))["vazio"] is True
+
+    arquivo.write_text("conteúdo")
+    caminho, resultado = _esperar(observador.alteracoes)
+    assert caminho == str(arquivo)
+    assert resultado["vazio"] is False
+    assert observador.cache.validar(str(arquivo))["vazio"] is False
+
+
+def test_diretorio_que_deixa_de_estar_vazio(observador, tmp_path):
+    pasta = tmp_path / "pasta"
+    pasta.mkdir()
+    assert observador.observar(str(pasta))["vazio"] is True
+
+    (pasta / "novo.txt").touch()
+    caminho, resultado = _esperar(observador.alteracoes)
+    assert caminho == str(pasta)
+    assert resultado["vazio"] is False
+
+
+def test_remocao_e_deixar(observador, tmp_path):
+    arquivo = tmp_path / "temporario.txt"
+    arquivo.write_text("x")
+    observador.observar(str(arquivo))
+    arquivo.unlink()
+    _, resultado = _esperar(observador.alteracoes)
+    assert resultado["valido"] is False
+
+    observador.deixar(str(arquivo))
+    assert str(arquivo) not in observador.observados
+
+
+def test_falha_no_callback_nao_para_o_observador(tmp_path, caplog):
+    chamadas = queue.Queue()
+
+    def ao_mudar(caminho, resultado):
+        chamadas.put(caminho)
+        raise RuntimeError("falha do ouvinte")
+
+    arquivo = tmp_path / "a.txt"
+    arquivo.touch()
+    with Oxumare(ao_mudar=ao_mudar, intervalo=0.05, backend="sondagem") as oxumare:
+        oxumare.observar(str(arquivo))
+        arquivo.write_text("1")
+        _esperar(chamadas)
+        time.sleep(0.01)  # mtime em resolução grosseira
+        arquivo.write_text("22")
+        assert _esperar(chamadas) == str(arquivo)
+    assert "falha do ouvinte" in caplog.text
+
+
+def test_controller_observa_o_caminho_do_pedido_atual(tmp_path):
+    alteracoes = queue.Queue()
+    controller = AppController()
+    controller.ao_mudar = lambda caminho, resultado: alteracoes.put((caminho, resultado))
+    pasta = tmp_path / "pasta"
+    pasta.mkdir()
+    try:
+        controller.analisar(str(pasta))
+        assert controller.observado == str(pasta)
+        (pasta / "item.txt").touch()
+        caminho, resultado = _esperar(alteracoes)
+        assert caminho == str(pasta)
+        assert resultado["vazio"] is False
+
+        controller.cancelar()
+        assert controller.observado is None
+    finally:
+        controller.encerrar()
+
+
+def test_controller_atualiza_o_cache_da_model(tmp_path):
+    alteracoes = queue.Queue()
+    arquivo = tmp_path / "relatorio.txt"
+    arquivo.touch()
+    assert CaminhoSOModel(str(arquivo)).mensagem.codigo == "arquivo_vazio"
+    controller = AppController()
+    controller.ao_mudar = lambda caminho, resultado: alteracoes.put(caminho)
+    try:
+        controller.analisar(str(arquivo))
+        arquivo.write_text("agora tem conteúdo")
+        assert _esperar(alteracoes) == str(arquivo)
+        assert CaminhoSOModel(str(arquivo)).mensagem.codigo == "caminho_valido"
+    finally:
+        controller.encerrar()
+
+
+def test_controller_sem_observacao(tmp_path):
+    controller = AppController(observar=False)
+    try:
+        controller.analisar(str(tmp_path))
+        assert controller.observado is None
+    finally:
+        controller.encerrar()
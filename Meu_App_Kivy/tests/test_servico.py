@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""Testes do serviço de validação (Xango) e de seu cliente (Iansa)."""
+
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from app.servico.app_protocolo import (
+    ERRO, INVALIDAR, LOTE, VALIDAR, ErroServico, codificar_caminho, quadro, separar
+)
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX") or sys.platform == "win32",
+    reason="o serviço usa sockets de domínio Unix",
+)
+
+
+@pytest.fixture
+def endereco(tmp_path):
+    # Caminhos de socket são limitados (~100 bytes); tmp_path pode ser longo
+    pasta = os.path.join("/tmp", f"apontador-teste-{os.getpid()}")
+    os.makedirs(pasta, exist_ok=True)
+    caminho = os.path.join(pasta, f"{tmp_path.name}.sock")
+    yield caminho
+    if os.path.exists(caminho):
+        os.unlink(caminho)
+
+
+@pytest.fixture
+def servico(endereco):
+    from app.servico.app_servidor import Xango
+
+    with Xango(endereco, ttl=None) as xango:
+        yield xango
+
+
+@pytest.fixture
+def cliente(servico):
+    from app.servico.app_cliente import Iansa
+
+    with Iansa(servico.endereco, timeout=5) as iansa:
+        yield iansa
+
+
+@pytest.fixture
+def arvore(tmp_path):
+    (tmp_path / "cheio.txt").write_text("x")
+    (tmp_path / "vazio.txt").touch()
+    (tmp_path / "pasta").mkdir()
+    return tmp_path
+
+
+def test_separar_mantem_quadro_incompleto():
+    dados = bytearray(quadro(LOTE, 7, b"abc") + quadro(LOTE, 8, b"defgh")[:6])
+    assert separar(dados) == [(LOTE, 7, b"abc")]
+    assert len(dados) == 6
+
+
+def test_validar_ida_e_volta(cliente, arvore):
+    resultado = cliente.validar(str(arvore / "vazio.txt"))
+    assert resultado["caminho"] == str(arvore / "vazio.txt")
+    assert resultado["valido"] and resultado["vazio"]
+    assert resultado["tipo"] == "arquivo"
+    assert resultado["mensagem"].codigo == "arquivo_vazio"
+    assert cliente.validar(str(arvore / "nada"))["mensagem"].codigo == "caminho_nao_encontrado"
+
+
+def test_validar_lote_preserva_a_ordem(cliente, arvore):
+    nomes = ["cheio.txt", "vazio.txt", "pasta", "nada"] * 300
+    caminhos = [str(arvore / nome) for nome in nomes]
+    resultados = cliente.validar_lote(caminhos, tamanho_lote=7, janela=3)
+    assert [r["caminho"] for r in resultados] == caminhos
+    assert [r["valido"] for r in resultados[:4]] == [True, True, True, False]
+    assert resultados[2]["mensagem"].codigo == "diretorio_vazio"
+
+
+def test_metadados_invalidar_e_estatisticas(cliente, arvore):
+    caminho = str(arvore / "cheio.txt")
+    assert cliente.metadados(caminho) == {
+        "nome": "cheio", "extensao": ".txt", "diretorio_pai": str(arvore)
+    }
+    cliente.validar(caminho)
+    assert cliente.invalidar(caminho) is True
+    assert cliente.invalidar(caminho) is False
+    assert cliente.estatisticas()["falhas"] >= 1
+
+
+def test_lote_recusado_nao_dessincroniza_a_conexao(cliente, arvore):
+    caminhos = [str(arvore / "cheio.txt")] * 600 + ["/" + "a" * 70000]
+    with pytest.raises(ErroServico):
+        cliente.validar_lote(caminhos, tamanho_lote=100)
+    assert cliente.validar(str(arvore / "cheio.txt"))["valido"] is True
+
+
+def test_respostas_abandonadas_sao_descartadas(cliente, arvore):
+    # Pedidos enviados sem leitor (como após um erro no meio de um lote)
+    cliente._enviar(LOTE, b"corpo truncado")  # pylint: disable=protected-access
+    cliente._enviar(LOTE, b"")  # pylint: disable=protected-access
+    assert cliente.validar(str(arvore / "pasta"))["tipo"] == "diretorio"
+    assert cliente.ping()[0] == 1
+
+
+def test_socket_orfao_e_substituido(endereco):
+    from app.servico.app_cliente import Iansa
+    from app.servico.app_servidor import Xango
+
+    orfao = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    orfao.bind(endereco)
+    orfao.close()
+    with Xango(endereco), Iansa(endereco, timeout=5) as iansa:
+        assert iansa.ping()[0] == 1
+
+
+def test_servico_ativo_nao_e_substituido(servico):
+    from app.servico.app_servidor import Xango
+
+    with pytest.raises(OSError):
+        Xango(servico.endereco).iniciar()
+
+
+def test_servico_recusa_caminhos_relativos(servico):
+    for operacao in (VALIDAR, INVALIDAR):
+        resposta = servico.atender(operacao, 1, codificar_caminho("relativo.txt"))
+        assert separar(bytearray(resposta))[0][0] == ERRO
+    assert len(servico.cache) == 0
+
+
+def test_cliente_e_servico_em_diretorios_diferentes(endereco, tmp_path, monkeypatch):
+    from app.servico.app_cliente import Iansa
+
+    (tmp_path / "servico").mkdir()
+    (tmp_path / "servico" / "so_no_servico.txt").write_text("x")
+    (tmp_path / "cliente").mkdir()
+    (tmp_path / "cliente" / "so_no_cliente.txt").touch()
+    raiz = str(Path(__file__).resolve().parents[1])
+    ambiente = {**os.environ, "PYTHONPATH": raiz}
+    processo = subprocess.Popen(
+        [sys.executable, "-m", "app.servico", "--socket", endereco],
+        cwd=tmp_path / "servico", env=ambiente, stderr=subprocess.DEVNULL,
+    )
+    try:
+        limite = time.monotonic() + 10
+        while not os.path.exists(endereco):
+            assert time.monotonic() < limite and processo.poll() is None
+            time.sleep(0.02)
+        monkeypatch.chdir(tmp_path / "cliente")
+        with Iansa(endereco, timeout=5) as iansa:
+            resultado = iansa.validar("so_no_cliente.txt")
+            assert resultado["caminho"] == str(tmp_path / "cliente" / "so_no_cliente.txt")
+            assert resultado["mensagem"].codigo == "arquivo_vazio"
+            assert iansa.validar("so_no_servico.txt")["valido"] is False
+            (lote,) = iansa.validar_lote(["./so_no_cliente.txt"])
+            assert lote["vazio"] is True
+            assert iansa.invalidar("so_no_cliente.txt") is True
+    finally:
+        processo.terminate()
+        processo.wait(10)
@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""Testes da validação de caminhos do Ogum."""
+
+import asyncio
+import os
+import stat
+import threading
+
+import pytest
+
+from app.utils.app_tools import Ogum
+
+
+@pytest.fixture
+def arvore(tmp_path):
+    (tmp_path / "cheio.txt").write_text("conteúdo")
+    (tmp_path / "vazio.txt").touch()
+    (tmp_path / "pasta_vazia").mkdir()
+    (tmp_path / "pasta").mkdir()
+    (tmp_path / "pasta" / "item").touch()
+    return tmp_path
+
+
+def _stat(modo, uid=1000, gid=1000, tamanho=0):
+    return os.stat_result((modo, 1, 1, 1, uid, gid, tamanho, 0, 0, 0))
+
+
+@pytest.mark.parametrize(
+    ("nome", "tipo", "vazio", "codigo"),
+    [
+        ("cheio.txt", "arquivo", False, "caminho_valido"),
+        ("vazio.txt", "arquivo", True, "arquivo_vazio"),
+        ("pasta_vazia", "diretorio", True, "diretorio_vazio"),
+        ("pasta", "diretorio", False, "caminho_valido"),
+    ],
+)
+def test_validar_caminhos_existentes(arvore, nome, tipo, vazio, codigo):
+    resultado = Ogum.validar(str(arvore / nome))
+    assert resultado["caminho"] == str(arvore / nome)
+    assert resultado["valido"] is True
+    assert resultado["legivel"] is True
+    assert resultado["tipo"] == tipo
+    assert resultado["vazio"] is vazio
+    assert resultado["mensagem"].codigo == codigo
+
+
+@pytest.mark.parametrize("caminho", ["", "   "])
+def test_validar_caminho_em_branco(caminho):
+    resultado, estado = Ogum.validar_com_stat(caminho)
+    assert estado is None
+    assert resultado["valido"] is False
+    assert resultado["mensagem"].codigo == "caminho_invalido"
+
+
+def test_validar_caminho_inexistente(arvore):
+    resultado, estado = Ogum.validar_com_stat(str(arvore / "nada"))
+    assert estado is None
+    assert resultado["valido"] is False
+    assert resultado["mensagem"].codigo == "caminho_nao_encontrado"
+
+
+def test_tipo_nao_suportado():
+    if not os.path.exists("/dev/null"):
+        pytest.skip("sem /dev/null")
+    resultado = Ogum.validar("/dev/null")
+    assert resultado["valido"] and resultado["tipo"] == "desconhecido"
+    assert resultado["mensagem"].codigo == "tipo_nao_suportado"
+
+
+def test_validar_com_stat_devolve_o_stat_usado(arvore):
+    caminho = arvore / "cheio.txt"
+    _, estado = Ogum.validar_com_stat(str(caminho))
+    assert estado is not None
+    assert estado.st_ino == caminho.stat().st_ino
+
+
+def test_um_unico_stat_por_caminho(arvore, monkeypatch):
+    chamadas = []
+    original = os.stat
+
+    def contar(caminho, *args, **kwargs):
+        chamadas.append(caminho)
+        return original(caminho, *args, **kwargs)
+
+    monkeypatch.setattr(os, "stat", contar)
+    Ogum.validar(str(arvore / "cheio.txt"))
+    Ogum.validar(str(arvore / "pasta"))
+    assert len(chamadas) == 2
+
+
+def test_legivel_por_stat_segue_dono_grupo_e_outros(monkeypatch):
+    monkeypatch.setattr(Ogum, "_IDENTIDADE", (1000, frozenset({1000, 27})))
+    arquivo = stat.S_IFREG
+    assert Ogum.legivel_por_stat(_stat(arquivo | 0o400)) is True
+    assert Ogum.legivel_por_stat(_stat(arquivo | 0o044)) is False  # Dono sem leitura
+    assert Ogum.legivel_por_stat(_stat(arquivo | 0o040, uid=1, gid=27)) is True
+    assert Ogum.legivel_por_stat(_stat(arquivo | 0o004, uid=1, gid=27)) is False
+    assert Ogum.legivel_por_stat(_stat(arquivo | 0o004, uid=1, gid=2)) is True
+    monkeypatch.setattr(Ogum, "_IDENTIDADE", (0, frozenset({0})))
+    assert Ogum.legivel_por_stat(_stat(arquivo, uid=1, gid=2)) is True
+
+
+def test_tipo_por_stat():
+    assert Ogum.tipo_por_stat(_stat(stat.S_IFREG)) == "arquivo"
+    assert Ogum.tipo_por_stat(_stat(stat.S_IFDIR)) == "diretorio"
+    assert Ogum.tipo_por_stat(_stat(stat.S_IFIFO)) == "desconhecido"
+
+
+def test_obter_metadados_e_sintatico():
+    assert Ogum.obter_metadados("C:\\Dados\\relatorio.final.pdf") == {
+        "nome": "relatorio.final", "extensao": ".pdf", "diretorio_pai": "C:\\Dados"
+    }
+
+
+def test_validar_lote_preserva_a_ordem(arvore):
+    nomes = ["cheio.txt", "nada", "pasta", "vazio.txt", "pasta_vazia"] * 50
+    caminhos = [str(arvore / nome) for nome in nomes]
+    resultados = list(Ogum.validar_lote(caminhos, workers=4))
+    assert [r["caminho"] for r in resultados] == caminhos
+    assert [r["mensagem"].codigo for r in resultados[:5]] == [
+        "caminho_valido", "caminho_nao_encontrado", "caminho_valido",
+        "arquivo_vazio", "diretorio_vazio",
+    ]
+
+
+def test_validar_lote_fora_de_ordem_entrega_todos(arvore):
+    caminhos = [str(arvore / "cheio.txt"), str(arvore / "nada")] * 100
+    resultados = list(Ogum.validar_lote(iter(caminhos), workers=3, ordenado=False))
+    assert sorted(r["caminho"] for r in resultados) == sorted(caminhos)
+
+
+def test_validar_lote_consome_a_entrada_sob_demanda(arvore):
+    lidos = []
+
+    def gerar():
+        for indice in range(10_000):
+            lidos.append(indice)
+            yield str(arvore / "cheio.txt")
+
+    resultados = Ogum.validar_lote(gerar(), workers=2)
+    next(resultados)
+    assert len(lidos) <= 2 * 4 + 1
+    resultados.close()
+
+
+def test_validar_lote_tempo_esgotado(arvore, monkeypatch):
+    liberar = threading.Event()
+    original = Ogum.validar
+
+    def lento(caminho):
+        if caminho.endswith("lento"):
+            liberar.wait(5)
+        return original(caminho)
+
+    monkeypatch.setattr(Ogum, "validar", staticmethod(lento))
+    try:
+        resultados = list(Ogum.validar_lote(
+            [str(arvore / "lento"), str(arvore / "cheio.txt")], workers=2, timeout=0.1
+        ))
+    finally:
+        liberar.set()
+    assert resultados[0]["mensagem"].codigo == "tempo_esgotado"
+    assert resultados[0]["valido"] is False
+    assert resultados[1]["valido"] is True
+
+
+def test_validar_lote_rejeita_workers_invalido():
+    with pytest.raises(ValueError):
+        list(Ogum.validar_lote(["/"], workers=0))
+
+
+def test_validar_async(arvore):
+    resultado = asyncio.run(Ogum.validar_async(str(arvore / "vazio.txt")))
+    assert resultado["mensagem"].codigo == "arquivo_vazio"
+
+
+def test_validar_async_iter_respeita_a_concorrencia(arvore, monkeypatch):
+    ativos = []
+    maximo = []
+    trava = threading.Lock()
+    original = Ogum.validar
+
+    def medir(caminho):
+        with trava:
+            ativos.append(caminho)
+            maximo.append(len(ativos))
+        try:
+            return original(caminho)
+        finally:
+            with trava:
+                ativos.remove(caminho)
+
+    monkeypatch.setattr(Ogum, "validar", staticmethod(medir))
+    caminhos = [str(arvore / "cheio.txt"), str(arvore / "pasta")] * 40
+
+    async def coletar():
+        return [r async for r in Ogum.validar_async_iter(caminhos, concorrencia=3)]
+
+    resultados = asyncio.run(coletar())
+    assert sorted(r["caminho"] for r in resultados) == sorted(caminhos)
+    assert max(maximo) <= 3
+
+
+def test_validar_async_iter_interrompido_cancela_pendentes(arvore):
+    async def primeiro():
+        iterador = Ogum.validar_async_iter([str(arvore / "cheio.txt")] * 100, concorrencia=4)
+        async for resultado in iterador:
+            await iterador.aclose()
+            return resultado
+        return None
+
+    assert asyncio.run(primeiro())["valido"] is True
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""Testes do Iroko (uso de disco por diretório)."""
+
+import os
+
+import pytest
+
+from app.utils.app_uso_disco import Iroko
+
+
+@pytest.fixture
+def arvore(tmp_path):
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "c").mkdir()
+    (tmp_path / "vazia").mkdir()
+    (tmp_path / "a" / "f1").write_bytes(b"1" * 100)
+    (tmp_path / "a" / "b" / "f2").write_bytes(b"2" * 300)
+    (tmp_path / "c" / "f3").write_bytes(b"3" * 50)
+    (tmp_path / "raiz.txt").write_bytes(b"r" * 7)
+    return tmp_path
+
+
+def test_totais_de_baixo_para_cima(arvore):
+    uso = Iroko.medir(str(arvore))
+    assert uso.raiz.caminho == str(arvore)
+    assert uso.raiz.bytes == 457
+    assert uso.raiz.arquivos == 4
+    assert uso.raiz.diretorios == 4
+    assert uso.interrompido is False
+
+    filhos = {os.path.basename(item.caminho): item for item in uso.filhos}
+    assert filhos["a"].bytes == 400 and filhos["a"].arquivos == 2
+    assert filhos["a"].diretorios == 1
+    assert filhos["vazia"].bytes == 0
+    assert filhos["raiz.txt"].diretorio is False
+
+
+def test_listas_de_maiores(arvore):
+    uso = Iroko.medir(str(arvore), limite=2)
+    assert [os.path.basename(item.caminho) for item in uso.maiores_arquivos] == ["f2", "f1"]
+    assert [os.path.basename(item.caminho) for item in uso.maiores_diretorios] == ["a", "b"]
+    assert len(uso.filhos) == 2
+
+
+def test_links_fisicos_contados_uma_vez(arvore):
+    os.link(arvore / "a" / "b" / "f2", arvore / "c" / "link_f2")
+    uso = Iroko.medir(str(arvore))
+    assert uso.raiz.bytes == 457
+    assert uso.raiz.arquivos == 4
+    nomes = [os.path.basename(item.caminho) for item in uso.maiores_arquivos]
+    assert nomes.count("f2") + nomes.count("link_f2") == 1
+
+
+def test_raiz_arquivo(arvore):
+    uso = Iroko.medir(str(arvore / "raiz.txt"))
+    assert uso.raiz.bytes == 7
+    assert uso.raiz.diretorio is False
+
+
+def test_cancelado_devolve_parcial(tmp_path):
+    for indice in range(3000):
+        (tmp_path / f"{indice}.txt").touch()
+    uso = Iroko.medir(str(tmp_path), cancelado=lambda: True)
+    assert uso.interrompido is True
+    assert uso.raiz.arquivos < 3000
+
+
+def test_excluir(arvore):
+    uso = Iroko.medir(str(arvore), excluir=["c"])
+    assert uso.raiz.bytes == 407
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""Testes da varredura em fluxo do Oxossi."""
+
+import os
+
+import pytest
+
+from app.utils.app_varredura import Oxossi
+
+
+@pytest.fixture
+def arvore(tmp_path):
+    (tmp_path / "a" / "b" / "c").mkdir(parents=True)
+    (tmp_path / "a" / "b" / "c" / "fundo.txt").write_text("fundo")
+    (tmp_path / "a" / "nota.txt").write_text("nota")
+    (tmp_path / "a" / "imagem.png").write_bytes(b"\x89PNG")
+    (tmp_path / "vazia").mkdir()
+    (tmp_path / "vazio.log").touch()
+    return tmp_path
+
+
+def _relativos(raiz, registros):
+    return {os.path.relpath(r["caminho"], raiz): r for r in registros}
+
+
+def test_entrega_toda_a_arvore_em_pre_ordem(arvore):
+    registros = list(Oxossi.varrer(str(arvore)))
+    assert registros[0]["caminho"] == str(arvore)
+    assert registros[0]["profundidade"] == 0
+    posicoes = {r["caminho"]: indice for indice, r in enumerate(registros)}
+    assert len(posicoes) == len(registros) == 9
+    for caminho, indice in posicoes.items():
+        pai = os.path.dirname(caminho)
+        if pai in posicoes:
+            assert posicoes[pai] < indice
+
+
+def test_campos_do_registro(arvore):
+    registros = _relativos(arvore, Oxossi.varrer(str(arvore)))
+    nota = registros[os.path.join("a", "nota.txt")]
+    estado = os.stat(arvore / "a" / "nota.txt")
+    assert nota["tipo"] == "arquivo" and nota["valido"] and nota["legivel"]
+    assert nota["profundidade"] == 2
+    assert nota["tamanho"] == 4
+    assert nota["mtime_ns"] == estado.st_mtime_ns
+    assert (nota["dispositivo"], nota["inode"]) == (estado.st_dev, estado.st_ino)
+    assert nota["links_fisicos"] == 1
+    assert nota["link"] is False
+    assert nota["mensagem"].codigo == "caminho_valido"
+    assert registros["vazia"]["mensagem"].codigo == "diretorio_vazio"
+    assert registros["vazio.log"]["vazio"] is True
+
+
+@pytest.mark.parametrize(("maxima", "esperado"), [(0, 1), (1, 4), (2, 7), (None, 9)])
+def test_profundidade_maxima(arvore, maxima, esperado):
+    registros = list(Oxossi.varrer(str(arvore), profundidade_maxima=maxima))
+    assert len(registros) == esperado
+    assert all(r["profundidade"] <= (maxima if maxima is not None else 99) for r in registros)
+
+
+def test_incluir_filtra_sem_impedir_a_descida(arvore):
+    registros = _relativos(arvore, Oxossi.varrer(str(arvore), incluir=["*.txt"]))
+    assert set(registros) == {
+        ".", os.path.join("a", "nota.txt"), os.path.join("a", "b", "c", "fundo.txt")
+    }
+
+
+def test_excluir_corta_a_subarvore(arvore):
+    registros = _relativos(arvore, Oxossi.varrer(str(arvore), excluir=["b", "*.png"]))
+    assert set(registros) == {".", "a", os.path.join("a", "nota.txt"), "vazia", "vazio.log"}
+    relativo = _relativos(arvore, Oxossi.varrer(str(arvore), excluir=["a/b/c"]))
+    assert os.path.join("a", "b") in relativo
+    assert os.path.join("a", "b", "c") not in relativo
+
+
+def test_raiz_inexistente(tmp_path):
+    (registro,) = Oxossi.varrer(str(tmp_path / "nada"))
+    assert registro["valido"] is False
+    assert registro["mensagem"].codigo == "caminho_nao_encontrado"
+
+
+@pytest.fixture
+def ciclo(arvore):
+    if not hasattr(os, "symlink"):
+        pytest.skip("sem links simbólicos")
+    os.symlink(arvore, arvore / "a" / "b" / "volta")
+    os.symlink(arvore / "a" / "nota.txt", arvore / "atalho.txt")
+    return arvore
+
+
+def test_links_ignorados_por_padrao(ciclo):
+    registros = _relativos(ciclo, Oxossi.varrer(str(ciclo)))
+    assert "atalho.txt" not in registros
+    assert os.path.join("a", "b", "volta") not in registros
+
+
+def test_links_listados_sem_descer(ciclo):
+    registros = _relativos(ciclo, Oxossi.varrer(str(ciclo), links="listar"))
+    volta = registros[os.path.join("a", "b", "volta")]
+    assert volta["link"] is True and volta["tipo"] == "diretorio"
+    assert registros["atalho.txt"]["tamanho"] == 4
+    assert len(registros) == 11
+
+
+def test_links_seguidos_nao_entram_em_ciclo(ciclo):
+    registros = list(Oxossi.varrer(str(ciclo), links="seguir"))
+    assert len(registros) == 11
+    volta = [r for r in registros if r["caminho"].endswith("volta")]
+    assert len(volta) == 1 and volta[0]["link"] is True
+
+
+def test_links_seguidos_descem_em_diretorios(tmp_path):
+    if not hasattr(os, "symlink"):
+        pytest.skip("sem links simbólicos")
+    (tmp_path / "real").mkdir()
+    (tmp_path / "real" / "dentro.txt").write_text("x")
+    (tmp_path / "varrida").mkdir()
+    os.symlink(tmp_path / "real", tmp_path / "varrida" / "atalho")
+    caminhos = {r["caminho"] for r in Oxossi.varrer(str(tmp_path / "varrida"), links="seguir")}
+    assert str(tmp_path / "varrida" / "atalho" / "dentro.txt") in caminhos
+
+
+def test_link_quebrado(tmp_path):
+    if not hasattr(os, "symlink"):
+        pytest.skip("sem links simbólicos")
+    os.symlink(tmp_path / "sumiu", tmp_path / "quebrado")
+    registros = _relativos(tmp_path, Oxossi.varrer(str(tmp_path), links="listar"))
+    assert registros["quebrado"]["valido"] is False
+    assert registros["quebrado"]["link"] is True
+
+
+def test_interromper_fecha_os_iteradores(arvore):
+    registros = Oxossi.varrer(str(arvore))
+    next(registros)
+    next(registros)
+    registros.close()
+    assert list(registros) == []
+
+
+def test_agregar_totais(arvore):
+    estatisticas = Oxossi.agregar(str(arvore))
+    assert estatisticas.entradas == 9
+    assert estatisticas.por_tipo == {"diretorio": 5, "arquivo": 4}
+    assert estatisticas.arquivos_vazios == 1
+    assert estatisticas.diretorios_vazios == 1
+    assert estatisticas.bytes_total == 13
+    assert estatisticas.bytes_por_extensao == {".txt": 9, ".png": 4, ".log": 0}
+
+
+@pytest.fixture
+def arvore_larga(tmp_path):
+    for pasta in range(6):
+        for sub in range(5):
+            destino = tmp_path / f"p{pasta}" / f"s{sub}"
+            destino.mkdir(parents=True)
+            for indice in range(8):
+                (destino / f"{indice}.dat").write_bytes(b"x" * indice)
+    (tmp_path / "solto.txt").write_text("abc")
+    return tmp_path
+
+
+@pytest.mark.parametrize("orcamento", [3, 5000])
+def test_varrer_paralelo_igual_ao_sequencial(arvore_larga, orcamento):
+    paralelo = Oxossi.varrer_paralelo(str(arvore_larga), processos=2, orcamento=orcamento)
+    assert paralelo.to_dict() == Oxossi.agregar(str(arvore_larga)).to_dict()
+
+
+def test_varrer_paralelo_com_limites(arvore_larga):
+    opcoes = {"profundidade_maxima": 2, "excluir": ["p0", "*.txt"]}
+    paralelo = Oxossi.varrer_paralelo(str(arvore_larga), processos=2, orcamento=4, **opcoes)
+    assert paralelo.to_dict() == Oxossi.agregar(str(arvore_larga), **opcoes).to_dict()
+    assert paralelo.entradas == 1 + 5 + 25
+
+
+def test_varrer_paralelo_raiz_arquivo(arvore_larga):
+    estatisticas = Oxossi.varrer_paralelo(str(arvore_larga / "solto.txt"), processos=1)
+    assert estatisticas.entradas == 1
+    assert estatisticas.bytes_total == 3
+
+
+def test_varrer_paralelo_nao_segue_links(tmp_path):
+    with pytest.raises(ValueError):
+        Oxossi.varrer_paralelo(str(tmp_path), links="seguir")